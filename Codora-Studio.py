@@ -1,10 +1,32 @@
 import sys
+import time
+# Origine de la chronologie du démarrage : avant le chargement de Qt
+STARTUP_STARTED = time.perf_counter()
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 import subprocess
 import platform
 import os
+import re
+import io
+import json
+import importlib.util
+import codecs
+import threading
+import ast
+import bisect
+import collections
+import itertools
+import operator
+import concurrent.futures
+import hashlib
+import tempfile
+import shutil
+import mmap
+import zlib
+import heapq
+from array import array
 
 
 class XMLHighlighter(QSyntaxHighlighter):
@@ -57,445 +79,3555 @@ class XMLHighlighter(QSyntaxHighlighter):
         self.setCurrentBlockState(0)
 
 
-# ----------------------------------------------------------------------------------------------------------------------------Classe Zone de numéros de ligne
-class LineNumberArea(QWidget):
+# ----------------------------------------------------------------------------------------------------------------------------Grammaires par langage
+PYTHON_KEYWORDS = [
+    "and", "as", "assert", "break", "class", "continue", "def", "del", "elif", "else", "except",
+    "finally", "for", "from", "global", "if", "import", "in", "is", "lambda", "nonlocal", "not",
+    "or", "pass", "print", "raise", "return", "try", "while", "with", "yield"
+]
+
+DOUBLE_QUOTED = r'"(?:[^"\\]|\\.)*"'
+SINGLE_QUOTED = r"'(?:[^'\\]|\\.)*'"
+
+# Règles d'une ligne : (style, motif). Blocs multi-lignes : (style, motif d'ouverture, motif de fermeture)
+GRAMMAR_DEFINITIONS = {
+    "python": {
+        "blocks": [
+            ("string", '"""', '"""'),
+            ("string", "'''", "'''"),
+        ],
+        "rules": [
+            ("comment", "#.*"),
+            ("string", DOUBLE_QUOTED + "|" + SINGLE_QUOTED),
+            ("keyword", "\\b(?:" + "|".join(PYTHON_KEYWORDS) + ")\\b"),
+            ("number", r"\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b"),
+            ("operator", r"[=+\-*/%<>]"),
+            ("others", r"[(){}\[\]\\]"),
+        ],
+    },
+    "html": {
+        "blocks": [
+            ("comment", "<!--", "-->"),
+        ],
+        "rules": [
+            ("keyword", r"</?[A-Za-z][\w:-]*|/?>"),
+            ("number", r"\b[A-Za-z_:][\w:.-]*(?=\s*=)"),
+            ("string", r'"[^"]*"' + "|" + r"'[^']*'"),
+            ("operator", r"&#?\w+;"),
+        ],
+    },
+    "css": {
+        "blocks": [
+            ("comment", r"/\*", r"\*/"),
+        ],
+        "rules": [
+            ("string", DOUBLE_QUOTED + "|" + SINGLE_QUOTED),
+            ("keyword", r"@[\w-]+|!important"),
+            ("operator", r"#[0-9a-fA-F]{3,8}\b"),
+            ("number", r"-?\b\d+(?:\.\d+)?(?:%|[a-zA-Z]+)?"),
+            ("attribute", r"[\w-]+(?=\s*:[^{]*;)"),
+            ("others", r"[{}()\[\]]"),
+        ],
+    },
+    "json": {
+        "blocks": [],
+        "rules": [
+            ("keyword", DOUBLE_QUOTED + r"(?=\s*:)"),
+            ("string", DOUBLE_QUOTED),
+            ("number", r"-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b"),
+            ("operator", r"\b(?:true|false|null)\b"),
+            ("others", r"[{}\[\]]"),
+        ],
+    },
+}
+
+# Extensions connues de get_file_icon, None pour le texte brut
+GRAMMAR_EXTENSIONS = {
+    ".py": "python",
+    ".html": "html",
+    ".css": "css",
+    ".json": "json",
+    ".txt": None,
+}
+
+SYNTAX_COLORS = {
+    "keyword": "#c65c2c",  # Orange
+    "comment": "#a0a0a4",  # Grey
+    "string": "#4ea467",  # Green
+    "number": "#2fc4d8",  # Cyan
+    "operator": "#b200b2",  # Magenta
+    "others": "yellow",  # Yellow
+    "attribute": "#8fb2e0",  # Light blue
+}
+
+# Grammaires compilées, partagées par tous les onglets
+compiled_grammars = {}
+
+# Au-delà de ce nombre de lignes, la coloration se fait par tranches en commençant par la zone visible
+BACKGROUND_HIGHLIGHT_BLOCKS = 5000
+BACKGROUND_HIGHLIGHT_SLICE = 0.008
+
+# Au-delà de cette taille, le fichier est ouvert en lecture seule et projeté en mémoire (CODORA_LARGE_FILE_MB)
+LARGE_FILE_THRESHOLD = int(os.environ.get("CODORA_LARGE_FILE_MB", "32")) * 1024 * 1024
+# Un point de repère tous les LINE_INDEX_STRIDE lignes : l'index reste petit même pour des millions de lignes
+LINE_INDEX_STRIDE = 256
+LINE_INDEX_CHUNK = 16 * 1024 * 1024
+LARGE_FILE_MAX_LINE = 4096
+
+# Chargement des fichiers par morceaux, sur un thread dédié
+FILE_LOAD_CHUNK = 128 * 1024
+BACKGROUND_HIGHLIGHT_BYTES = 256 * 1024
+
+# Recherche dans le projet
+IGNORED_DIRECTORIES = {
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv", "env",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".idea", ".vscode",
+}
+PROJECT_SEARCH_MMAP_SIZE = 1024 * 1024
+PROJECT_SEARCH_MAX_FILE = 64 * 1024 * 1024
+PROJECT_SEARCH_MAX_RESULTS = 10000
+PROJECT_SEARCH_BATCH = 32
+FILE_INDEX_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "codora-studio")
+FILE_INDEX_MAX_WATCHED = 4096
+SESSION_FILE = os.environ.get("CODORA_SESSION_FILE", os.path.join(FILE_INDEX_CACHE_DIRECTORY, "session.json"))
+SESSION_SAVE_DELAY = 1000
+QUICK_OPEN_RESULTS = 50
+QUICK_OPEN_BUDGET = 0.008
+COMMAND_COMPLETIONS = 12
+SYMBOL_INDEX_BATCH = 32
+SYMBOL_PARSE_DELAY = 400
+DIAGNOSTICS_DELAY = 600
+# Outils JSON : lecture par morceaux, structure dépliée page par page
+JSON_READ_CHUNK = 1024 * 1024
+JSON_FLUSH_TOKENS = 8192
+JSON_TREE_PAGE = 500
+JSON_SKIP_BUDGET = 4 * 1024 * 1024
+JSON_PREVIEW_LENGTH = 80
+# Aperçu HTML : page analysée hors du fil de l'interface après une pause de frappe
+PREVIEW_DELAY = 500
+PREVIEW_EXTENSIONS = (".html", ".htm", ".css")
+QUICK_OPEN_CHARACTERS = "etaoinsrlcdpumhgfybvwkxjqz_.-/0123456789"
+PROJECT_TREE_MAX_ENTRIES = 2000
+# Extension, titre des menus et filtre des dialogues pour les types de fichiers proposés
+FILE_TYPES = [
+    ("txt", "Text file (*.txt)", "Text File (*.txt)"),
+    ("py", "Python file(*.py)", "Python File (*.py)"),
+    ("html", "HTML file (*.html)", "HTML File (*.html)"),
+    ("css", "CSS file (*.css)", "CSS File (*.css)"),
+    ("json", "JSON file (*.json)", "JSON File (*.json)"),
+]
+RUN_OUTPUT_MAX_LINES = 10000
+RUN_OUTPUT_FLUSH_LINES = 2000
+# Interpréteurs démarrés d'avance et modules qu'ils préchargent (CODORA_WARM_WORKERS, CODORA_WARM_MODULES)
+WARM_WORKERS = int(os.environ.get("CODORA_WARM_WORKERS", "1"))
+WARM_MODULES = [name for name in os.environ.get("CODORA_WARM_MODULES", "numpy,pandas").split(",") if name]
+WARM_READY_MARKER = b"\0codora-ready"
+WARM_WORKER_SOURCE = r"""
+import importlib, json, linecache, os, sys, traceback, types
+
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass
+
+sys.stdout.write("\0codora-ready\n")
+sys.stdout.flush()
+
+request = json.loads(sys.stdin.readline())
+os.chdir(request["cwd"])
+sys.argv = [request["filename"]]
+sys.path[0] = request["cwd"]
+# Les traces d'erreur montrent le tampon exécuté, même non enregistré
+linecache.cache[request["filename"]] = (len(request["source"]), None, request["source"].splitlines(True), request["filename"])
+
+module = types.ModuleType("__main__")
+module.__file__ = request["filename"]
+module.__builtins__ = __builtins__
+sys.modules["__main__"] = module
+
+try:
+    exec(compile(request["source"], request["filename"], "exec"), module.__dict__)
+except SystemExit:
+    raise
+except BaseException as error:
+    traceback.print_exception(type(error), error, error.__traceback__.tb_next)
+    sys.exit(1)
+"""
+
+
+# --------------------------------------------------------------Format associé à un style
+def syntax_format(style):
+    format = QTextCharFormat()
+    format.setForeground(QColor(SYNTAX_COLORS[style]))
+    if style == "keyword":
+        format.setFontWeight(QFont.Bold)
+    return format
+
+
+# --------------------------------------------------------------Obtenir la grammaire compilée d'un fichier
+def get_grammar(file_path=None):
+    if file_path:
+        ext = os.path.splitext(file_path)[1].lower()
+        language = GRAMMAR_EXTENSIONS.get(ext)
+    else:
+        language = "python"
+
+    if language is None:
+        return None
+
+    if language not in compiled_grammars:
+        compiled_grammars[language] = LanguageGrammar(language, GRAMMAR_DEFINITIONS[language])
+    return compiled_grammars[language]
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Grammaire compilée
+class LanguageGrammar:
+    def __init__(self, name, definition):
+        self.name = name
+
+        # Les ouvertures de blocs passent en premier : le groupe n°i correspond à l'état de bloc i
+        self.blockCount = len(definition["blocks"])
+        self.blockEnds = [None]
+        self.formats = [None]
+        groups = []
+
+        for style, opening, closing in definition["blocks"]:
+            format = syntax_format(style)
+            closing_expression = QRegularExpression(closing)
+            closing_expression.optimize()
+            self.blockEnds.append((closing_expression, format))
+            self.formats.append(format)
+            groups.append(f"({opening})")
+
+        for style, rule in definition["rules"]:
+            self.formats.append(syntax_format(style))
+            groups.append(f"({rule})")
+
+        self.expression = QRegularExpression("|".join(groups))
+        self.expression.optimize()
+
+    # --------------------------------------------------------------Découper une ligne en une passe, en tenant compte de l'état de bloc
+    def tokenize(self, text, state):
+        spans = []
+        position = 0
+
+        if state > 0:
+            closing_expression, format = self.blockEnds[state]
+            closing = closing_expression.match(text)
+            if not closing.hasMatch():
+                return [(0, len(text), format)], state
+            position = closing.capturedEnd()
+            spans.append((0, position, format))
+
+        formats = self.formats
+        iterator = self.expression.globalMatch(text, position)
+        while iterator.hasNext():
+            match = iterator.next()
+            start = match.capturedStart()
+
+            # Correspondance chevauchant un bloc refermé sur cette ligne : on reprend après le bloc
+            if start < position:
+                if match.capturedEnd() > position:
+                    iterator = self.expression.globalMatch(text, position)
+                continue
+
+            # Les sous-groupes étant non capturants, le dernier groupe capturé désigne la règle reconnue
+            index = match.lastCapturedIndex()
+            if index <= self.blockCount:
+                closing_expression, format = self.blockEnds[index]
+                closing = closing_expression.match(text, match.capturedEnd())
+                if not closing.hasMatch():
+                    spans.append((start, len(text) - start, format))
+                    return spans, index
+                position = closing.capturedEnd()
+                spans.append((start, position - start, format))
+            else:
+                spans.append((start, match.capturedLength(), formats[index]))
+
+        return spans, 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Coloration en une seule passe
+class SinglePassHighlighter(QSyntaxHighlighter):
+    def __init__(self, parent=None, grammar=None):
+        super(SinglePassHighlighter, self).__init__(parent)
+        self.grammar = grammar or get_grammar()
+
+    # Qt ne recolore la ligne suivante que si l'état de fin de ligne change
+    def highlightBlock(self, text):
+        spans, state = self.grammar.tokenize(text, max(self.previousBlockState(), 0))
+        for start, length, format in spans:
+            self.setFormat(start, length, format)
+        self.setCurrentBlockState(state)
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Coloration progressive en arrière-plan
+class BackgroundHighlighter(QObject):
+    def __init__(self, editor, grammar):
+        super().__init__(editor)
+        self.editor = editor
+        self.document = editor.document()
+        self.grammar = grammar
+
+        # Les blocs avant frontier sont colorés dans l'ordre, avec le bon état de bloc
+        self.frontier = 0
+        # Après une modification : reprise possible jusqu'à resume dès que l'état converge au-delà de converge_after
+        self.resume = 0
+        self.converge_after = 0
+        self.priority = []
+        self.block_count = self.document.blockCount()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.process_slice)
+
+        self.document.contentsChange.connect(self.on_contents_change)
+        self.editor.verticalScrollBar().valueChanged.connect(self.schedule_viewport)
+
+        self.schedule_viewport()
+        self.highlight_visible_blocks()
+
+    # --------------------------------------------------------------Détacher du document (même interface que QSyntaxHighlighter)
+    def setDocument(self, document):
+        if document is None:
+            self.timer.stop()
+            self.document.contentsChange.disconnect(self.on_contents_change)
+            self.editor.verticalScrollBar().valueChanged.disconnect(self.schedule_viewport)
+
+    # --------------------------------------------------------------Colorer un bloc à partir de l'état du bloc précédent
+    def highlight_block(self, block):
+        previous = block.previous()
+        state = max(previous.userState(), 0) if previous.isValid() else 0
+        spans, end_state = self.grammar.tokenize(block.text(), state)
+
+        ranges = []
+        for start, length, format in spans:
+            format_range = QTextLayout.FormatRange()
+            format_range.start = start
+            format_range.length = length
+            format_range.format = format
+            ranges.append(format_range)
+        block.layout().setFormats(ranges)
+
+        changed = block.userState() != end_state
+        block.setUserState(end_state)
+        if changed and self.resume:
+            self.converge_after = max(self.converge_after, block.blockNumber() + 1)
+        return changed
+
+    # --------------------------------------------------------------Blocs visibles à l'écran
+    def visible_block_range(self):
+        first = self.editor.firstVisibleBlock().blockNumber()
+        last = self.editor.cursorForPosition(QPoint(0, self.editor.viewport().height())).blockNumber()
+        return first, max(first, last)
+
+    # --------------------------------------------------------------Prioriser les blocs visibles
+    def schedule_viewport(self):
+        first, last = self.visible_block_range()
+        self.schedule_blocks(first, last)
+
+    def schedule_blocks(self, first, last):
+        first = max(first, self.frontier)
+        # Dépilés par la fin : on empile à l'envers pour colorer de haut en bas
+        self.priority.extend(range(last, first - 1, -1))
+        self.timer.start()
+
+    # --------------------------------------------------------------Colorer tout de suite ce qui est à l'écran
+    def highlight_visible_blocks(self):
+        first, last = self.visible_block_range()
+        block = self.document.findBlockByNumber(first)
+        start = block.position()
+        while block.isValid() and block.blockNumber() <= last:
+            self.highlight_block(block)
+            block = block.next()
+        self.document.markContentsDirty(start, block.position() - start if block.isValid() else self.document.characterCount() - start)
+
+    # --------------------------------------------------------------Suivre les modifications du texte
+    def on_contents_change(self, position, removed, added):
+        count = self.document.blockCount()
+        delta = count - self.block_count
+        self.block_count = count
+
+        first = self.document.findBlock(position).blockNumber()
+        last = self.document.findBlock(position + added).blockNumber()
+        if last < 0:
+            last = count - 1
+
+        if first < self.frontier:
+            if self.resume:
+                self.resume = self.resume + delta if self.resume > first else self.resume
+            else:
+                self.resume = self.frontier + delta
+            self.converge_after = max(last, self.converge_after + delta if self.converge_after > first else 0)
+            self.frontier = first
+
+        # Les blocs autour du curseur sont recolorés immédiatement, le reste suit en arrière-plan
+        cursor_block = self.editor.textCursor().blockNumber()
+        if first <= cursor_block <= last + 1:
+            block = self.document.findBlockByNumber(first)
+            start = block.position()
+            while block.isValid() and block.blockNumber() <= min(last, first + 64):
+                self.highlight_block(block)
+                block = block.next()
+            end = block.position() if block.isValid() else self.document.characterCount()
+            self.document.markContentsDirty(start, end - start)
+
+        self.schedule_blocks(max(cursor_block - 50, 0), cursor_block + 50)
+        self.schedule_viewport()
+
+    # --------------------------------------------------------------Traiter une tranche de travail sans bloquer l'interface
+    def process_slice(self):
+        deadline = time.perf_counter() + BACKGROUND_HIGHLIGHT_SLICE
+        dirty_start = None
+        dirty_end = 0
+
+        while self.priority and time.perf_counter() < deadline:
+            number = self.priority.pop()
+            if number < self.frontier:
+                continue
+            block = self.document.findBlockByNumber(number)
+            if block.isValid():
+                self.highlight_block(block)
+                self.document.markContentsDirty(block.position(), block.length())
+
+        block = self.document.findBlockByNumber(self.frontier)
+        if block.isValid():
+            dirty_start = block.position()
+
+        processed = 0
+        while block.isValid():
+            changed = self.highlight_block(block)
+            number = block.blockNumber()
+            block = block.next()
+            self.frontier = number + 1
+
+            if self.resume and number >= self.converge_after and not changed:
+                # L'état a convergé : la suite était déjà colorée correctement
+                if self.resume > self.frontier:
+                    dirty_end = block.position() if block.isValid() else self.document.characterCount()
+                    self.frontier = self.resume
+                    block = self.document.findBlockByNumber(self.frontier)
+                self.resume = 0
+                self.converge_after = 0
+                break
+
+            processed += 1
+            if processed % 64 == 0 and time.perf_counter() >= deadline:
+                break
+
+        if dirty_start is not None:
+            if not dirty_end:
+                dirty_end = block.position() if block.isValid() else self.document.characterCount()
+            self.document.markContentsDirty(dirty_start, dirty_end - dirty_start)
+
+        if not self.priority and self.frontier >= self.document.blockCount():
+            self.resume = 0
+            self.converge_after = 0
+            self.timer.stop()
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Statistiques de document
+class DocumentStats(QObject):
+    def __init__(self, document):
+        super().__init__(document)
+        self.document = document
+        self.block_count = document.blockCount()
+
+        # Nombre de mots par ligne, tenu à jour à partir des modifications
+        self.block_words = []
+        block = document.begin()
+        while block.isValid():
+            self.block_words.append(len(block.text().split()))
+            block = block.next()
+        self.words = sum(self.block_words)
+
+        document.contentsChange.connect(self.on_contents_change)
+
+    # --------------------------------------------------------------Compteurs en temps constant
+    def characters(self):
+        return self.document.characterCount() - 1
+
+    def lines(self):
+        return self.document.blockCount()
+
+    # --------------------------------------------------------------Ne recompter que les lignes touchées
+    def on_contents_change(self, position, removed, added):
+        count = self.document.blockCount()
+        delta = count - self.block_count
+        self.block_count = count
+
+        first_block = self.document.findBlock(position)
+        first = first_block.blockNumber()
+        last = self.document.findBlock(position + added).blockNumber()
+        if first < 0:
+            first_block = self.document.lastBlock()
+            first = count - 1
+        if last < 0:
+            last = count - 1
+
+        counts = []
+        block = first_block
+        while block.isValid() and block.blockNumber() <= last:
+            counts.append(len(block.text().split()))
+            block = block.next()
+
+        old_last = last - delta
+        self.words += sum(counts) - sum(self.block_words[first:old_last + 1])
+        self.block_words[first:old_last + 1] = counts
+
+
+# --------------------------------------------------------------Superposer des ExtraSelections par couche (recherche, diagnostics, ...)
+def set_selection_layer(editor, layer, selections):
+    layers = getattr(editor, "selection_layers", None)
+    if layers is None:
+        layers = editor.selection_layers = {}
+    layers[layer] = selections
+    editor.setExtraSelections([selection for name in sorted(layers) for selection in layers[name]])
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Moteur de recherche non destructif
+class SearchEngine(QObject):
+    index_changed = pyqtSignal()
+
     def __init__(self, editor):
         super().__init__(editor)
-        # --------------------------------------------------------------Éditeur
         self.editor = editor
-        self.setFixedWidth(40)
+        self.document = editor.document()
+        self.expression = None
+        self.key = None
+
+        # Index des correspondances, trié par position
+        self.starts = []
+        self.lengths = []
+        self.scanned_to = 0
+        self.current = -1
+        self.painted = None
+
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setInterval(0)
+        self.scan_timer.timeout.connect(self.scan_slice)
+
+        self.paint_timer = QTimer(self)
+        self.paint_timer.setSingleShot(True)
+        self.paint_timer.setInterval(0)
+        self.paint_timer.timeout.connect(self.paint_visible_matches)
+
+        self.match_format = QTextCharFormat()
+        self.match_format.setBackground(QColor("yellow"))
+        self.match_format.setForeground(QColor("black"))
+        self.current_format = QTextCharFormat()
+        self.current_format.setBackground(QColor("#ff9632"))
+        self.current_format.setForeground(QColor("black"))
+
+        self.document.contentsChange.connect(self.on_contents_change)
+        self.editor.updateRequest.connect(lambda rect, dy: self.paint_timer.start())
+
+    # --------------------------------------------------------------Nouvelle recherche
+    def set_pattern(self, text, regex=False, case_sensitive=False, whole_word=False):
+        key = (text, regex, case_sensitive, whole_word)
+        if key == self.key:
+            return True
+        self.key = key
+
+        self.starts = []
+        self.lengths = []
+        self.scanned_to = 0
+        self.current = -1
+        self.expression = None
+
+        # Recherche littérale : un test de sous-chaîne écarte vite les lignes sans correspondance
+        self.literal = None if regex else (text if case_sensitive else text.lower())
+        self.case_sensitive = case_sensitive
+
+        if text:
+            pattern = text if regex else QRegularExpression.escape(text)
+            if whole_word:
+                pattern = f"\\b(?:{pattern})\\b"
+            options = QRegularExpression.NoPatternOption if case_sensitive else QRegularExpression.CaseInsensitiveOption
+            expression = QRegularExpression(pattern, options)
+            if not expression.isValid():
+                self.refresh()
+                return False
+            expression.optimize()
+            self.expression = expression
+            self.scan_timer.start()
+
+        self.refresh()
+        return True
+
+    def clear(self):
+        self.set_pattern("")
+
+    def complete(self):
+        return self.expression is None or self.scanned_to >= self.document.characterCount()
+
+    # --------------------------------------------------------------Chercher dans un bloc
+    def scan_block(self, block, starts, lengths):
+        text = block.text()
+        if self.literal is not None and self.literal not in (text if self.case_sensitive else text.lower()):
+            return
 
-        editor.setContextMenuPolicy(Qt.CustomContextMenu)
-        editor.customContextMenuRequested.connect(lambda pos, e=editor: self.show_custom_context_menu(pos, e))
+        position = block.position()
+        iterator = self.expression.globalMatch(text)
+        while iterator.hasNext():
+            match = iterator.next()
+            if match.capturedLength() > 0:
+                starts.append(position + match.capturedStart())
+                lengths.append(match.capturedLength())
+
+    # --------------------------------------------------------------Construire l'index par tranches
+    def scan_slice(self):
+        if self.expression is None:
+            self.scan_timer.stop()
+            return
 
-    # --------------------------------------------------------------Mécanique d'écriture des nombres
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setPen(QColor(160, 160, 160))
+        deadline = time.perf_counter() + BACKGROUND_HIGHLIGHT_SLICE
+        block = self.document.findBlock(self.scanned_to)
+        processed = 0
+        while block.isValid():
+            self.scan_block(block, self.starts, self.lengths)
+            block = block.next()
+            processed += 1
+            if processed % 256 == 0 and time.perf_counter() >= deadline:
+                break
 
-        block = self.editor.firstVisibleBlock()
-        block_number = block.blockNumber() + 1
+        self.scanned_to = block.position() if block.isValid() else self.document.characterCount()
+        if self.complete():
+            self.scan_timer.stop()
+        self.refresh()
+
+    # --------------------------------------------------------------Mettre l'index à jour après une modification
+    def on_contents_change(self, position, removed, added):
+        if self.expression is None:
+            return
 
-        line_height = self.editor.fontMetrics().height()
-        top = self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset()).top()
+        first_block = self.document.findBlock(position)
+        last_block = self.document.findBlock(position + added)
+        if not first_block.isValid():
+            first_block = self.document.lastBlock()
+        if not last_block.isValid():
+            last_block = self.document.lastBlock()
+
+        start = first_block.position()
+        if start >= self.scanned_to:
+            return
 
-        while block.isValid() and top < self.editor.height():
-            painter.drawText(0, int(top) + line_height // 2 + 7, str(block_number))
+        delta = added - removed
+        new_end = last_block.position() + last_block.length()
+        old_end = new_end - delta
 
+        low = bisect.bisect_left(self.starts, start)
+        high = bisect.bisect_left(self.starts, old_end)
+
+        starts = []
+        lengths = []
+        block = first_block
+        while block.isValid() and block.position() <= last_block.position():
+            self.scan_block(block, starts, lengths)
             block = block.next()
-            top = self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset()).top()
-            block_number += 1
 
-    # --------------------------------------------------------------Mise à jour des numéros de ligne
-    def update(self):
-        self.repaint()
+        shifted = [value + delta for value in self.starts[high:]]
+        self.starts[low:] = starts + shifted
+        self.lengths[low:high] = lengths
+        self.scanned_to = max(self.scanned_to + delta, new_end) if self.scanned_to > old_end else new_end
+        if self.current >= len(self.starts):
+            self.current = -1
+        self.refresh()
+
+    def refresh(self):
+        self.painted = None
+        self.paint_timer.start()
+        self.index_changed.emit()
+
+    # --------------------------------------------------------------Surligner uniquement les correspondances visibles
+    def paint_visible_matches(self):
+        first = self.editor.firstVisibleBlock().position()
+        viewport = self.editor.viewport().rect()
+        last_block = self.editor.cursorForPosition(viewport.bottomRight()).block()
+        last = last_block.position() + last_block.length()
+
+        key = (first, last, len(self.starts), self.current, self.key)
+        if key == self.painted:
+            return
+        self.painted = key
+
+        selections = []
+        low = bisect.bisect_left(self.starts, first)
+        high = bisect.bisect_left(self.starts, last)
+        for index in range(low, high):
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(self.document)
+            selection.cursor.setPosition(self.starts[index])
+            selection.cursor.setPosition(self.starts[index] + self.lengths[index], QTextCursor.KeepAnchor)
+            selection.format = self.current_format if index == self.current else self.match_format
+            selections.append(selection)
+
+        set_selection_layer(self.editor, "search", selections)
+
+    # --------------------------------------------------------------Navigation entre les correspondances
+    def has_match(self, forward=True):
+        cursor = self.editor.textCursor()
+        if forward:
+            return bisect.bisect_left(self.starts, cursor.selectionEnd()) < len(self.starts)
+        return bisect.bisect_left(self.starts, cursor.selectionStart()) > 0
+
+    def select_match(self, forward=True):
+        if not self.starts:
+            return False
+
+        cursor = self.editor.textCursor()
+        if forward:
+            index = bisect.bisect_left(self.starts, cursor.selectionEnd())
+            if index >= len(self.starts):
+                index = 0
+        else:
+            index = bisect.bisect_left(self.starts, cursor.selectionStart()) - 1
+            if index < 0:
+                index = len(self.starts) - 1
+
+        self.current = index
+        cursor.setPosition(self.starts[index])
+        cursor.setPosition(self.starts[index] + self.lengths[index], QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.editor.centerCursor()
+        self.refresh()
+        return True
+
+    def counter_text(self):
+        if self.expression is None:
+            return ""
+        total = f"{len(self.starts)}{'' if self.complete() else '+'}"
+        if self.current >= 0:
+            return f"{self.current + 1}/{total}"
+        return f"{total} results"
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Indexation des lignes en arrière-plan
+class LineIndexer(QThread):
+    indexed = pyqtSignal(list, int)
+
+    def __init__(self, mapping, parent=None):
+        super().__init__(parent)
+        self.mapping = mapping
+
+    def run(self):
+        lines_pattern = re.compile(rb"(?:[^\n]*\n){%d}" % LINE_INDEX_STRIDE)
+        size = len(self.mapping)
+        last_checkpoint = 0
+        scanned = 0
+        released = 0
+
+        while scanned < size and not self.isInterruptionRequested():
+            scanned = min(scanned + LINE_INDEX_CHUNK, size)
+
+            # Recherche ancrée sur le dernier repère : finditer réessaierait à chaque octet d'une très longue ligne
+            checkpoints = []
+            match = lines_pattern.match(self.mapping, last_checkpoint, scanned)
+            while match:
+                checkpoints.append(match.end())
+                match = lines_pattern.match(self.mapping, match.end(), scanned)
+            if checkpoints:
+                last_checkpoint = checkpoints[-1]
+
+            # Lignes restantes après le dernier repère, pour une estimation à jour du nombre de lignes
+            tail = self.mapping[last_checkpoint:scanned].count(b"\n")
+            self.indexed.emit(checkpoints, tail + (1 if scanned == size else 0))
+
+            # Les pages déjà parcourues ne restent pas en mémoire résidente
+            release_end = last_checkpoint - last_checkpoint % mmap.PAGESIZE
+            if hasattr(self.mapping, "madvise") and release_end > released:
+                self.mapping.madvise(mmap.MADV_DONTNEED, released, release_end - released)
+                released = release_end
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Chargement de fichier en arrière-plan
+class FileLoader(QThread):
+    chunk_loaded = pyqtSignal(str)
+    progress = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.total = 0
+        self.read = 0
+        self.cancelled = False
+        self.error = None
+        self.hash = hashlib.blake2b(digest_size=16)
+
+        # Au plus deux morceaux en attente : l'interface peut se redessiner entre deux ajouts
+        self.pending = threading.Semaphore(2)
+
+    def run(self):
+        try:
+            self.total = os.path.getsize(self.file_path)
+            # Même traduction des fins de ligne que open(..., 'r')
+            decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), True)
+
+            with open(self.file_path, "rb") as file:
+                while not self.cancelled:
+                    data = file.read(FILE_LOAD_CHUNK)
+                    text = decoder.decode(data, final=not data)
+                    self.read += len(data)
+                    self.hash.update(encode_for_disk(text))
+
+                    if text:
+                        while not self.pending.acquire(timeout=0.1):
+                            if self.cancelled:
+                                return
+                        self.chunk_loaded.emit(text)
+                    self.progress.emit()
+
+                    if not data:
+                        break
+        except (OSError, UnicodeDecodeError) as e:
+            self.error = str(e)
+            self.failed.emit(self.error)
+
+    # --------------------------------------------------------------Morceau ajouté au document
+    def chunk_consumed(self):
+        self.pending.release()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+# --------------------------------------------------------------Texte tel qu'il est écrit sur le disque
+def encode_for_disk(text):
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+# --------------------------------------------------------------Écriture atomique : fichier temporaire, fsync puis remplacement
+def write_atomic(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    # Les données peuvent aussi arriver par morceaux (générateur), sans être assemblées en mémoire
+    if isinstance(data, bytes):
+        data = [data]
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            for chunk in data:
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    # Le renommage lui-même doit survivre à une coupure
+    if hasattr(os, "O_DIRECTORY"):
+        directory_descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
 
-    # --------------------------------------------------------------Création du menu clic droit custom
-    def show_custom_context_menu(self, position, editor):
-        context_menu = QMenu(editor)
 
-        undo_action = QAction(QIcon("assets/back_white.png"), "Undo", self)
-        undo_action.setEnabled(editor.document().isUndoAvailable())
-        undo_action.triggered.connect(editor.undo)
-        context_menu.addAction(undo_action)
+# ----------------------------------------------------------------------------------------------------------------------------Classe Enregistrement en arrière-plan
+class FileSaver(QThread):
+    saved = pyqtSignal(str, bool)
+    failed = pyqtSignal(str)
 
-        redo_action = QAction(QIcon("assets/forward_white.png"), "Redo", self)
-        redo_action.setEnabled(editor.document().isRedoAvailable())
-        redo_action.triggered.connect(editor.redo)
-        context_menu.addAction(redo_action)
+    def __init__(self, path, text, previous_hash=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.text = text
+        self.previous_hash = previous_hash
+        self.elapsed = 0
 
-        context_menu.addSeparator()
+    def run(self):
+        start = time.perf_counter()
+        try:
+            data = encode_for_disk(self.text)
+            self.text = None
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
 
-        cut_action = QAction(QIcon("assets/cut.png"), "Cut", self)
-        cut_action.setEnabled(editor.textCursor().hasSelection())
-        cut_action.triggered.connect(editor.cut)
-        context_menu.addAction(cut_action)
+            if digest == self.previous_hash and os.path.exists(self.path):
+                self.saved.emit(digest, True)
+                return
 
-        copy_action = QAction(QIcon("assets/copy.png"), "Copy", self)
-        copy_action.setEnabled(editor.textCursor().hasSelection())
-        copy_action.triggered.connect(editor.copy)
-        context_menu.addAction(copy_action)
+            write_atomic(self.path, data)
+            self.elapsed = time.perf_counter() - start
+            self.saved.emit(digest, False)
+        except Exception as e:
+            self.failed.emit(str(e))
 
-        paste_action = QAction(QIcon("assets/paste.png"), "Paste", self)
-        paste_action.setEnabled(bool(QApplication.clipboard().text()))
-        paste_action.triggered.connect(editor.paste)
-        context_menu.addAction(paste_action)
 
-        context_menu.addSeparator()
+# --------------------------------------------------------------Parcourir un projet en ignorant les dossiers inutiles
+def walk_project(root, directories=None, environments=None):
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        if directories is not None:
+            directories.append(directory)
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
 
-        select_all_action = QAction(QIcon("assets/selectall.png"), "Select All", self)
-        select_all_action.triggered.connect(editor.selectAll)
-        context_menu.addAction(select_all_action)
+        subdirectories = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in IGNORED_DIRECTORIES:
+                        continue
+                    # Environnement virtuel sous un autre nom : relevé pour l'arborescence, jamais parcouru
+                    if os.path.exists(os.path.join(entry.path, "pyvenv.cfg")):
+                        if environments is not None:
+                            environments.append(entry.path)
+                        continue
+                    subdirectories.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
+            except OSError:
+                continue
+        stack.extend(reversed(sorted(subdirectories)))
 
-        context_menu.setStyleSheet("""
-            QMenu {
-                background-color: #131e23;
-                color: white;
-                padding-left: 7px;
-            }
-            QMenu::item {
-                padding: 6px 20px;
-                border-radius: 5px;
-            }
-            QMenu::item:selected {
-                background-color: #2e436e;
-            }
-        """)
 
-        context_menu.exec_(editor.mapToGlobal(position))
+# --------------------------------------------------------------Expression de recherche, compilée une fois par processus
+search_expressions = {}
 
 
-# ----------------------------------------------------------------------------------------------------------------------------Classe IDE
-class IDE(QMainWindow):
-    def __init__(self):
-        super().__init__()
+def compile_search(text, regex=False, case_sensitive=False, whole_word=False):
+    key = (text, regex, case_sensitive, whole_word)
+    if key not in search_expressions:
+        pattern = text if regex else re.escape(text)
+        if whole_word:
+            pattern = rf"\b(?:{pattern})\b"
+        flags = 0 if case_sensitive else re.IGNORECASE
+        search_expressions[key] = re.compile(pattern.encode("utf-8"), flags | re.MULTILINE)
+    return search_expressions[key]
 
-        # --------------------------------------------------------------Onglets
-        self.tabs = QTabWidget()
-        self.tabs.setTabsClosable(True)
-        self.tabs.tabCloseRequested.connect(self.close_tab)
-        self.tabs.setMovable(False)
-        self.tabs.currentChanged.connect(self.update_cursor_position)
 
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                background-color: #56585d;
-                border: solid 1px #56585d;
-            }
+# --------------------------------------------------------------Chercher dans un lot de fichiers (exécuté dans un processus de travail)
+def search_files(paths, query, max_results):
+    expression = compile_search(*query)
+    results = []
 
-            QTabBar {
-                background-color: #38393c;
-            }
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+            if size == 0 or size > PROJECT_SEARCH_MAX_FILE:
+                continue
+
+            with open(path, "rb") as file:
+                # Fichier binaire : on l'ignore
+                if b"\0" in file.read(8192):
+                    continue
+                file.seek(0)
+                if size >= PROJECT_SEARCH_MMAP_SIZE:
+                    data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = file.read()
+
+            matches = []
+            line_number = 1
+            counted_to = 0
+            for match in expression.finditer(data):
+                start = match.start()
+                # mmap n'a pas de count : on compte sur la tranche parcourue depuis le dernier résultat
+                line_number += data[counted_to:start].count(b"\n")
+                counted_to = start
+
+                line_start = data.rfind(b"\n", 0, start) + 1
+                line_end = data.find(b"\n", start)
+                if line_end < 0:
+                    line_end = len(data)
+                line = bytes(data[line_start:min(line_end, line_start + 300)]).decode("utf-8", errors="replace")
+                matches.append((line_number, len(data[line_start:start].decode("utf-8", errors="replace")), line.strip()))
+
+                if len(matches) >= max_results:
+                    break
+
+            if isinstance(data, mmap.mmap):
+                data.close()
+            if matches:
+                results.append((path, matches))
+        except (OSError, ValueError):
+            continue
+
+    return results
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Recherche dans le projet
+class ProjectSearch(QThread):
+    results_found = pyqtSignal(list)
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, root, query, pool, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.query = query
+        self.pool = pool
+        self.cancelled = False
+        self.files = 0
+        self.matches = 0
+
+    def run(self):
+        pending = set()
+        batch = []
+        # Petits lots au début pour obtenir les premiers résultats au plus vite
+        batch_size = 4
+        limit = (os.cpu_count() or 2) * 4
+
+        def collect(wait):
+            done, _ = concurrent.futures.wait(pending, timeout=None if wait else 0,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                try:
+                    results = future.result()
+                except concurrent.futures.CancelledError:
+                    continue
+                except Exception as e:
+                    print(f"[ERROR] -- Project search batch failed : {e}")
+                    continue
+                if results and not self.cancelled:
+                    self.matches += sum(len(matches) for _, matches in results)
+                    self.results_found.emit(results)
+            self.progress.emit(self.files, self.matches)
+
+        for path in walk_project(self.root):
+            if self.cancelled or self.matches >= PROJECT_SEARCH_MAX_RESULTS:
+                break
+            batch.append(path)
+            self.files += 1
+
+            if len(batch) >= batch_size:
+                pending.add(self.pool.submit(search_files, batch, self.query, 200))
+                batch = []
+                batch_size = min(batch_size * 2, PROJECT_SEARCH_BATCH)
+                collect(len(pending) >= limit)
+
+        if batch and not self.cancelled:
+            pending.add(self.pool.submit(search_files, batch, self.query, 200))
+
+        while pending and not self.cancelled:
+            collect(True)
+
+        for future in pending:
+            future.cancel()
+        self.progress.emit(self.files, self.matches)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Indexation des fichiers du projet
+class ProjectIndexer(QThread):
+    indexed = pyqtSignal(list, list, bool)
+    environments_found = pyqtSignal(list)
+
+    def __init__(self, root, cache_path, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.cache_path = cache_path
+        self.cancelled = False
+
+    def run(self):
+        # Le cache donne un index immédiatement, le parcours complet le remplace ensuite
+        cached = self.read_cache()
+        if cached is not None:
+            self.indexed.emit(cached, [], False)
+
+        directories = []
+        environments = []
+        files = []
+        for path in walk_project(self.root, directories, environments):
+            if self.cancelled:
+                return
+            files.append(os.path.relpath(path, self.root).replace(os.sep, "/"))
+        directories = [os.path.relpath(directory, self.root).replace(os.sep, "/") for directory in directories]
+        directories = ["" if directory == "." else directory for directory in directories]
+        self.indexed.emit(files, directories, True)
+        self.environments_found.emit(environments)
 
-            QTabBar::tab {
-                background: #38393c;
-                padding: 10px;
-                margin: 2px;
-                border-top-left-radius: 7px;
-                border-top-right-radius: 7px;
-                border-bottom-left-radius: 0px;
-                border-bottom-right-radius: 0px;
-                font-weight: bold;
-                width: 150px;
-                color: #a1a2a4;
-            }
+        if files != cached:
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                write_atomic(self.cache_path, "\n".join([self.root] + files).encode("utf-8"))
+            except OSError as e:
+                print(f"[ERROR] -- Could not write the file index cache : {e}")
 
-            QTabBar::tab:selected {
-                background: #56585d;
-                color: white;
-                margin-bottom: -2px;
-                margin-top: 3px;
-            }
+    def read_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                lines = file.read().split("\n")
+        except (OSError, UnicodeDecodeError):
+            return None
+        if not lines or lines[0] != self.root:
+            return None
+        return lines[1:]
+
+    def cancel(self):
+        self.cancelled = True
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Écriture JSON en arrière-plan
+class JsonWriter(QThread):
+    def __init__(self, path, session, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.session = session
+
+    def run(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_atomic(self.path, json.dumps(self.session, separators=(",", ":")).encode("utf-8"))
+        except OSError as e:
+            print(f"[ERROR] -- Could not write {self.path} : {e}")
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Index des fichiers du projet
+class FileIndex(QObject):
+    changed = pyqtSignal()
+    environments_found = pyqtSignal(list)
+
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        self.root = os.path.abspath(root)
+        self.ready = False
+
+        # Noms de fichiers par dossier relatif, la liste triée est reconstruite à la demande
+        self.files = {}
+        self.dirty = True
+        self.entries = []
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.pending_directories = set()
+        self.change_timer = QTimer(self)
+        self.change_timer.setSingleShot(True)
+        self.change_timer.setInterval(200)
+        self.change_timer.timeout.connect(self.apply_changes)
+
+        # Tables de recherche préparées pendant les temps morts
+        self.warm_timer = QTimer(self)
+        self.warm_timer.setInterval(0)
+        self.warm_timer.timeout.connect(self.warm_slice)
+        self.warm_characters = []
+
+        digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()
+        self.cache_path = os.path.join(FILE_INDEX_CACHE_DIRECTORY, f"{digest}.index")
+        self.indexer = ProjectIndexer(self.root, self.cache_path, self)
+        self.indexer.indexed.connect(self.on_indexed)
+        self.indexer.environments_found.connect(self.environments_found)
+        self.indexer.start()
+
+    # --------------------------------------------------------------Résultat du parcours ou du cache
+    def on_indexed(self, files, directories, complete):
+        self.files = {directory: set() for directory in directories}
+        for path in files:
+            directory, _, name = path.rpartition("/")
+            self.files.setdefault(directory, set()).add(name)
+        self.ready = True
+        self.dirty = True
+        self.warm_timer.start()
+
+        if complete:
+            watched = [self.absolute(directory) for directory in sorted(self.files, key=len)[:FILE_INDEX_MAX_WATCHED]]
+            if self.watcher.directories():
+                self.watcher.removePaths(self.watcher.directories())
+            self.watcher.addPaths(watched)
+        self.changed.emit()
+
+    def absolute(self, directory):
+        if directory in ("", "."):
+            return self.root
+        return os.path.join(self.root, directory)
+
+    def relative(self, path):
+        directory = os.path.relpath(path, self.root).replace(os.sep, "/")
+        return "" if directory == "." else directory
+
+    # --------------------------------------------------------------Modifications sur le disque
+    def on_directory_changed(self, path):
+        self.pending_directories.add(path)
+        self.change_timer.start()
+
+    def apply_changes(self):
+        pending, self.pending_directories = self.pending_directories, set()
+        for path in pending:
+            directory = self.relative(path)
+            try:
+                with os.scandir(path) as entries:
+                    entries = list(entries)
+            except OSError:
+                self.remove_directory(directory)
+                continue
+
+            names = set()
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        names.add(entry.name)
+                    elif entry.is_dir(follow_symlinks=False) and entry.name not in IGNORED_DIRECTORIES:
+                        child = f"{directory}/{entry.name}" if directory else entry.name
+                        if child not in self.files:
+                            self.add_directory(entry.path)
+                except OSError:
+                    continue
+            self.files[directory] = names
+
+            # Les sous-dossiers supprimés ne signalent rien d'eux-mêmes
+            prefix = f"{directory}/" if directory else ""
+            for child in [child for child in self.files if child and child.startswith(prefix) and "/" not in child[len(prefix):]]:
+                if not os.path.isdir(self.absolute(child)):
+                    self.remove_directory(child)
+
+        self.dirty = True
+        self.warm_timer.start()
+        self.changed.emit()
+
+    def add_directory(self, path):
+        directories = []
+        environments = []
+        for file_path in walk_project(path, directories, environments):
+            directory, _, name = self.relative(file_path).rpartition("/")
+            self.files.setdefault(directory, set()).add(name)
+        if environments:
+            self.environments_found.emit(environments)
+        for directory in directories:
+            self.files.setdefault(self.relative(directory), set())
+        room = FILE_INDEX_MAX_WATCHED - len(self.watcher.directories())
+        if room > 0:
+            self.watcher.addPaths(directories[:room])
+
+    def remove_directory(self, directory):
+        prefix = f"{directory}/"
+        for child in [child for child in self.files if child == directory or child.startswith(prefix)]:
+            del self.files[child]
+            if self.absolute(child) in self.watcher.directories():
+                self.watcher.removePath(self.absolute(child))
+
+    # --------------------------------------------------------------Recherche approximative
+    def rebuild(self):
+        # Triés du plus court au plus long : l'ordre de parcours donne déjà le classement
+        self.entries = sorted(f"{directory}/{name}" if directory else name
+                              for directory, names in self.files.items() for name in names)
+        self.entries.sort(key=len)
+        self.lowered_paths = [path.lower() for path in self.entries]
+        self.lowered_names = [path.rpartition("/")[2] for path in self.lowered_paths]
+        self.character_masks = {}
+        self.warm_characters = [(lines, character) for character in QUICK_OPEN_CHARACTERS
+                                for lines in (self.lowered_names, self.lowered_paths)]
+        self.dirty = False
+
+    def warm_slice(self):
+        if self.dirty:
+            self.rebuild()
+            return
+        started = time.perf_counter()
+        while self.warm_characters and time.perf_counter() - started < BACKGROUND_HIGHLIGHT_SLICE:
+            self.character_mask(*self.warm_characters.pop(0))
+        if not self.warm_characters:
+            self.warm_timer.stop()
+
+    def character_mask(self, lines, character):
+        # Un octet par entrée, à 1 si la ligne contient le caractère ; calculé une fois par caractère
+        key = (lines is self.lowered_names, character)
+        mask = self.character_masks.get(key)
+        if mask is None:
+            flags = bytes(map(operator.contains, lines, itertools.repeat(character)))
+            mask = self.character_masks[key] = int.from_bytes(flags, "little")
+        return mask
+
+    def candidates(self, lines, query):
+        mask = None
+        for character in set(query):
+            character_mask = self.character_mask(lines, character)
+            mask = character_mask if mask is None else mask & character_mask
+        if not mask:
+            return ()
+        return itertools.compress(range(len(lines)), mask.to_bytes(len(lines), "little"))
+
+    def match(self, query, limit=QUICK_OPEN_RESULTS):
+        if self.dirty:
+            self.rebuild()
+
+        query = "".join(query.lower().replace("\\", "/").split())
+        if not query:
+            return self.entries[:limit]
+
+        results = []
+        seen = set()
+        fuzzy = re.compile("".join(f"[^{re.escape(char)}]*{re.escape(char)}" for char in query))
+        searches = [self.lowered_names, self.lowered_paths]
+        if "/" in query:
+            searches = searches[1:]
+        # Les masques encore absents sont construits avant le budget, qui ne borne que le parcours des candidats
+        searches = [(lines, self.candidates(lines, query)) for lines in searches]
+        deadline = time.perf_counter() + QUICK_OPEN_BUDGET
+
+        # Le nom passe avant le chemin, et une sous-chaîne exacte avant une correspondance approximative
+        for lines, candidates in searches:
+            exact = []
+            approximate = []
+            # Seules les entrées qui contiennent tous les caractères sont essayées, dans la limite du budget :
+            # les entrées étant triées par longueur, seuls les chemins les plus longs peuvent manquer
+            for tried, index in enumerate(candidates):
+                line = lines[index]
+                if query in line:
+                    exact.append(index)
+                    if len(exact) >= limit:
+                        break
+                elif fuzzy.match(line):
+                    approximate.append(index)
+                if tried & 255 == 255 and time.perf_counter() > deadline:
+                    break
+
+            for index in exact + approximate:
+                if index not in seen:
+                    seen.add(index)
+                    results.append(self.entries[index])
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def close(self):
+        self.warm_timer.stop()
+        self.indexer.cancel()
+        self.indexer.wait()
+
+
+# --------------------------------------------------------------Symboles d'un module Python : (nom, nom qualifié, type, ligne, colonne, profondeur)
+def extract_symbols(tree):
+    symbols = []
+
+    def visit(node, parents):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                kind = "class"
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                kind = "method" if parents and parents[-1][1] == "class" else "function"
+            else:
+                # Les variables ne sont relevées qu'au niveau du module, blocs if/try compris
+                if not parents and isinstance(child, (ast.Assign, ast.AnnAssign)):
+                    targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+                    for target in targets:
+                        if isinstance(target, ast.Name):
+                            symbols.append((target.id, target.id, "variable", target.lineno, target.col_offset, 0))
+                elif isinstance(child, (ast.stmt, ast.excepthandler)):
+                    visit(child, parents)
+                continue
+
+            qualname = ".".join([name for name, _ in parents] + [child.name])
+            symbols.append((child.name, qualname, kind, child.lineno, child.col_offset, len(parents)))
+            visit(child, parents + [(child.name, kind)])
+
+    visit(tree, [])
+    return symbols
+
+
+# --------------------------------------------------------------Analyser un lot de fichiers dans un processus du pool (symboles None : contenu inchangé)
+def parse_symbol_files(entries):
+    results = []
+    for path, previous_hash in entries:
+        try:
+            stat = os.stat(path)
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            results.append((path, None))
+            continue
+
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest == previous_hash:
+            results.append((path, (stat.st_mtime_ns, stat.st_size, digest, None)))
+            continue
+        try:
+            symbols = extract_symbols(ast.parse(data, path))
+        except (SyntaxError, ValueError, RecursionError):
+            symbols = []
+        results.append((path, (stat.st_mtime_ns, stat.st_size, digest, symbols)))
+    return results
+
+
+# --------------------------------------------------------------Analyser le texte d'un éditeur (None si le code ne se compile pas encore)
+def parse_symbol_buffer(text):
+    try:
+        return extract_symbols(ast.parse(text))
+    except (SyntaxError, ValueError, RecursionError):
+        return None
 
-            QTabBar::tab:hover {
-                background: #404145;
-                color: white;
-            }
 
-            QTabBar::close-button {
-                image: url("assets/close_tab.png");
-                subcontrol-position: right;
-                margin-right: 5px;
-            }
+# --------------------------------------------------------------Diagnostics d'un buffer : (ligne, colonne, gravité, message), lignes et colonnes à partir de 0
+def check_buffer(text, kind):
+    if kind == "json":
+        try:
+            json.loads(text)
+        except json.JSONDecodeError as e:
+            return [(e.lineno - 1, e.colno - 1, "error", e.msg)]
+        except RecursionError:
+            return [(0, 0, "error", "Nesting too deep")]
+        return []
+
+    try:
+        # L'arbre est compilé sans être relu : la table des symboles signale aussi 'return' hors fonction, etc.
+        tree = compile(text, "<buffer>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+        compile(tree, "<buffer>", "exec", dont_inherit=True)
+    except SyntaxError as e:
+        return [(max((e.lineno or 1) - 1, 0), max((e.offset or 1) - 1, 0), "error", e.msg)]
+    except (ValueError, RecursionError) as e:
+        return [(0, 0, "error", str(e))]
+
+    # pyflakes est facultatif : sans lui, seules les erreurs de syntaxe sont remontées
+    try:
+        from pyflakes import checker
+    except ImportError:
+        return []
+    warnings = checker.Checker(tree, filename="<buffer>").messages
+    return sorted((message.lineno - 1, getattr(message, "col", 0), "warning", message.message % message.message_args)
+                  for message in warnings)
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Indexation des symboles
+class SymbolIndexer(QThread):
+    parsed = pyqtSignal(object)
+
+    def __init__(self, root, cache_path, pool, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.cache_path = cache_path
+        self.pool = pool
+        self.cancelled = False
+        self.changed = False
+
+    def run(self):
+        # Le cache donne un index immédiatement, seuls les fichiers dont la date ou la taille a bougé sont relus
+        files = self.read_cache()
+        if files:
+            self.parsed.emit(list(files.items()))
+
+        pending = set()
+        batch = []
+
+        def submit():
+            pending.add(self.pool.submit(parse_symbol_files, batch))
+
+        def collect(wait):
+            done, _ = concurrent.futures.wait(pending, timeout=None if wait else 0,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                try:
+                    results = future.result()
+                except Exception:
+                    continue
+                if not self.cancelled:
+                    self.changed = True
+                    self.parsed.emit(results)
+
+        seen = set()
+        for path in walk_project(self.root):
+            if self.cancelled:
+                break
+            if not path.endswith(".py"):
+                continue
+            seen.add(path)
+            cached = files.get(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                continue
+
+            batch.append((path, cached[2] if cached is not None else None))
+            if len(batch) >= SYMBOL_INDEX_BATCH:
+                submit()
+                batch = []
+                collect(len(pending) >= (os.cpu_count() or 2) * 2)
+
+        if batch and not self.cancelled:
+            submit()
+        while pending and not self.cancelled:
+            collect(True)
+        for future in pending:
+            future.cancel()
+
+        removed = [(path, None) for path in files if path not in seen]
+        if removed and not self.cancelled:
+            self.changed = True
+            self.parsed.emit(removed)
+
+    def read_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("root") != self.root:
+            return {}
+        return {path: tuple(info) for path, info in cache.get("files", {}).items()}
+
+    def cancel(self):
+        self.cancelled = True
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Index des symboles du projet
+class SymbolIndex(QObject):
+    changed = pyqtSignal(str)
+    parsed_in_pool = pyqtSignal(object)
+
+    def __init__(self, root, pool, parent=None):
+        super().__init__(parent)
+        self.root = os.path.abspath(root)
+        self.pool = pool
+
+        # Fichier -> (mtime, taille, empreinte, symboles) et nom -> définitions
+        self.files = {}
+        self.definitions = {}
+        self.writer = None
+
+        self.cache_timer = QTimer(self)
+        self.cache_timer.setSingleShot(True)
+        self.cache_timer.setInterval(2000)
+        self.cache_timer.timeout.connect(self.write_cache)
+        self.parsed_in_pool.connect(self.on_refreshed)
+
+        digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()
+        self.cache_path = os.path.join(FILE_INDEX_CACHE_DIRECTORY, f"{digest}.symbols")
+        self.indexer = SymbolIndexer(self.root, self.cache_path, pool, self)
+        self.indexer.parsed.connect(self.on_parsed)
+        self.indexer.finished.connect(lambda: self.indexer.changed and self.cache_timer.start())
+        self.indexer.start()
+
+    def on_parsed(self, results):
+        for path, info in results:
+            previous = self.files.pop(path, None)
+            if previous is not None:
+                for symbol in previous[3]:
+                    definitions = self.definitions.get(symbol[0])
+                    if definitions is not None:
+                        definitions[:] = [definition for definition in definitions if definition[0] != path]
+            if info is None:
+                continue
+
+            # Contenu identique malgré une nouvelle date : les symboles connus sont gardés
+            if info[3] is None:
+                info = (info[0], info[1], info[2], previous[3] if previous is not None else [])
+            self.files[path] = info
+            for name, qualname, kind, line, column, depth in info[3]:
+                self.definitions.setdefault(name, []).append((path, line, column, kind, qualname))
+
+        self.changed.emit(results[0][0] if len(results) == 1 else "")
+
+    # --------------------------------------------------------------Un fichier enregistré est relu seul, dans le pool
+    def refresh(self, path):
+        path = os.path.abspath(path)
+        if not path.endswith(".py") or not path.startswith(self.root + os.sep):
+            return
+        previous = self.files.get(path)
+        future = self.pool.submit(parse_symbol_files, [(path, previous[2] if previous is not None else None)])
+        future.add_done_callback(self.parsed_in_pool.emit)
 
-            QTabBar::close-button:hover {
-                image: url("assets/close_tab_hover.png");
-            }
-        """)
+    def on_refreshed(self, future):
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"[ERROR] -- Could not index the symbols : {e}")
+            return
+        self.on_parsed(results)
+        self.cache_timer.start()
 
-        # --------------------------------------------------------------Tree
-        self.file_system_model = QFileSystemModel()
-        self.file_system_model.setRootPath(QDir.rootPath())
+    def symbols(self, path):
+        info = self.files.get(os.path.abspath(path)) if path else None
+        return info[3] if info is not None else []
 
-        self.tree_view = QTreeView()
-        self.tree_view.setModel(self.file_system_model)
-        self.tree_view.setRootIndex(self.file_system_model.index(QDir.rootPath()))
-        self.tree_view.setColumnWidth(0, 200)
-        self.tree_view.setFixedWidth(300)
+    def lookup(self, name):
+        return self.definitions.get(name, [])
 
-        self.tree_view.setStyleSheet("""
-            QTreeView {
-                background-color: #38393c;
-                color: white;
-                border: none;
-            }
+    def write_cache(self):
+        if self.writer is not None and self.writer.isRunning():
+            self.cache_timer.start()
+            return
+        self.writer = JsonWriter(self.cache_path, {"root": self.root, "files": dict(self.files)}, self)
+        self.writer.start()
+
+    def close(self):
+        self.indexer.cancel()
+        self.indexer.wait()
+        if self.cache_timer.isActive():
+            self.write_cache()
+        if self.writer is not None:
+            self.writer.wait()
+
+
+# Lexèmes JSON : chaîne, nombre, littéral ou ponctuation, précédés des blancs
+JSON_STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+JSON_TOKEN = re.compile(r'[ \t\n\r]*(?:(' + JSON_STRING + r')|(-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)'
+                        r'|(true|false|null)|([\[\]{}:,]))')
+# Début possible d'un lexème coupé par la fin d'un morceau
+JSON_PARTIAL = re.compile(r'[ \t\n\r]*(?:"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{0,4})?[^"\\\x00-\x1f]*)*'
+                          r'|-|t(?:r(?:u)?)?|f(?:a(?:l(?:s)?)?)?|n(?:u(?:l)?)?)?')
+# Suite possible d'un nombre coupé après ".", "e" ou "e+" : le lexème reconnu n'en est qu'un préfixe
+JSON_NUMBER_TAIL = re.compile(r'(?:\.[0-9]*)?(?:[eE][+-]?[0-9]*)?')
+JSON_STRING_PREFIX = re.compile(JSON_STRING[:-1])
+JSON_BLANKS = re.compile(r'[ \t\n\r]*')
+JSON_STRING_SPLIT = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")')
+JSON_BLANK_TABLE = str.maketrans("", "", " \t\n\r")
+# Parcours de la structure dans le fichier projeté : plus permissif, seules les limites des valeurs comptent
+JSON_SPACE = re.compile(rb'[ \t\n\r]*')
+JSON_LOOSE_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+JSON_SKIP = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|([\[{])|([\]}])')
+JSON_COLON = re.compile(rb'[ \t\n\r]*:[ \t\n\r]*')
+JSON_SEPARATOR = re.compile(rb'[ \t\n\r]*,?[ \t\n\r]*')
+JSON_SCALAR = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[^\s,\]}]+')
+
+# État de l'analyse : ce qui est attendu après le dernier lexème, et le message si autre chose arrive
+JSON_VALUE, JSON_VALUE_OR_CLOSE, JSON_KEY_OR_CLOSE, JSON_KEY, JSON_COLON_NEXT, JSON_COMMA_OR_CLOSE, JSON_END = range(7)
+JSON_EXPECTED = ["Expecting value", "Expecting value", "Expecting property name enclosed in double quotes",
+                 "Expecting property name enclosed in double quotes", "Expecting ':' delimiter",
+                 "Expecting ',' delimiter", "Extra data"]
+
+
+# --------------------------------------------------------------NaN et Infinity sont acceptés par le module json, pas par la norme
+def reject_json_constant(name):
+    raise ValueError(name)
+
+
+JSON_DECODER = json.JSONDecoder(parse_constant=reject_json_constant)
+
+
+# --------------------------------------------------------------Lire une source JSON (chemin, ou contenu en octets) par morceaux de texte
+def read_json_chunks(source):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    if isinstance(source, bytes):
+        yield decoder.decode(source, True)
+        return
+    with open(source, "rb") as file:
+        while True:
+            chunk = file.read(JSON_READ_CHUNK)
+            if not chunk:
+                break
+            yield decoder.decode(chunk)
+    yield decoder.decode(b"", True)
+
+
+# --------------------------------------------------------------Lexèmes validés d'une source JSON : (groupe, texte), ValueError(message, ligne, colonne) à la première erreur
+# Avec whole_values, une valeur entière contenue dans le morceau est validée par le décodeur C et rendue en un seul lexème (groupe 5)
+def json_tokens(source, whole_values=False):
+    stack = []
+    state = JSON_VALUE
+    buffer = ""
+    # Ligne courante et position absolue de son début, pour situer une erreur
+    line, line_start, offset = 1, 0, 0
+
+    def error(message, index):
+        newlines = buffer.count("\n", 0, index)
+        start = offset + buffer.rfind("\n", 0, index) + 1 if newlines else line_start
+        raise ValueError(message, line + newlines, offset + index - start + 1)
+
+    # Chaîne invalide là où une chaîne est attendue : l'erreur est placée sur le caractère fautif
+    def string_error(index):
+        if state > JSON_KEY:
+            error(JSON_EXPECTED[state], index)
+        end = JSON_STRING_PREFIX.match(buffer, index).end()
+        character = buffer[end:end + 1]
+        if not character or character == "\\" and end + 1 == len(buffer):
+            error("Unterminated string", index)
+        if character != "\\":
+            error("Invalid control character", end)
+        if buffer[end + 1:end + 2] == "u":
+            error("Invalid \\uXXXX escape", end + 1)
+        error("Invalid \\escape", end)
+
+    chunks = read_json_chunks(source)
+    final = False
+    while not final:
+        try:
+            chunk = next(chunks, None)
+        except UnicodeDecodeError:
+            error("Invalid UTF-8 data", len(buffer))
+        final = chunk is None
+        if not final:
+            buffer += chunk
+        size = len(buffer)
+        position = 0
+        match_token = JSON_TOKEN.match
+        match = None
 
-            QHeaderView::section {
+        while True:
+            if whole_values and state <= JSON_VALUE_OR_CLOSE:
+                index = JSON_BLANKS.match(buffer, position).end()
+                if buffer[index:index + 1] in ("{", "["):
+                    try:
+                        end = JSON_DECODER.raw_decode(buffer, index)[1]
+                    except (ValueError, RecursionError):
+                        # Valeur coupée par la fin du morceau ou invalide : elle est reprise lexème par lexème
+                        end = None
+                    if end is not None and (end < size or final):
+                        position = end
+                        state = JSON_COMMA_OR_CLOSE if stack else JSON_END
+                        yield 5, buffer[index:end]
+                        continue
+
+            match = match_token(buffer, position)
+            # Un lexème qui touche la fin du morceau peut encore continuer dans le suivant
+            if match is None or (match.end() == size and not final):
+                break
+            kind = match.lastindex
+            if kind == 2 and not final and JSON_NUMBER_TAIL.match(buffer, match.end()).end() == size:
+                break
+            position = match.end()
+            token = match.group(kind)
+
+            if kind == 4:
+                if token == "{" or token == "[":
+                    if state > JSON_VALUE_OR_CLOSE:
+                        error(JSON_EXPECTED[state], match.start(kind))
+                    stack.append(token)
+                    state = JSON_KEY_OR_CLOSE if token == "{" else JSON_VALUE_OR_CLOSE
+                elif token == "}" or token == "]":
+                    opening, empty = ("{", JSON_KEY_OR_CLOSE) if token == "}" else ("[", JSON_VALUE_OR_CLOSE)
+                    if not stack or stack[-1] != opening or state not in (JSON_COMMA_OR_CLOSE, empty):
+                        error(JSON_EXPECTED[state], match.start(kind))
+                    stack.pop()
+                    state = JSON_COMMA_OR_CLOSE if stack else JSON_END
+                elif token == ":":
+                    if state != JSON_COLON_NEXT:
+                        error(JSON_EXPECTED[state], match.start(kind))
+                    state = JSON_VALUE
+                else:
+                    if state != JSON_COMMA_OR_CLOSE:
+                        error(JSON_EXPECTED[state], match.start(kind))
+                    state = JSON_KEY if stack[-1] == "{" else JSON_VALUE
+            elif kind == 1 and (state == JSON_KEY_OR_CLOSE or state == JSON_KEY):
+                state = JSON_COLON_NEXT
+            elif state <= JSON_VALUE_OR_CLOSE:
+                state = JSON_COMMA_OR_CLOSE if stack else JSON_END
+            else:
+                error(JSON_EXPECTED[state], match.start(kind))
+            yield kind, token
+
+        index = JSON_BLANKS.match(buffer, position).end()
+        if final:
+            if buffer[index:index + 1] == '"':
+                string_error(index)
+            if index < size:
+                error(JSON_EXPECTED[state], index)
+            if state != JSON_END:
+                error(JSON_EXPECTED[state], index)
+            return
+        if match is None and not JSON_PARTIAL.fullmatch(buffer, position):
+            if buffer[index:index + 1] == '"':
+                string_error(index)
+            error(JSON_EXPECTED[state], index)
+
+        # Seule la fin non analysée est gardée pour le morceau suivant
+        newlines = buffer.count("\n", 0, position)
+        if newlines:
+            line += newlines
+            line_start = offset + buffer.rfind("\n", 0, position) + 1
+        offset += position
+        buffer = buffer[position:]
+
+
+# --------------------------------------------------------------Valider une source JSON (exécuté dans un processus de travail) : None ou (message, ligne, colonne)
+def validate_json(source):
+    try:
+        for _ in json_tokens(source, whole_values=True):
+            pass
+    except ValueError as e:
+        return e.args
+    return None
+
+
+# --------------------------------------------------------------Réécrire une source JSON par morceaux : indentée, ou compacte si indent vaut None
+def format_json_chunks(source, indent=None):
+    parts = []
+    depth = 0
+    # Conteneur ouvert dont on ne sait pas encore s'il est vide
+    opened = False
+    for kind, token in json_tokens(source, whole_values=indent is None):
+        if kind == 5:
+            # Valeur déjà validée : seuls les blancs hors des chaînes sont retirés
+            pieces = JSON_STRING_SPLIT.split(token)
+            pieces[::2] = [piece.translate(JSON_BLANK_TABLE) for piece in pieces[::2]]
+            parts.append("".join(pieces))
+        elif indent is None:
+            parts.append(token)
+        elif kind == 4 and (token == "}" or token == "]"):
+            depth -= 1
+            if not opened:
+                parts.append("\n" + " " * (indent * depth))
+            opened = False
+            parts.append(token)
+        else:
+            if opened:
+                parts.append("\n" + " " * (indent * depth))
+                opened = False
+            if kind != 4:
+                parts.append(token)
+            elif token == ",":
+                parts.append(",\n" + " " * (indent * depth))
+            elif token == ":":
+                parts.append(": ")
+            else:
+                parts.append(token)
+                depth += 1
+                opened = True
+
+        if len(parts) >= JSON_FLUSH_TOKENS:
+            yield "".join(parts)
+            parts = []
+
+    if indent is not None:
+        parts.append("\n")
+    yield "".join(parts)
+
+
+# --------------------------------------------------------------Formater une source JSON (exécuté dans un processus de travail) : vers un fichier, ou en texte sans cible
+def format_json(source, target=None, indent=None):
+    if target is None:
+        return "".join(format_json_chunks(source, indent))
+    write_atomic(target, (chunk.encode("utf-8") for chunk in format_json_chunks(source, indent)))
+    return target
+
+
+# --------------------------------------------------------------Compter les lignes d'une zone du fichier projeté, par morceaux : (nombre, position du dernier saut)
+def count_newlines(data, start, end):
+    count, last = 0, -1
+    while start < end:
+        stop = min(end, start + JSON_READ_CHUNK)
+        piece = data[start:stop]
+        found = piece.count(b"\n")
+        if found:
+            count += found
+            last = start + piece.rfind(b"\n")
+        start = stop
+    return count, last
+
+
+# --------------------------------------------------------------Position juste après la fermeture du conteneur qui commence à position (None au-delà du budget)
+def skip_json_container(data, position, budget=None):
+    depth = 0
+    limit = position + budget if budget is not None else len(data)
+    for match in JSON_SKIP.finditer(data, position):
+        if match.start() > limit:
+            return None
+        if match.lastindex == 1:
+            depth += 1
+        elif match.lastindex == 2:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return len(data)
+
+
+# --------------------------------------------------------------Une page d'enfants d'un conteneur JSON (exécuté dans un processus de travail)
+# curseur : (position, ligne, début de ligne, index du prochain enfant, conteneur déjà listé à sauter)
+# Enfant : (clé, type, aperçu, ligne, colonne, curseur interne)
+def scan_json_children(path, cursor, container, limit):
+    position, line, line_start, count, pending = cursor
+    children = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        size = len(data)
+        scanned = position
+
+        def locate(target):
+            nonlocal line, line_start, scanned
+            newlines, last = count_newlines(data, scanned, target)
+            if newlines:
+                line += newlines
+                line_start = last + 1
+            scanned = target
+
+        # Un gros conteneur a terminé la page précédente : il n'est parcouru que maintenant
+        if pending:
+            position = skip_json_container(data, position)
+
+        while len(children) < limit:
+            position = (JSON_SPACE if container is None else JSON_SEPARATOR).match(data, position).end()
+            if position >= size:
+                if container is not None or not children:
+                    locate(min(position, size))
+                    children.append(("error", "error", "Unexpected end of file", line, position - line_start + 1, None))
+                return children, None
+            first = data[position:position + 1]
+            if container is None and children or first in (b"]", b"}"):
+                return children, None
+
+            label = count
+            if container == b"{":
+                match = JSON_LOOSE_STRING.match(data, position)
+                colon = match and JSON_COLON.match(data, match.end())
+                if not colon:
+                    locate(position)
+                    children.append(("error", "error", "Expecting property name", line, position - line_start + 1, None))
+                    return children, None
+                label = match.group()[1:-1].decode("utf-8", errors="replace")
+                try:
+                    label = json.loads(match.group())
+                except ValueError:
+                    pass
+                position = colon.end()
+                first = data[position:position + 1]
+
+            locate(position)
+            column = position - line_start + 1
+            if first in (b"{", b"["):
+                kind, preview = ("object", "{…}") if first == b"{" else ("array", "[…]")
+                # Curseur interne : juste après l'ouverture, à la même ligne
+                inner = (position + 1, line, line_start, 0, False)
+                children.append((label, kind, preview, line, column, inner))
+                count += 1
+                # La valeur racine n'a pas de suivante, inutile d'en chercher la fin
+                if container is None:
+                    return children, None
+                end = skip_json_container(data, position, JSON_SKIP_BUDGET)
+                if end is None:
+                    return children, (position, line, line_start, count, True)
+                position = end
+                continue
+
+            match = JSON_SCALAR.match(data, position)
+            if match is None:
+                children.append(("error", "error", JSON_EXPECTED[JSON_VALUE], line, column, None))
+                return children, None
+            end = match.end()
+            value = data[position:min(end, position + JSON_PREVIEW_LENGTH)].decode("utf-8", errors="replace")
+            kind = {b'"': "string", b"t": "boolean", b"f": "boolean", b"n": "null"}.get(first, "number")
+            preview = value if end - position <= JSON_PREVIEW_LENGTH else value + "…"
+            children.append((label, kind, preview, line, column, None))
+            position = end
+            count += 1
+
+        locate(position)
+        return children, (position, line, line_start, count, False)
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Nœud de la structure JSON
+class JsonNode:
+    __slots__ = ("parent", "row", "label", "kind", "preview", "line", "column", "cursor", "children", "loading")
+
+    def __init__(self, parent, row, label, kind, preview="", line=1, column=1, cursor=None):
+        self.parent = parent
+        self.row = row
+        self.label = label
+        self.kind = kind
+        self.preview = preview
+        self.line = line
+        self.column = column
+        # Suite à lire dans le fichier, None quand tous les enfants sont connus
+        self.cursor = cursor
+        self.children = []
+        self.loading = False
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Modèle paresseux de la structure JSON
+class JsonTreeModel(QAbstractItemModel):
+    fetched = pyqtSignal(object, object)
+
+    def __init__(self, pool, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.path = None
+        # Change à chaque rechargement : les pages demandées pour un ancien fichier sont ignorées
+        self.generation = 0
+        self.root = JsonNode(None, 0, "", "root")
+        self.fetched.connect(self.insert_children)
+
+    def load(self, path):
+        self.beginResetModel()
+        self.path = path
+        self.generation += 1
+        self.root = JsonNode(None, 0, "", "root", cursor=(0, 1, 0, 0, False) if path else None)
+        self.endResetModel()
+
+    # --------------------------------------------------------------Navigation dans l'arbre
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < 2:
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        return bool(node.children) or node.cursor is not None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return str(node.label) if index.column() == 0 else node.preview
+        if role == Qt.ToolTipRole:
+            if node.kind == "more":
+                return node.preview
+            return f"{node.kind} : line {node.line}, column {node.column}"
+        if role == Qt.UserRole:
+            return node.line, node.column
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return ("Key", "Value")[section]
+        return None
+
+    # --------------------------------------------------------------Chargement des enfants page par page, dans le pool
+    # Après une très grosse valeur, la suite attend une demande explicite (ligne « … ») : la sauter peut prendre longtemps
+    def has_page(self, parent):
+        node = self.node(parent)
+        return node.cursor is not None and not node.cursor[4] and not node.loading and self.path is not None
+
+    # La vue redemande à chaque mise en page tant que canFetchMore est vrai : seule la première page passe par là,
+    # les suivantes sont demandées au défilement (fetch_page)
+    def canFetchMore(self, parent):
+        return self.has_page(parent) and not self.node(parent).children
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            self.request_page(self.node(parent))
+
+    def fetch_page(self, parent):
+        if self.has_page(parent):
+            self.request_page(self.node(parent))
+
+    def load_more(self, index):
+        node = index.internalPointer()
+        parent = node.parent
+        if node.kind != "more" or parent.loading:
+            return
+        self.beginRemoveRows(index.parent(), node.row, node.row)
+        parent.children.pop()
+        self.endRemoveRows()
+        self.request_page(parent)
+
+    def request_page(self, node):
+        node.loading = True
+        container = {"object": b"{", "array": b"["}.get(node.kind)
+        future = self.pool.submit(scan_json_children, self.path, node.cursor, container, JSON_TREE_PAGE)
+        future.add_done_callback(lambda future, generation=self.generation: self.fetched.emit((node, generation), future))
+
+    def insert_children(self, target, future):
+        node, generation = target
+        if generation != self.generation:
+            return
+        node.loading = False
+        try:
+            children, node.cursor = future.result()
+        except Exception as e:
+            children, node.cursor = [("error", "error", str(e), 1, 1, None)], None
+
+        parent = QModelIndex() if node is self.root else self.createIndex(node.row, 0, node)
+        if children:
+            first = len(node.children)
+            self.beginInsertRows(parent, first, first + len(children) - 1)
+            for row, (label, kind, preview, line, column, inner) in enumerate(children, first):
+                node.children.append(JsonNode(node, row, label, kind, preview, line, column, inner))
+            self.endInsertRows()
+        if node.cursor is not None and node.cursor[4]:
+            row = len(node.children)
+            self.beginInsertRows(parent, row, row)
+            node.children.append(JsonNode(node, row, "…", "more", "Activate to read past the large value above",
+                                          node.cursor[1]))
+            self.endInsertRows()
+        elif not children and node.cursor is None:
+            # Conteneur vide : la flèche de dépliage disparaît
+            self.dataChanged.emit(parent, parent)
+
+
+# --------------------------------------------------------------Feuilles de style locales liées par une page : <link rel="stylesheet" href="...">
+PREVIEW_LINK = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+PREVIEW_STYLESHEET = re.compile(r"""\brel\s*=\s*["']?stylesheet\b""", re.IGNORECASE)
+PREVIEW_HREF = re.compile(r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+PREVIEW_REMOTE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|//)", re.IGNORECASE)
+
+
+def linked_stylesheets(html, directory):
+    paths = []
+    for tag in PREVIEW_LINK.findall(html):
+        href = PREVIEW_HREF.search(tag)
+        if href is None or PREVIEW_STYLESHEET.search(tag) is None:
+            continue
+        target = next(group for group in href.groups() if group is not None)
+        # Pas de réseau pendant l'aperçu : seules les feuilles du disque sont lues
+        if not target or PREVIEW_REMOTE.match(target):
+            continue
+        target = target.split("#")[0].split("?")[0]
+        paths.append(os.path.normpath(os.path.join(directory, target)))
+    return paths
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Rendu de l'aperçu HTML en arrière-plan
+class PreviewRenderer(QThread):
+    rendered = pyqtSignal(object, bytes, str)
+
+    def __init__(self, html, path, stylesheets, font, previous, parent=None):
+        super().__init__(parent)
+        self.html = html
+        self.path = path
+        # Feuilles ouvertes et modifiées : {chemin: texte du buffer}, les autres sont lues sur le disque
+        self.stylesheets = stylesheets
+        self.font = font
+        self.previous = previous
+
+    def run(self):
+        directory = os.path.dirname(self.path)
+        styles = []
+        for path in linked_stylesheets(self.html, directory):
+            text = self.stylesheets.get(path)
+            if text is None:
+                try:
+                    with open(path, encoding="utf-8", errors="replace") as file:
+                        text = file.read()
+                except OSError as e:
+                    print(f"[ERROR] -- Could not read {path} : {e}")
+                    continue
+            styles.append(text)
+
+        # Même page, mêmes feuilles : rien à refaire
+        content = "\0".join([self.path, self.html] + styles)
+        digest = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        if digest == self.previous:
+            return
+
+        document = QTextDocument()
+        document.setDefaultFont(self.font)
+        document.setBaseUrl(QUrl.fromLocalFile(directory + os.sep))
+        document.setDefaultStyleSheet("\n".join(styles))
+        document.setHtml(self.html)
+        # La mise en page reste au fil de l'interface (par étapes) : les moteurs de polices sont propres à chaque fil
+        document.moveToThread(QCoreApplication.instance().thread())
+        self.rendered.emit(document, digest, self.path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Vue des gros fichiers
+class LargeFileView(QAbstractScrollArea):
+    position_changed = pyqtSignal()
+
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.path = file_path
+        self.file = open(file_path, "rb")
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.checkpoints = array("q", [0])
+        self.tail_lines = 0
+        self.indexing = True
+
+        # Seule la fenêtre de lignes affichée est décodée
+        self.window_first = -1
+        self.window_lines = []
+
+        self.setFont(asset_cache.fixed_font(12))
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setProperty("role", "large_file")
+        self.verticalScrollBar().valueChanged.connect(self.on_scroll)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+        self.indexer = LineIndexer(self.mapping, self)
+        self.indexer.indexed.connect(self.on_indexed)
+        self.indexer.finished.connect(self.on_indexing_finished)
+        self.indexer.start()
+
+    # --------------------------------------------------------------Nombre de lignes connues
+    def line_count(self):
+        return (len(self.checkpoints) - 1) * LINE_INDEX_STRIDE + self.tail_lines
+
+    def visible_lines(self):
+        return max(1, self.viewport().height() // self.fontMetrics().height())
+
+    # --------------------------------------------------------------Réception de l'index
+    def on_indexed(self, checkpoints, tail_lines):
+        self.checkpoints.extend(checkpoints)
+        self.tail_lines = tail_lines
+        self.update_scrollbars()
+        self.position_changed.emit()
+
+    def on_indexing_finished(self):
+        self.indexing = False
+        self.position_changed.emit()
+
+    def update_scrollbars(self):
+        self.verticalScrollBar().setRange(0, max(0, self.line_count() - self.visible_lines()))
+        self.verticalScrollBar().setPageStep(self.visible_lines())
+        char_width = self.fontMetrics().horizontalAdvance("0")
+        self.horizontalScrollBar().setRange(0, max(0, LARGE_FILE_MAX_LINE * char_width - self.viewport().width()))
+        self.horizontalScrollBar().setPageStep(self.viewport().width())
+
+    def on_scroll(self):
+        self.viewport().update()
+        self.position_changed.emit()
+
+    # --------------------------------------------------------------Lire une fenêtre de lignes depuis le fichier projeté
+    def read_lines(self, first, count):
+        checkpoint = first // LINE_INDEX_STRIDE
+        if checkpoint >= len(self.checkpoints):
+            return []
+
+        position = self.checkpoints[checkpoint]
+        size = len(self.mapping)
+        for _ in range(first - checkpoint * LINE_INDEX_STRIDE):
+            position = self.mapping.find(b"\n", position, size) + 1
+            if position == 0:
+                return []
+
+        lines = []
+        while len(lines) < count and position < size:
+            end = self.mapping.find(b"\n", position, size)
+            if end < 0:
+                end = size
+            raw = self.mapping[position:min(end, position + LARGE_FILE_MAX_LINE)]
+            lines.append(raw.decode("utf-8", errors="replace").rstrip("\r").expandtabs(4))
+            position = end + 1
+        return lines
+
+    # --------------------------------------------------------------Dessin des lignes visibles uniquement
+    def paintEvent(self, event):
+        first = self.verticalScrollBar().value()
+        count = self.visible_lines() + 1
+
+        if first != self.window_first or len(self.window_lines) < count:
+            self.window_lines = self.read_lines(first, count)
+            self.window_first = first
+
+        painter = QPainter(self.viewport())
+        metrics = self.fontMetrics()
+        line_height = metrics.height()
+        gutter = metrics.horizontalAdvance(str(max(self.line_count(), 1))) + 16
+        offset = self.horizontalScrollBar().value()
+
+        for row, text in enumerate(self.window_lines):
+            top = row * line_height
+            if top > event.rect().bottom():
+                break
+            if top + line_height < event.rect().top():
+                continue
+            painter.setPen(QColor("#d5dce0"))
+            painter.drawText(gutter + 4 - offset, top + metrics.ascent(), text)
+
+        painter.fillRect(0, 0, gutter, self.viewport().height(), QColor("#1e1f22"))
+        painter.setPen(QColor(160, 160, 160))
+        for row in range(len(self.window_lines)):
+            painter.drawText(0, row * line_height, gutter - 8, line_height, Qt.AlignRight | Qt.AlignVCenter,
+                             str(first + row + 1))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scrollbars()
+
+    # --------------------------------------------------------------Navigation au clavier
+    def keyPressEvent(self, event):
+        scrollbar = self.verticalScrollBar()
+        key = event.key()
+        if key == Qt.Key_Down:
+            scrollbar.setValue(scrollbar.value() + 1)
+        elif key == Qt.Key_Up:
+            scrollbar.setValue(scrollbar.value() - 1)
+        elif key == Qt.Key_PageDown:
+            scrollbar.setValue(scrollbar.value() + scrollbar.pageStep())
+        elif key == Qt.Key_PageUp:
+            scrollbar.setValue(scrollbar.value() - scrollbar.pageStep())
+        elif key == Qt.Key_Home and event.modifiers() & Qt.ControlModifier:
+            scrollbar.setValue(0)
+        elif key == Qt.Key_End and event.modifiers() & Qt.ControlModifier:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            super().keyPressEvent(event)
+
+    # --------------------------------------------------------------Texte de la barre de statut
+    def status_text(self):
+        first = self.verticalScrollBar().value() + 1
+        state = " (indexing...)" if self.indexing else ""
+        return f"Line : {first} | Lines : {self.line_count()}{state} | Read-only large file mode"
+
+    # --------------------------------------------------------------Libérer le fichier
+    def close_file(self):
+        self.indexer.requestInterruption()
+        self.indexer.wait()
+        self.window_lines = []
+        self.mapping.close()
+        self.file.close()
+
+
+# Au-delà, les onglets les moins récemment vus ne gardent que leur chemin ou un instantané compressé
+TAB_HYDRATED_MAX = int(os.environ.get("CODORA_HYDRATED_TABS", "12"))
+TAB_HYDRATED_CHARACTERS = 32 * 1024 * 1024
+# Les variantes redimensionnées sont arrondies par paliers pour être partagées entre tailles voisines
+ASSET_SIZE_BUCKET = 64
+ASSET_MAX_SCALED = 32
+HOME_RESIZE_DELAY = 120
+# Temps maximal jusqu'à une fenêtre interactive, vérifié par --startup-trace (--startup-budget=MS pour le changer)
+STARTUP_BUDGET_MS = int(os.environ.get("CODORA_STARTUP_BUDGET_MS", "1500"))
+PROFILER_INTERVAL = 0.001
+PROFILER_MAX_FUNCTIONS = 300
+PROFILER_SOURCE = r"""
+import cProfile, json, linecache, os, pstats, sys, threading, time, traceback, types
+
+request = json.loads(sys.stdin.readline())
+filename = request["filename"]
+os.chdir(request["cwd"])
+sys.argv = [filename]
+sys.path[0] = request["cwd"]
+linecache.cache[filename] = (len(request["source"]), None, request["source"].splitlines(True), filename)
+
+module = types.ModuleType("__main__")
+module.__file__ = filename
+module.__builtins__ = __builtins__
+sys.modules["__main__"] = module
+code = compile(request["source"], filename, "exec")
+
+# Échantillonnage de la pile du fil principal : coût inclusif de chaque ligne du fichier profilé
+main_thread = threading.get_ident()
+line_samples = {}
+state = {"running": True, "samples": 0}
+
+def sample():
+    while state["running"]:
+        frame = sys._current_frames().get(main_thread)
+        seen = set()
+        while frame is not None:
+            if frame.f_code.co_filename == filename and frame.f_lineno not in seen:
+                seen.add(frame.f_lineno)
+                line_samples[frame.f_lineno] = line_samples.get(frame.f_lineno, 0) + 1
+            frame = frame.f_back
+        state["samples"] += 1
+        time.sleep(request["interval"])
+
+sys.setswitchinterval(request["interval"])
+sampler = threading.Thread(target=sample, daemon=True)
+profiler = cProfile.Profile()
+exit_code = 0
+sampler.start()
+profiler.enable()
+try:
+    exec(code, module.__dict__)
+except SystemExit as error:
+    if isinstance(error.code, int) or error.code is None:
+        exit_code = error.code or 0
+    else:
+        print(error.code, file=sys.stderr)
+        exit_code = 1
+except BaseException as error:
+    traceback.print_exception(type(error), error, error.__traceback__.tb_next)
+    exit_code = 1
+finally:
+    profiler.disable()
+    state["running"] = False
+    sampler.join()
+
+functions = [(path, line, name, calls, own, total)
+             for (path, line, name), (primitive, calls, own, total, callers) in pstats.Stats(profiler).stats.items()]
+functions.sort(key=lambda function: function[5], reverse=True)
+with open(request["results"], "w", encoding="utf-8") as file:
+    json.dump({"functions": functions[:request["limit"]], "lines": line_samples, "samples": state["samples"]}, file)
+sys.stdout.flush()
+sys.exit(exit_code)
+"""
+
+
+# --------------------------------------------------------------Processus d'interpréteur Python aux sorties non tamponnées
+def interpreter_process(parent, arguments, working_directory=None, program=None):
+    process = QProcess(parent)
+    process.setProgram(program or sys.executable)
+    process.setArguments(arguments)
+    if working_directory:
+        process.setWorkingDirectory(working_directory)
+    environment = QProcessEnvironment.systemEnvironment()
+    environment.insert("PYTHONUNBUFFERED", "1")
+    environment.insert("PYTHONIOENCODING", "utf-8")
+    process.setProcessEnvironment(environment)
+    return process
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Réserve d'interpréteurs chauds
+class InterpreterPool(QObject):
+    def __init__(self, size=WARM_WORKERS, modules=WARM_MODULES, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.modules = modules
+        # Interpréteurs en cours de préchargement ou prêts, dans l'ordre de lancement
+        self.spares = []
+        self.ready = set()
+        self.waiting = []
+        self.failures = 0
+        self.fill()
+
+    def fill(self):
+        while len(self.spares) < self.size and self.failures < 3:
+            process = interpreter_process(self, ["-u", "-c", WARM_WORKER_SOURCE, *self.modules])
+            process.readyReadStandardOutput.connect(lambda process=process: self.on_output(process))
+            process.finished.connect(lambda *args, process=process: self.on_exit(process))
+            process.errorOccurred.connect(lambda error, process=process: self.on_error(process, error))
+            self.spares.append(process)
+            process.start()
+
+        # Plus aucun interpréteur ne démarre : les demandes en attente sont prévenues
+        if not self.spares:
+            waiting, self.waiting = self.waiting, []
+            for callback in waiting:
+                callback(None)
+
+    def on_output(self, process):
+        process.setReadChannel(QProcess.StandardOutput)
+        while process.canReadLine():
+            if bytes(process.readLine()).rstrip(b"\r\n") == WARM_READY_MARKER:
+                process.readyReadStandardOutput.disconnect()
+                self.ready.add(process)
+                self.failures = 0
+                if self.waiting:
+                    self.hand_over(process, self.waiting.pop(0))
+                return
+
+    def on_error(self, process, error):
+        # Un interpréteur qui n'a pas pu démarrer n'émet jamais finished
+        if error == QProcess.FailedToStart:
+            self.on_exit(process)
+
+    def on_exit(self, process):
+        if process in self.spares:
+            self.spares.remove(process)
+            self.ready.discard(process)
+            self.failures += 1
+            process.deleteLater()
+            self.fill()
+
+    # --------------------------------------------------------------Prendre un interpréteur prêt, ou attendre le prochain
+    def acquire(self, callback):
+        for process in self.spares:
+            if process in self.ready:
+                self.hand_over(process, callback)
+                return
+        self.waiting.append(callback)
+        self.fill()
+
+    def hand_over(self, process, callback):
+        self.spares.remove(process)
+        self.ready.discard(process)
+        process.finished.disconnect()
+        process.errorOccurred.disconnect()
+        # Les avertissements émis pendant le préchargement n'appartiennent pas au programme
+        process.readAllStandardError()
+        callback(process)
+        self.fill()
+
+    def release(self, process):
+        if process is not None:
+            process.kill()
+            process.waitForFinished(1000)
+            process.deleteLater()
+
+    def close(self):
+        self.size = 0
+        self.waiting = []
+        for process in self.spares:
+            process.finished.disconnect()
+            process.errorOccurred.disconnect()
+            process.kill()
+            process.waitForFinished(1000)
+        self.spares = []
+        self.ready.clear()
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Panneau d'exécution
+class RunPanel(QWidget):
+    run_finished = pyqtSignal(object, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.process = None
+        self.command = None
+        self.tag = None
+        self.request = 0
+        self.waiting = False
+        self.elapsed = QElapsedTimer()
+
+        # Sortie en attente, vidée une fois par image
+        self.pending = []
+        self.pending_lines = 0
+        self.skipped = 0
+        self.decoders = {}
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(16)
+        self.flush_timer.timeout.connect(self.flush)
+
+        self.kill_timer = QTimer(self)
+        self.kill_timer.setSingleShot(True)
+        self.kill_timer.setInterval(2000)
+        self.kill_timer.timeout.connect(self.kill)
+
+        self.output = QPlainTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setUndoRedoEnabled(False)
+        self.output.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Tampon circulaire : les plus anciennes lignes disparaissent au-delà du maximum
+        self.output.setMaximumBlockCount(RUN_OUTPUT_MAX_LINES)
+        self.output.setFont(asset_cache.fixed_font(11))
+
+        self.error_format = QTextCharFormat()
+        self.error_format.setForeground(QColor("#ff6b68"))
+        self.info_format = QTextCharFormat()
+        self.info_format.setForeground(QColor("#8a8d93"))
+        self.output_format = QTextCharFormat()
+
+        self.status = QLabel("")
+        self.stop_button = QPushButton("Stop")
+        self.stop_button.clicked.connect(self.stop)
+        self.stop_button.setEnabled(False)
+        self.rerun_button = QPushButton("Rerun")
+        self.rerun_button.clicked.connect(self.rerun)
+        self.rerun_button.setEnabled(False)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.output.clear)
+
+        header = QHBoxLayout()
+        header.addWidget(self.status, 1)
+        header.addWidget(self.stop_button)
+        header.addWidget(self.rerun_button)
+        header.addWidget(clear_button)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.addLayout(header)
+        layout.addWidget(self.output)
+
+        self.setStyleSheet("""
+            QWidget {
                 background-color: #38393c;
                 color: white;
-                border: none;
             }
-
-            QScrollBar:horizontal {
-                background: #38393c;
+            QPlainTextEdit {
+                background-color: #1e1f22;
+                color: #d5dce0;
+                border: none;
             }
-
-            QScrollBar::handle:horizontal {
-                background: #56585d;
-                min-height: 10px;
+            QPushButton {
+                background-color: #56789c;
                 border-radius: 5px;
+                padding: 4px 10px;
             }
-
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: #38393c;
+            QPushButton:hover {
+                background-color: #0297cd;
+            }
+            QPushButton:disabled {
+                background-color: #56585d;
             }
         """)
 
-        self.tree_view.doubleClicked.connect(self.open_file_from_tree)
+    # --------------------------------------------------------------Lancer un programme
+    def run(self, program, arguments, working_directory, input_data=None, label=None, tag=None):
+        self.discard_process()
+        self.command = (self.run, (program, arguments, working_directory, input_data, label, tag))
+        self.tag = tag
+
+        process = interpreter_process(self, arguments, working_directory, program)
+        self.attach(process, label or f"$ {program} {' '.join(arguments)}")
+        process.start()
+        if input_data is not None:
+            process.write(input_data)
+            process.closeWriteChannel()
+
+    # --------------------------------------------------------------Lancer une source dans un interpréteur déjà chaud
+    def run_warm(self, pool, source, filename, working_directory):
+        self.discard_process()
+        self.command = (self.run_warm, (pool, source, filename, working_directory))
+        self.tag = None
+        request = json.dumps({"source": source, "filename": filename, "cwd": working_directory}) + "\n"
+
+        self.request += 1
+        current = self.request
+        self.status.setText("Waiting for a warm interpreter...")
+        self.waiting = True
+        self.elapsed.start()
+
+        def start(process):
+            if current != self.request:
+                pool.release(process)
+                return
+            self.waiting = False
+            if process is None:
+                self.queue("No warm interpreter could be started\n", self.error_format)
+                self.status.setText("No warm interpreter could be started")
+                self.flush_timer.start()
+                return
+            self.attach(process, f"$ {os.path.basename(filename)} (warm interpreter)", restart_clock=False)
+            process.write(request.encode("utf-8"))
+            process.closeWriteChannel()
+
+        pool.acquire(start)
+
+    def attach(self, process, label, restart_clock=True):
+        self.decoders = {channel: codecs.getincrementaldecoder("utf-8")("replace")
+                         for channel in (QProcess.StandardOutput, QProcess.StandardError)}
+        process.readyReadStandardOutput.connect(lambda: self.read(process, QProcess.StandardOutput))
+        process.readyReadStandardError.connect(lambda: self.read(process, QProcess.StandardError))
+        process.finished.connect(lambda code, status: self.on_finished(process, code, status))
+        process.errorOccurred.connect(lambda error: self.on_error(process, error))
+        self.process = process
+
+        self.queue(f"{label}\n", self.info_format)
+        self.status.setText("Running...")
+        self.stop_button.setEnabled(True)
+        self.rerun_button.setEnabled(True)
+        if restart_clock:
+            self.elapsed.start()
+        self.flush_timer.start()
+
+    def discard_process(self):
+        self.request += 1
+        self.waiting = False
+        if self.is_running():
+            self.process.finished.disconnect()
+            self.process.kill()
+            self.process.waitForFinished(1000)
+
+    def rerun(self):
+        if self.command:
+            method, arguments = self.command
+            method(*arguments)
+
+    def is_running(self):
+        return self.process is not None and self.process.state() != QProcess.NotRunning
+
+    # --------------------------------------------------------------Arrêter le programme
+    def stop(self):
+        if self.waiting:
+            self.waiting = False
+            self.request += 1
+            self.status.setText("Cancelled")
+        if self.is_running():
+            self.process.terminate()
+            self.kill_timer.start()
+
+    def kill(self):
+        if self.is_running():
+            self.process.kill()
+
+    # --------------------------------------------------------------Lecture asynchrone des sorties
+    def read(self, process, channel):
+        if process is not self.process:
+            return
+        process.setReadChannel(channel)
+        data = bytes(process.readAll())
+        text = self.decoders[channel].decode(data)
+        if text:
+            self.queue(text, self.error_format if channel == QProcess.StandardError else self.output_format)
+
+    def queue(self, text, text_format):
+        if self.pending and self.pending[-1][1] is text_format:
+            self.pending[-1][0].append(text)
+        else:
+            self.pending.append(([text], text_format))
+        self.pending_lines += text.count("\n")
 
-        splitter = QSplitter(Qt.Horizontal)
+        # Au-delà de ce que garde le tampon circulaire, les plus anciens morceaux ne seraient jamais visibles
+        while True:
+            parts = self.pending[0][0]
+            lines = parts[0].count("\n")
+            if self.pending_lines - lines < RUN_OUTPUT_MAX_LINES:
+                break
+            parts.pop(0)
+            if not parts:
+                self.pending.pop(0)
+            self.pending_lines -= lines
+            self.skipped += lines
+
+    def flush(self):
+        if not self.pending:
+            if not self.is_running():
+                self.flush_timer.stop()
+            return
 
-        file_explorer_widget = QWidget()
-        file_explorer_widget.setFixedWidth(318)
-        file_explorer_layout = QVBoxLayout(file_explorer_widget)
-        file_explorer_layout.addWidget(self.tree_view)
+        started = time.perf_counter()
+        cursor = QTextCursor(self.output.document())
+        cursor.movePosition(QTextCursor.End)
+        scrollbar = self.output.verticalScrollBar()
+        follow = scrollbar.value() == scrollbar.maximum()
+
+        cursor.beginEditBlock()
+        if self.skipped:
+            cursor.insertText(f"[... {self.skipped} lines skipped ...]\n", self.info_format)
+            self.skipped = 0
+
+        # Un nombre borné de lignes par image, le reste attend l'image suivante
+        budget = RUN_OUTPUT_FLUSH_LINES
+        while self.pending and budget > 0:
+            parts, text_format = self.pending[0]
+            text = "".join(parts)
+            end = self.line_offset(text, budget)
+            if end < len(text):
+                parts[:] = [text[end:]]
+                text = text[:end]
+            else:
+                self.pending.pop(0)
+            lines = text.count("\n")
+            self.pending_lines -= lines
+            budget -= lines
+            cursor.insertText(text, text_format)
+        cursor.endEditBlock()
+
+        if follow:
+            scrollbar.setValue(scrollbar.maximum())
+
+        # Sous un flot continu, les vidages s'espacent pour que l'affichage garde au plus un cinquième du temps
+        duration = time.perf_counter() - started
+        self.flush_timer.setInterval(min(max(16, int(duration * 4000)), 250))
+
+    @staticmethod
+    def line_offset(text, lines):
+        position = -1
+        for _ in range(lines):
+            position = text.find("\n", position + 1)
+            if position < 0:
+                return len(text)
+        return position + 1
+
+    # --------------------------------------------------------------Fin du programme
+    def on_finished(self, process, code, status):
+        if process is not self.process:
+            return
+        self.kill_timer.stop()
+        self.read(process, QProcess.StandardOutput)
+        self.read(process, QProcess.StandardError)
 
-        splitter.addWidget(file_explorer_widget)
+        seconds = self.elapsed.elapsed() / 1000
+        if status == QProcess.CrashExit:
+            message = f"Stopped after {seconds:.2f} s"
+        else:
+            message = f"Exited with code {code} in {seconds:.2f} s"
+        self.queue(f"\n{message}\n", self.info_format)
+        self.status.setText(message)
+        self.stop_button.setEnabled(False)
+        self.flush()
+        self.run_finished.emit(self.tag, code if status == QProcess.NormalExit else -1)
+
+    def on_error(self, process, error):
+        if process is self.process and error == QProcess.FailedToStart:
+            message = f"Could not start {process.program()} : {process.errorString()}"
+            self.queue(f"{message}\n", self.error_format)
+            self.status.setText(message)
+            self.stop_button.setEnabled(False)
+            self.flush()
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Arborescence du projet
+class ProjectTreeModel(QSortFilterProxyModel):
+    truncated = pyqtSignal(str)
 
-        splitter.addWidget(self.tabs)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Aucune racine tant qu'aucun projet n'est ouvert : rien n'est lu ni surveillé
+        self.files = QFileSystemModel(self)
+        self.files.setResolveSymlinks(False)
+        self.files.directoryLoaded.connect(self.on_directory_loaded)
+        self.files.rowsInserted.connect(self.on_rows_inserted)
+        self.setSourceModel(self.files)
+        # Environnements virtuels relevés par l'index du projet, en arrière-plan : aucun accès disque ici
+        self.environments = set()
+        # Dossiers trop grands : noms des premières entrées dans l'ordre d'affichage (dossiers, puis noms)
+        self.shown_entries = {}
+        self.pending_caps = set()
+        self.cap_timer = QTimer(self)
+        self.cap_timer.setSingleShot(True)
+        self.cap_timer.setInterval(0)
+        self.cap_timer.timeout.connect(self.apply_caps)
+
+    def set_root(self, folder):
+        self.environments = set()
+        self.shown_entries = {}
+        self.files.setRootPath(folder)
+        return self.mapFromSource(self.files.index(folder))
+
+    def file_path(self, index):
+        return self.files.filePath(self.mapToSource(index))
+
+    def set_environments(self, paths):
+        environments = {QDir.fromNativeSeparators(os.path.normpath(path)) for path in paths} | self.environments
+        if environments != self.environments:
+            self.environments = environments
+            for path in list(self.shown_entries):
+                self.cap_directory(path)
+            self.invalidateFilter()
+
+    def hidden_directory(self, index):
+        return self.files.fileName(index) in IGNORED_DIRECTORIES or self.files.filePath(index) in self.environments
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.files.index(source_row, 0, source_parent)
+        shown = self.shown_entries.get(self.files.filePath(source_parent))
+        if shown is not None:
+            if self.files.fileName(index) not in shown:
+                return False
+        # Dossier encore en chargement : plafond provisoire, remplacé par l'ordre trié une fois chargé
+        elif source_row >= PROJECT_TREE_MAX_ENTRIES:
+            return False
+        return not (self.files.isDir(index) and self.hidden_directory(index))
+
+    def cap_directory(self, path):
+        parent = self.files.index(path)
+        rows = self.files.rowCount(parent)
+        if rows <= PROJECT_TREE_MAX_ENTRIES:
+            return self.shown_entries.pop(path, None) is not None
+        entries = []
+        for row in range(rows):
+            index = self.files.index(row, 0, parent)
+            directory = self.files.isDir(index)
+            if not (directory and self.hidden_directory(index)):
+                entries.append((not directory, self.files.fileName(index).casefold(), self.files.fileName(index)))
+        shown = {name for _, _, name in heapq.nsmallest(PROJECT_TREE_MAX_ENTRIES, entries)}
+        if shown == self.shown_entries.get(path):
+            return False
+        self.shown_entries[path] = shown
+        return True
+
+    def apply_caps(self):
+        pending, self.pending_caps = self.pending_caps, set()
+        changed = [path for path in pending if self.cap_directory(path)]
+        if changed:
+            self.invalidateFilter()
+
+    def on_directory_loaded(self, path):
+        if self.files.rowCount(self.files.index(path)) > PROJECT_TREE_MAX_ENTRIES:
+            self.pending_caps.add(path)
+            self.cap_timer.start()
+            self.truncated.emit(path)
+
+    def on_rows_inserted(self, parent, first, last):
+        # Entrées ajoutées sur le disque dans un dossier plafonné : la sélection triée est refaite
+        path = self.files.filePath(parent)
+        if path in self.shown_entries:
+            self.pending_caps.add(path)
+            self.cap_timer.start()
+
+
+# --------------------------------------------------------------Thème de l'application, appliqué une seule fois : les widgets sont ciblés par nom d'objet ou propriété
+APP_THEME = """
+    QMainWindow {
+        background-color: #38393c;
+    }
+
+    QSplitter#main_splitter, QSplitter#main_splitter::handle {
+        background-color: #38393c;
+    }
+
+    QTabWidget#editor_tabs::pane {
+        background-color: #56585d;
+        border: solid 1px #56585d;
+    }
+
+    QTabWidget#editor_tabs QTabBar {
+        background-color: #38393c;
+    }
+
+    QTabWidget#editor_tabs QTabBar::tab {
+        background: #38393c;
+        padding: 10px;
+        margin: 2px;
+        border-top-left-radius: 7px;
+        border-top-right-radius: 7px;
+        border-bottom-left-radius: 0px;
+        border-bottom-right-radius: 0px;
+        font-weight: bold;
+        width: 150px;
+        color: #a1a2a4;
+    }
+
+    QTabWidget#editor_tabs QTabBar::tab:hover {
+        background: #404145;
+        color: white;
+    }
+
+    QTabWidget#editor_tabs QTabBar::tab:selected {
+        background: #56585d;
+        color: white;
+        margin-bottom: -2px;
+        margin-top: 3px;
+    }
+
+    QTabWidget#editor_tabs QTabBar::close-button {
+        image: url("assets/close_tab.png");
+        subcontrol-position: right;
+        margin-right: 5px;
+    }
+
+    QTabWidget#editor_tabs QTabBar::close-button:hover {
+        image: url("assets/close_tab_hover.png");
+    }
+
+    QPlainTextEdit[role="editor"] {
+        background-color: #1e1f22;
+        color: #d5dce0;
+        font-family: Consolas, "Courier New", monospace;
+        border: none;
+    }
+
+    QAbstractScrollArea[role="large_file"] {
+        background-color: #1e1f22;
+    }
+
+    QTreeView#project_tree {
+        background-color: #38393c;
+        color: white;
+        border: none;
+    }
+
+    QTreeView#project_tree QHeaderView::section {
+        background-color: #38393c;
+        color: white;
+        border: none;
+    }
+
+    QTreeView#project_tree QScrollBar:horizontal {
+        background: #38393c;
+    }
+
+    QTreeView#project_tree QScrollBar::handle:horizontal {
+        background: #56585d;
+        min-height: 10px;
+        border-radius: 5px;
+    }
+
+    QTreeView#project_tree QScrollBar::add-page:horizontal, QTreeView#project_tree QScrollBar::sub-page:horizontal {
+        background: #38393c;
+    }
+
+    QStatusBar {
+        background-color: #131e23;
+        color: white;
+    }
+
+    QStatusBar QLabel {
+        color: white;
+    }
+
+    QStatusBar QPushButton {
+        color: white;
+        background-color: #2e436e;
+        border-radius: 5px;
+        padding: 2px 8px;
+    }
+
+    QMenuBar {
+        background-color: #131e23;
+        color: white;
+    }
+
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 6px 10px;
+        border-radius: 5px;
+    }
+
+    QMenuBar::item:selected {
+        background-color: #0297cd;
+    }
+
+    QMenuBar::item:pressed {
+        background-color: #01719a;
+    }
+
+    QMenu {
+        background-color: #131e23;
+        color: white;
+        padding-left: 7px;
+    }
+
+    QMenu::item {
+        padding: 6px 20px;
+        border-radius: 5px;
+    }
+
+    QMenu::item:selected {
+        background-color: #2e436e;
+    }
+
+    QToolBar {
+        background-color: #2f4a56;
+        border: none;
+        padding: 5px;
+    }
+
+    QToolBar QPushButton {
+        background-color: #56789c;
+        border-radius: 5px;
+        padding: 6px;
+        margin: 0 4px;
+    }
+
+    QToolBar QPushButton:hover {
+        background-color: #0297cd;
+    }
+
+    QToolBar QPushButton:pressed {
+        background-color: #01719a;
+    }
+
+    QToolBar QLabel {
+        color: white;
+    }
+
+    QToolBar QLineEdit {
+        border: 2px solid #56789c;
+        border-radius: 10px;
+        padding: 5px 10px;
+        font-size: 12px;
+        background-color: #ecf0f1;
+        color: #2c3e50;
+    }
+
+    QToolBar QLineEdit:focus {
+        border: 2px solid #0297cd;
+        background-color: white;
+    }
+
+    QTreeWidget#outline_tree {
+        background-color: #38393c;
+        color: white;
+        border: none;
+    }
+
+    QTreeView#json_tree {
+        background-color: #38393c;
+        color: white;
+        border: none;
+    }
+
+    QTextBrowser#preview_browser {
+        background-color: white;
+        color: black;
+        border: none;
+    }
+
+    QListView#command_popup {
+        background-color: #1e1f22;
+        color: white;
+        border: 1px solid #56789c;
+    }
+
+    QListView#command_popup::item:selected {
+        background-color: #2e436e;
+    }
+"""
+
+
+def apply_theme():
+    app = QApplication.instance()
+    if app.styleSheet() != APP_THEME:
+        app.setStyleSheet(APP_THEME)
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Cache des ressources
+class AssetCache:
+    def __init__(self):
+        self.icons = {}
+        self.pixmaps = {}
+        self.scaled_pixmaps = collections.OrderedDict()
+        self.fonts = {}
+
+    def icon(self, path):
+        icon = self.icons.get(path)
+        if icon is None:
+            icon = self.icons[path] = QIcon(self.pixmap(path))
+        return icon
+
+    def pixmap(self, path):
+        pixmap = self.pixmaps.get(path)
+        if pixmap is None:
+            pixmap = self.pixmaps[path] = QPixmap(path)
+            if pixmap.isNull():
+                print(f"[ERROR] -- Could not load asset {path}")
+        return pixmap
+
+    def fixed_font(self, point_size):
+        font = self.fonts.get(point_size)
+        if font is None:
+            font = self.fonts[point_size] = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+            font.setPointSize(point_size)
+        return font
+
+    # --------------------------------------------------------------Variante redimensionnée, calculée une seule fois par palier de taille
+    def scaled(self, path, size):
+        width = max(ASSET_SIZE_BUCKET, size.width() // ASSET_SIZE_BUCKET * ASSET_SIZE_BUCKET)
+        height = max(ASSET_SIZE_BUCKET, size.height() // ASSET_SIZE_BUCKET * ASSET_SIZE_BUCKET)
+        key = (path, width, height)
+
+        pixmap = self.scaled_pixmaps.get(key)
+        if pixmap is not None:
+            self.scaled_pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = self.pixmap(path).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.scaled_pixmaps[key] = pixmap
+        if len(self.scaled_pixmaps) > ASSET_MAX_SCALED:
+            self.scaled_pixmaps.popitem(last=False)
+        return pixmap
+
+
+asset_cache = AssetCache()
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Bouton de fermeture d'onglet
+class TabCloseButton(QAbstractButton):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setCursor(Qt.ArrowCursor)
+        self.setFixedSize(16, 16)
+        self.setToolTip("Close Tab")
 
-        splitter.setStyleSheet("""
-            QSplitter {
-                background-color: #38393c;
-            }
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
 
-             QSplitter::handle {
-                background-color: #38393c;
-             }
-        """)
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
 
-        self.setCentralWidget(splitter)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        name = "assets/close_tab_hover.png" if self.underMouse() else "assets/close_tab.png"
+        painter.drawPixmap(self.rect(), asset_cache.pixmap(name))
 
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #38393c;
-            }
-        """)
 
-        # --------------------------------------------------------------Status Bar
-        self.status_bar = self.statusBar()
+# Couleur des soulignements et marqueurs par gravité
+DIAGNOSTIC_COLORS = {"error": QColor(255, 85, 85), "warning": QColor(230, 190, 60)}
 
-        self.status_label = QLabel("Line : - | Column : - | Characters : -")
-        self.status_label.setStyleSheet("color: white;")
-        self.status_label.setContentsMargins(0, 0, 10, 0)
-        self.status_bar.addPermanentWidget(self.status_label)
 
-        self.encoding_label = QLabel("Encoding : UTF-8")
-        self.encoding_label.setStyleSheet("color: white;")
-        self.encoding_label.setAlignment(Qt.AlignRight)
-        self.encoding_label.setContentsMargins(0, 0, 10, 0)
-        self.status_bar.addPermanentWidget(self.encoding_label)
+# ----------------------------------------------------------------------------------------------------------------------------Classe Zone de numéros de ligne
+class LineNumberArea(QWidget):
+    def __init__(self, editor):
+        super().__init__(editor)
+        # --------------------------------------------------------------Éditeur
+        self.editor = editor
+        self.digits = 0
+        self.current_block = 0
+        # Part du temps mesurée par le profileur, par numéro de bloc
+        self.line_costs = {}
+        self.cost_width = 0
+        # Diagnostics par numéro de bloc : (gravité, message)
+        self.diagnostics = {}
+        self.setFont(editor.font())
+        # Zone opaque : Qt peut décaler ses pixels au défilement au lieu de tout redessiner
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.update_width()
+
+        editor.blockCountChanged.connect(self.update_width)
+        editor.updateRequest.connect(self.on_update_request)
+        editor.cursorPositionChanged.connect(self.on_cursor_moved)
 
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #131e23;
-                color: white;
-            }
-        """)
+        editor.setContextMenuPolicy(Qt.CustomContextMenu)
+        editor.customContextMenuRequested.connect(lambda pos, e=editor: self.show_custom_context_menu(pos, e))
 
-        # ------------------------------------------------File
-        self.menuBar().setStyleSheet("""
-            QMenuBar {
-                background-color: #131e23;
-                color: white;
-            }
+    # --------------------------------------------------------------Largeur selon le nombre de chiffres
+    def update_width(self, *args):
+        # Des lignes ajoutées ou retirées décaleraient les mesures du profileur
+        if args and self.line_costs:
+            self.set_line_costs({})
+
+        digits = max(2, len(str(self.editor.blockCount())))
+        if digits != self.digits:
+            self.digits = digits
+            self.setFixedWidth(self.fontMetrics().horizontalAdvance("9") * digits + 16 + self.cost_width)
+            self.update()
+
+    # --------------------------------------------------------------Annotations du profileur
+    def set_line_costs(self, costs):
+        self.line_costs = costs
+        self.cost_width = self.fontMetrics().horizontalAdvance("100%") + 8 if costs else 0
+        self.digits = 0
+        self.update_width()
+        self.update()
+
+    # --------------------------------------------------------------Marqueurs des diagnostics
+    def set_diagnostics(self, diagnostics):
+        if diagnostics != self.diagnostics:
+            self.diagnostics = diagnostics
+            self.update()
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            block = self.editor.cursorForPosition(QPoint(0, event.pos().y() - self.viewport_offset())).block()
+            diagnostic = self.diagnostics.get(block.blockNumber())
+            if diagnostic:
+                QToolTip.showText(event.globalPos(), diagnostic[1], self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
 
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 6px 10px;
-                border-radius: 5px;
-            }
+    # --------------------------------------------------------------Décalage vertical entre la zone et le viewport de l'éditeur
+    def viewport_offset(self):
+        return self.editor.viewport().mapToGlobal(QPoint(0, 0)).y() - self.mapToGlobal(QPoint(0, 0)).y()
 
-            QMenuBar::item:selected {
-                background-color: #0297cd;
-            }
+    def viewport_band(self):
+        return QRect(0, self.viewport_offset(), self.width(), self.editor.viewport().height())
 
-            QMenuBar::item:pressed {
-                background-color: #01719a;
-            }
+    # --------------------------------------------------------------Mise à jour des numéros de ligne : défilement des pixels existants ou zone invalidée
+    def on_update_request(self, rect, dy):
+        if dy:
+            self.scroll(0, dy, self.viewport_band())
+        else:
+            self.update(0, rect.y() + self.viewport_offset(), self.width(), rect.height())
+
+    # --------------------------------------------------------------Ne redessiner que l'ancienne et la nouvelle ligne courante
+    def on_cursor_moved(self):
+        block_number = self.editor.textCursor().blockNumber()
+        if block_number != self.current_block:
+            for number in (self.current_block, block_number):
+                block = self.editor.document().findBlockByNumber(number)
+                if block.isValid() and block.isVisible():
+                    geometry = self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset())
+                    self.update(0, int(geometry.top()) + self.viewport_offset(), self.width(), int(geometry.height()) + 1)
+            self.current_block = block_number
 
-            QMenu {
-                background-color: #131e23;
-                color: white;
-                padding-left: 7px;
-            }
+    # --------------------------------------------------------------Mécanique d'écriture des nombres
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        offset = self.viewport_offset()
+        painter.fillRect(rect, QColor("#56585d"))
+        painter.setClipRect(rect.intersected(self.viewport_band()))
 
-            QMenu::item {
-                padding: 6px 20px;
-                border-radius: 5px;
-            }
+        block = self.editor.firstVisibleBlock()
+        block_number = block.blockNumber()
+        line_height = self.fontMetrics().height()
+        top = self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset()).top() + offset
+        bottom = top + self.editor.blockBoundingRect(block).height()
+
+        while block.isValid() and top <= rect.bottom():
+            if block.isVisible() and bottom >= rect.top():
+                cost = self.line_costs.get(block_number)
+                if cost:
+                    painter.fillRect(0, int(top), self.cost_width - 4, line_height, QColor(255, 107, 104, 60 + int(160 * cost)))
+                    painter.setPen(QColor("white"))
+                    painter.drawText(0, int(top), self.cost_width - 6, line_height, Qt.AlignRight, f"{cost:.0%}")
+                diagnostic = self.diagnostics.get(block_number)
+                if diagnostic:
+                    painter.fillRect(self.cost_width, int(top) + 2, 3, line_height - 4,
+                                     DIAGNOSTIC_COLORS[diagnostic[0]])
+                painter.setPen(QColor("white") if block_number == self.current_block else QColor(160, 160, 160))
+                painter.drawText(0, int(top), self.width() - 8, line_height, Qt.AlignRight, str(block_number + 1))
 
-            QMenu::item:selected {
-                background-color: #2e436e;
-            }
-        """)
+            block = block.next()
+            top = bottom
+            bottom = top + self.editor.blockBoundingRect(block).height()
+            block_number += 1
 
-        file_menu = self.menuBar().addMenu("&File")
+    # --------------------------------------------------------------Création du menu clic droit custom
+    def show_custom_context_menu(self, position, editor):
+        context_menu = QMenu(editor)
 
-        open_menu = QMenu("Open a...", self)
-        open_menu.setIcon(QIcon("assets/open.png"))
-        txt_open_action = QAction(QIcon("assets/txt.png"), "Text file (*.txt)", self)
-        txt_open_action.setStatusTip("Open a Text file")
-        txt_open_action.triggered.connect(lambda: self.file_open("Text File (*.txt)", ".txt"))
-        py_open_action = QAction(QIcon("assets/py.png"), "Python file(*.py)", self)
-        py_open_action.setStatusTip("Open a Python file")
-        py_open_action.triggered.connect(lambda: self.file_open("Python File (*.py)", ".py"))
-        html_open_action = QAction(QIcon("assets/html.png"), "HTML file (*.html)", self)
-        html_open_action.setStatusTip("Open a HTML file")
-        html_open_action.triggered.connect(lambda: self.file_open("HTML File (*.html)", ".html"))
-        css_open_action = QAction(QIcon("assets/css.png"), "CSS file (*.css)", self)
-        css_open_action.setStatusTip("Open a CSS file")
-        css_open_action.triggered.connect(lambda: self.file_open("CSS File (*.css)", ".css"))
-        json_open_action = QAction(QIcon("assets/json.png"), "JSON file (*.json)", self)
-        json_open_action.setStatusTip("Open a JSON file")
-        json_open_action.triggered.connect(lambda: self.file_open("JSON File (*.json)", ".json"))
-        open_menu.addAction(txt_open_action)
-        open_menu.addAction(py_open_action)
-        open_menu.addAction(html_open_action)
-        open_menu.addAction(css_open_action)
-        open_menu.addAction(json_open_action)
-        file_menu.addMenu(open_menu)
-        open_menu.setStyleSheet("""
-            QMenu {
-                background-color: #131e23;
-                color: white;
-                padding-left: 7px;
-            }
+        undo_action = QAction(asset_cache.icon("assets/back_white.png"), "Undo", self)
+        undo_action.setEnabled(editor.document().isUndoAvailable())
+        undo_action.triggered.connect(editor.undo)
+        context_menu.addAction(undo_action)
+
+        redo_action = QAction(asset_cache.icon("assets/forward_white.png"), "Redo", self)
+        redo_action.setEnabled(editor.document().isRedoAvailable())
+        redo_action.triggered.connect(editor.redo)
+        context_menu.addAction(redo_action)
+
+        context_menu.addSeparator()
+
+        cut_action = QAction(asset_cache.icon("assets/cut.png"), "Cut", self)
+        cut_action.setEnabled(editor.textCursor().hasSelection())
+        cut_action.triggered.connect(editor.cut)
+        context_menu.addAction(cut_action)
+
+        copy_action = QAction(asset_cache.icon("assets/copy.png"), "Copy", self)
+        copy_action.setEnabled(editor.textCursor().hasSelection())
+        copy_action.triggered.connect(editor.copy)
+        context_menu.addAction(copy_action)
+
+        paste_action = QAction(asset_cache.icon("assets/paste.png"), "Paste", self)
+        paste_action.setEnabled(bool(QApplication.clipboard().text()))
+        paste_action.triggered.connect(editor.paste)
+        context_menu.addAction(paste_action)
+
+        context_menu.addSeparator()
+
+        select_all_action = QAction(asset_cache.icon("assets/selectall.png"), "Select All", self)
+        select_all_action.triggered.connect(editor.selectAll)
+        context_menu.addAction(select_all_action)
 
-            QMenu::item {
-                padding: 6px 20px;
-                border-radius: 5px;
-            }
+        context_menu.exec_(editor.mapToGlobal(position))
 
-            QMenu::item:selected {
-                background-color: #2e436e;
-            }  
-        """)
 
-        open_directory_action = QAction(QIcon("assets/folder_white.png"), "Open project", self)
-        open_directory_action.setStatusTip("Open a project in the file tree view")
-        open_directory_action.triggered.connect(self.select_folder)
-        file_menu.addAction(open_directory_action)
+# ----------------------------------------------------------------------------------------------------------------------------Classe Registre des commandes
+class CommandRegistry:
+    def __init__(self, window):
+        self.window = window
+        self.commands = {}
+        self.actions = {}
+        self.names = []
+        self.keys = []
+
+    def register(self, name, title, callback, icon=None, tip=None, shortcut=None, checkable=False):
+        self.commands[name] = {"title": title, "callback": callback, "icon": icon, "tip": tip,
+                               "shortcut": shortcut, "checkable": checkable}
+        bisect.insort(self.names, name)
+        self.keys = [f"{name} {self.commands[name]['title']}".lower() for name in self.names]
+
+    # --------------------------------------------------------------Action de menu d'une commande, créée à la première demande
+    def action(self, name):
+        action = self.actions.get(name)
+        if action is None:
+            command = self.commands[name]
+            action = QAction(command["title"], self.window)
+            if command["icon"]:
+                action.setIcon(asset_cache.icon(command["icon"]))
+            if command["tip"]:
+                action.setStatusTip(command["tip"])
+            if command["shortcut"]:
+                action.setShortcut(command["shortcut"])
+            if command["checkable"]:
+                action.setCheckable(True)
+                action.setChecked(True)
+                action.triggered.connect(command["callback"])
+            else:
+                action.triggered.connect(lambda checked=False, callback=command["callback"]: callback())
+            self.actions[name] = action
+        return action
+
+    # --------------------------------------------------------------Les raccourcis doivent marcher avant l'ouverture des menus
+    def install_shortcuts(self):
+        for name, command in self.commands.items():
+            if command["shortcut"]:
+                self.window.addAction(self.action(name))
+
+    def run(self, name):
+        if name not in self.commands:
+            return False
+        self.action(name).trigger()
+        return True
+
+    # --------------------------------------------------------------Complétion : préfixe du nom, puis sous-chaîne, puis lettres dans l'ordre
+    def complete(self, text, limit=QUICK_OPEN_RESULTS):
+        text = " ".join(text.lower().split())
+        if not text:
+            return list(self.names[:limit])
+
+        deadline = time.perf_counter() + QUICK_OPEN_BUDGET
+        found = []
+        seen = set()
+
+        def add(name):
+            if name not in seen:
+                seen.add(name)
+                found.append(name)
+
+        start = bisect.bisect_left(self.names, text)
+        for name in itertools.islice(self.names, start, None):
+            if not name.startswith(text) or len(found) >= limit:
+                break
+            add(name)
+
+        for name, key in zip(self.names, self.keys):
+            if len(found) >= limit or time.perf_counter() > deadline:
+                return found
+            if name not in seen and text in key:
+                add(name)
+
+        # Lettres dans l'ordre : les correspondances les plus resserrées d'abord
+        fuzzy = re.compile(".*?".join(re.escape(character) for character in text))
+        ranked = []
+        for name, key in zip(self.names, self.keys):
+            if time.perf_counter() > deadline:
+                break
+            match = fuzzy.search(key) if name not in seen else None
+            if match:
+                ranked.append((match.end() - match.start(), len(name), name))
+        for _, _, name in sorted(ranked)[:limit - len(found)]:
+            add(name)
+        return found
 
-        save_file_action = QAction(QIcon("assets/save.png"), "Save", self)
-        save_file_action.setStatusTip("Save current page")
-        save_file_action.triggered.connect(self.file_save)
-        file_menu.addAction(save_file_action)
 
-        save_as_menu = QMenu("Save as...", self)
-        save_as_menu.setIcon(QIcon("assets/saveas.png"))
-        txt_save_action = QAction(QIcon("assets/txt.png"), "Text file (*.txt)", self)
-        txt_save_action.setStatusTip("Save as a Text file")
-        txt_save_action.triggered.connect(lambda: self.file_saveas("Text File (*.txt)", ".txt"))
-        py_save_action = QAction(QIcon("assets/py.png"), "Python file(*.py)", self)
-        py_save_action.setStatusTip("Save as a Python file")
-        py_save_action.triggered.connect(lambda: self.file_saveas("Python File (*.py)", ".py"))
-        html_save_action = QAction(QIcon("assets/html.png"), "HTML file (*.html)", self)
-        html_save_action.setStatusTip("Save as a HTML file")
-        html_save_action.triggered.connect(lambda: self.file_saveas("HTML File (*.html)", ".html"))
-        css_save_action = QAction(QIcon("assets/css.png"), "CSS file (*.css)", self)
-        css_save_action.setStatusTip("Save as a CSS file")
-        css_save_action.triggered.connect(lambda: self.file_saveas("CSS File (*.css)", ".css"))
-        json_save_action = QAction(QIcon("assets/json.png"), "JSON file (*.json)", self)
-        json_save_action.setStatusTip("Save as a JSON file")
-        json_save_action.triggered.connect(lambda: self.file_saveas("JSON File (*.json)", ".json"))
-        save_as_menu.addAction(txt_save_action)
-        save_as_menu.addAction(py_save_action)
-        save_as_menu.addAction(html_save_action)
-        save_as_menu.addAction(css_save_action)
-        save_as_menu.addAction(json_save_action)
-        file_menu.addMenu(save_as_menu)
-        save_as_menu.setStyleSheet("""
-            QMenu {
-                background-color: #131e23;
-                color: white;
-                padding-left: 7px;
-            }
+# ----------------------------------------------------------------------------------------------------------------------------Classe IDE
+class IDE(QMainWindow):
+    first_painted = pyqtSignal()
+    interactive = pyqtSignal()
+    buffer_parsed = pyqtSignal(object, object)
+    buffer_checked = pyqtSignal(object, object)
+    json_task_done = pyqtSignal(object, object)
 
-            QMenu::item {
-                padding: 6px 20px;
-                border-radius: 5px;
-            }
+    def __init__(self):
+        super().__init__()
+        apply_theme()
 
-            QMenu::item:selected {
-                background-color: #2e436e;
-            }  
-        """)
+        # --------------------------------------------------------------Onglets
+        self.tabs = QTabWidget()
+        self.tabs.setObjectName("editor_tabs")
+        self.tabs.setTabsClosable(True)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.setMovable(False)
+        self.hydrated_tabs = collections.OrderedDict()
+        self.tabs.currentChanged.connect(self.activate_tab)
+        self.tabs.currentChanged.connect(self.update_cursor_position)
+        self.tabs.currentChanged.connect(lambda index: self.search_bar.text() and self.update_search())
 
-        # ------------------------------------------------Edit
-        edit_menu = self.menuBar().addMenu("&Edit")
+        startup_trace.mark("tabs")
 
-        undo_action = QAction(QIcon("assets/back_white.png"), "Undo", self)
-        undo_action.setStatusTip("Undo last change")
-        undo_action.triggered.connect(lambda: self.current_editor() and self.current_editor().undo())
-        edit_menu.addAction(undo_action)
+        # --------------------------------------------------------------Tree
+        self.tree_model = ProjectTreeModel(self)
+        self.tree_model.truncated.connect(lambda path: self.status_bar.showMessage(
+            f"Only the first {PROJECT_TREE_MAX_ENTRIES} entries of {path} are shown", 5000))
 
-        redo_action = QAction(QIcon("assets/forward_white.png"), "Redo", self)
-        redo_action.setStatusTip("Redo last change")
-        redo_action.triggered.connect(lambda: self.current_editor() and self.current_editor().redo())
-        edit_menu.addAction(redo_action)
+        self.tree_view = QTreeView()
+        self.tree_view.setObjectName("project_tree")
+        self.tree_view.setModel(self.tree_model)
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setColumnWidth(0, 200)
+        self.tree_view.setFixedWidth(300)
 
-        edit_menu.addSeparator()
+        self.tree_view.doubleClicked.connect(self.open_file_from_tree)
 
-        cut_action = QAction(QIcon("assets/cut.png"), "Cut", self)
-        cut_action.setStatusTip("Cut selected text")
-        cut_action.triggered.connect(lambda: self.current_editor() and self.current_editor().cut())
-        edit_menu.addAction(cut_action)
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.setObjectName("main_splitter")
 
-        copy_action = QAction(QIcon("assets/copy.png"), "Copy", self)
-        copy_action.setStatusTip("Copy selected text")
-        copy_action.triggered.connect(lambda: self.current_editor() and self.current_editor().copy())
-        edit_menu.addAction(copy_action)
+        file_explorer_widget = QWidget()
+        file_explorer_widget.setFixedWidth(318)
+        file_explorer_layout = QVBoxLayout(file_explorer_widget)
+        file_explorer_layout.addWidget(self.tree_view)
 
-        paste_action = QAction(QIcon("assets/paste.png"), "Paste", self)
-        paste_action.setStatusTip("Paste from clipboard")
-        paste_action.triggered.connect(lambda: self.current_editor() and self.current_editor().paste())
-        edit_menu.addAction(paste_action)
+        splitter.addWidget(file_explorer_widget)
 
-        edit_menu.addSeparator()
+        splitter.addWidget(self.tabs)
 
-        select_action = QAction(QIcon("assets/selectall.png"), "Select all", self)
-        select_action.setStatusTip("Select all text")
-        select_action.triggered.connect(lambda: self.current_editor() and self.current_editor().selectAll())
-        edit_menu.addAction(select_action)
+        self.setCentralWidget(splitter)
 
-        edit_menu.addSeparator()
+        startup_trace.mark("file tree")
 
-        wrap_action = QAction("Wrap text to window", self)
-        wrap_action.setStatusTip("Check to wrap text to window")
-        wrap_action.setCheckable(True)
-        wrap_action.setChecked(True)
-        wrap_action.triggered.connect(lambda: self.toggle_wrap(wrap_action.isChecked()))
-        edit_menu.addAction(wrap_action)
+        # --------------------------------------------------------------Status Bar
+        self.status_bar = self.statusBar()
 
-        # ------------------------------------------------Terminal
-        terminal_menu = self.menuBar().addMenu("&Terminal")
+        self.status_label = QLabel("Line : - | Column : - | Characters : -")
+        self.status_label.setContentsMargins(0, 0, 10, 0)
+        self.status_bar.addPermanentWidget(self.status_label)
 
-        terminal_action = QAction(QIcon("assets/terminal.png"), "Open terminal", self)
-        terminal_action.setStatusTip("Open a terminal in a different window")
-        terminal_action.triggered.connect(lambda: self.open_terminal())
-        terminal_menu.addAction(terminal_action)
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(16)
+        self.status_timer.timeout.connect(self.refresh_status_bar)
 
-        terminal_cd_action = QAction(QIcon("assets/terminal_cd.png"), "Open terminal in project's directory", self)
-        terminal_cd_action.setStatusTip("Open a terminal in the project's directory in a different window")
-        terminal_cd_action.triggered.connect(lambda: self.open_terminal_in_folder())
-        terminal_menu.addAction(terminal_cd_action)
+        self.encoding_label = QLabel("Encoding : UTF-8")
+        self.encoding_label.setAlignment(Qt.AlignRight)
+        self.encoding_label.setContentsMargins(0, 0, 10, 0)
+        self.status_bar.addPermanentWidget(self.encoding_label)
 
-        # ------------------------------------------------Editor
-        editor_menu = self.menuBar().addMenu("&Editor")
+        self.loaders = []
+        self.process_pool = None
+        self.find_in_files_dock = None
+        self.project_search = None
+        self.file_index = None
+        self.quick_open = None
+        self.run_dock = None
+        self.run_panel = None
+        self.interpreter_pool = None
+        self.profile_dock = None
+        self.symbol_index = None
+        self.outline_dock = None
+        self.json_dock = None
+        self.json_model = None
+        self.preview_dock = None
+        self.preview_tab = None
+        self.preview_renderer = None
+        self.preview_pending = False
+        self.preview_document = None
+        self.preview_digest = None
+        self.preview_path = None
+        self.preview_scroll = None
+        self.savers = {}
+        self.pending_saves = {}
+
+        # Session : écrite en arrière-plan, après une seconde sans changement
+        self.session_timer = QTimer(self)
+        self.session_timer.setSingleShot(True)
+        self.session_timer.setInterval(SESSION_SAVE_DELAY)
+        self.session_timer.timeout.connect(self.save_session)
+        self.session_writer = None
+        self.session_saved = None
+        self.restoring_session = False
+        self.tabs.currentChanged.connect(self.schedule_session_save)
+        self.tabs.tabBar().tabMoved.connect(self.schedule_session_save)
+        self.close_button_timer = QTimer(self)
+        self.close_button_timer.setInterval(0)
+        self.close_button_timer.timeout.connect(self.add_close_buttons)
+
+        # Symboles du buffer : analysés dans le pool une fois la frappe arrêtée
+        self.parse_timer = QTimer(self)
+        self.parse_timer.setSingleShot(True)
+        self.parse_timer.setInterval(SYMBOL_PARSE_DELAY)
+        self.parse_timer.timeout.connect(self.parse_current_buffer)
+        self.buffer_parsed.connect(self.finish_buffer_parse)
+        self.tabs.currentChanged.connect(self.update_outline)
+        self.tabs.currentChanged.connect(lambda index: self.schedule_buffer_parse(self.current_editor()))
+
+        # Diagnostics du buffer : vérifiés dans le pool après une pause de frappe, un seul contrôle par texte
+        self.diagnostics_timer = QTimer(self)
+        self.diagnostics_timer.setSingleShot(True)
+        self.diagnostics_timer.setInterval(DIAGNOSTICS_DELAY)
+        self.diagnostics_timer.timeout.connect(self.check_current_buffer)
+        self.buffer_checked.connect(self.finish_buffer_check)
+        self.tabs.currentChanged.connect(lambda index: self.schedule_buffer_check(self.current_editor()))
+        self.json_task_done.connect(self.finish_json_task)
+        self.tabs.currentChanged.connect(self.update_json_structure)
+
+        # Aperçu HTML : un instantané du texte est pris une fois la frappe arrêtée, jamais à chaque touche
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY)
+        self.preview_timer.timeout.connect(self.render_preview)
+        self.tabs.currentChanged.connect(lambda index: self.schedule_preview(self.current_editor()))
+
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setFixedWidth(150)
+        self.load_progress.setFixedHeight(14)
+        self.load_progress.hide()
+        self.status_bar.addWidget(self.load_progress)
+
+        self.load_cancel_button = QPushButton("Cancel")
+        self.load_cancel_button.clicked.connect(self.cancel_loading)
+        self.load_cancel_button.hide()
+        self.status_bar.addWidget(self.load_cancel_button)
 
-        new_tab_action = QAction(QIcon("assets/tab_white.png"), "Open a new tab", self)
-        new_tab_action.setStatusTip("Open a new blank tab in the editor")
-        new_tab_action.triggered.connect(lambda: self.add_new_tab())
-        editor_menu.addAction(new_tab_action)
+        # ------------------------------------------------File
+        startup_trace.mark("status bar")
 
-        # ------------------------------------------------Run
-        editor_menu = self.menuBar().addMenu("&Run")
+        # ------------------------------------------------Menus : seules les actions à raccourci existent avant la première ouverture
+        self.commands = CommandRegistry(self)
+        self.register_commands()
+        self.commands.install_shortcuts()
 
-        run_code_action = QAction(QIcon("assets/play.png"), "Run code", self)
-        run_code_action.setStatusTip("Execute the code in a new terminal")
-        run_code_action.triggered.connect(self.execute_code)
-        editor_menu.addAction(run_code_action)
+        self.defer_menu(self.menuBar().addMenu("&File"), self.build_file_menu)
+        self.defer_menu(self.menuBar().addMenu("&Edit"), self.build_edit_menu)
+        self.defer_menu(self.menuBar().addMenu("&Terminal"), self.build_terminal_menu)
+        self.defer_menu(self.menuBar().addMenu("&Editor"), self.build_editor_menu)
+        self.defer_menu(self.menuBar().addMenu("&Run"), self.build_run_menu)
+        startup_trace.mark("menus")
 
         # --------------------------------------------------------------Tool Bar
         self.toolbar = QToolBar()
@@ -512,59 +3644,69 @@ class IDE(QMainWindow):
         self.space3.setFixedWidth(35)
 
         self.select_folder_button = QPushButton()
-        self.select_folder_button.setIcon(QIcon("assets/folder.png"))
+        self.select_folder_button.setIcon(asset_cache.icon("assets/folder.png"))
         self.select_folder_button.clicked.connect(self.select_folder)
 
         self.new_tab_button = QPushButton()
-        self.new_tab_button.setIcon(QIcon("assets/tab.png"))
+        self.new_tab_button.setIcon(asset_cache.icon("assets/tab.png"))
         self.new_tab_button.clicked.connect(lambda: self.add_new_tab())
 
         self.command_bar = QLineEdit()
         self.command_bar.setPlaceholderText("Enter your command...")
         self.command_bar.returnPressed.connect(self.execute_command)
+        self.command_bar.textEdited.connect(self.complete_command)
+        self.command_prefix = ""
+        self.command_model = QStandardItemModel(self)
+        self.command_completer = QCompleter(self.command_model, self)
+        self.command_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.command_completer.setWidget(self.command_bar)
+        self.command_completer.popup().setObjectName("command_popup")
+        self.command_completer.activated[QModelIndex].connect(self.insert_completion)
         self.command_bar.setFixedWidth(400)
         self.command_bar.setFixedHeight(30)
-        self.command_bar.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #56789c;
-                border-radius: 10px;
-                padding: 5px 10px;
-                font-size: 12px;
-                background-color: #ecf0f1;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border: 2px solid #0297cd;
-                background-color: white;
-            }
-        """)
 
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search in the text...")
-        self.search_bar.returnPressed.connect(self.search_text)
+        self.search_bar.returnPressed.connect(lambda: self.search_text(True))
         self.search_bar.setFixedWidth(250)
         self.search_bar.setFixedHeight(30)
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #56789c;
-                border-radius: 10px;
-                padding: 5px 10px;
-                font-size: 12px;
-                background-color: #ecf0f1;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border: 2px solid #0297cd;
-                background-color: white;
-            }
-        """)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.update_search)
+        self.search_bar.textChanged.connect(self.search_timer.start)
+
+        self.search_regex_button = QPushButton(".*")
+        self.search_regex_button.setToolTip("Regular expression")
+        self.search_case_button = QPushButton("Aa")
+        self.search_case_button.setToolTip("Match case")
+        self.search_word_button = QPushButton("W")
+        self.search_word_button.setToolTip("Whole word")
+        for button in (self.search_regex_button, self.search_case_button, self.search_word_button):
+            button.setCheckable(True)
+            button.setFixedWidth(32)
+            button.toggled.connect(self.update_search)
+
+        self.search_previous_button = QPushButton()
+        self.search_previous_button.setIcon(asset_cache.icon("assets/back_white.png"))
+        self.search_previous_button.setToolTip("Previous match")
+        self.search_previous_button.clicked.connect(lambda: self.search_text(False))
+
+        self.search_next_button = QPushButton()
+        self.search_next_button.setIcon(asset_cache.icon("assets/forward_white.png"))
+        self.search_next_button.setToolTip("Next match")
+        self.search_next_button.clicked.connect(lambda: self.search_text(True))
+
+        self.search_counter = QLabel("")
+        self.search_counter.setFixedWidth(80)
 
         self.clear_highlight_button = QPushButton()
-        self.clear_highlight_button.setIcon(QIcon("assets/eraser.png"))
+        self.clear_highlight_button.setIcon(asset_cache.icon("assets/eraser.png"))
         self.clear_highlight_button.clicked.connect(lambda: self.clear_highlight(self.current_editor()))
 
         self.execute_code_button = QPushButton()
-        self.execute_code_button.setIcon(QIcon("assets/play.png"))
+        self.execute_code_button.setIcon(asset_cache.icon("assets/play.png"))
         self.execute_code_button.clicked.connect(lambda: self.execute_code(self.current_editor()))
 
         self.toolbar.addWidget(self.select_folder_button)
@@ -573,78 +3715,391 @@ class IDE(QMainWindow):
         self.toolbar.addWidget(self.command_bar)
         self.toolbar.addWidget(self.space2)
         self.toolbar.addWidget(self.search_bar)
+        self.toolbar.addWidget(self.search_regex_button)
+        self.toolbar.addWidget(self.search_case_button)
+        self.toolbar.addWidget(self.search_word_button)
+        self.toolbar.addWidget(self.search_previous_button)
+        self.toolbar.addWidget(self.search_next_button)
+        self.toolbar.addWidget(self.search_counter)
         self.toolbar.addWidget(self.clear_highlight_button)
         self.toolbar.addWidget(self.space3)
         self.toolbar.addWidget(self.execute_code_button)
 
-        self.toolbar.setStyleSheet("""
-            QToolBar {
-                background-color: #2f4a56;
-                border: none;
-                padding: 5px;
-            }
-
-            QToolBar QPushButton {
-                background-color: #56789c;
-                border-radius: 5px;
-                padding: 6px;
-                margin: 0 4px;
-            }
-
-            QToolBar QPushButton:hover {
-                background-color: #0297cd;
-            }
-
-            QToolBar QPushButton:pressed {
-                background-color: #01719a;
-            }                  
-        """)
-
         self.addToolBar(self.toolbar)
+        startup_trace.mark("toolbar")
 
         # --------------------------------------------------------------Propriétés de la fenêtre
         self.setWindowTitle("Codora Studio")
         self.resize(1315, 768)
         self.setMinimumSize(1315, 600)
-        self.setWindowIcon(QIcon("assets/logo.png"))
-
-        # --------------------------------------------------------------Layout vertical
-        layout = QVBoxLayout()
-
-        # --------------------------------------------------------------Editor
-        self.editor = QPlainTextEdit()
-        fixedfont = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-        fixedfont.setPointSize(12)
-        self.editor.setFont(fixedfont)
-        layout.addWidget(self.editor)
+        self.setWindowIcon(asset_cache.icon("assets/logo.png"))
 
         self.path = None
 
         # --------------------------------------------------------------Ajouter les onglets de démarrage
         self.add_home_tab()
+        startup_trace.mark("home tab")
+
+        # --------------------------------------------------------------Signaux de disponibilité
+        self.first_paint_done = False
+        # Le premier Ctrl+F5 trouve un interpréteur déjà chaud, sans retarder l'ouverture de la fenêtre
+        self.interactive.connect(self.warm_interpreters)
+
+    # --------------------------------------------------------------Première image : la fenêtre est visible, puis interactive dès que la boucle d'événements est libre
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            startup_trace.mark("first paint")
+            self.first_painted.emit()
+            QTimer.singleShot(0, self.on_interactive)
+
+    def on_interactive(self):
+        startup_trace.mark("interactive")
+        self.interactive.emit()
 
     # ----------------------------------------------------------------------------------------------------------------------------Fonctions IDE
 
-    # --------------------------------------------------------------Démarrer le script Python
-    def execute_code(self, editor):
+    # --------------------------------------------------------------Construire un menu à sa première ouverture
+    def defer_menu(self, menu, builder):
+        def build():
+            menu.aboutToShow.disconnect(build)
+            builder(menu)
+
+        menu.aboutToShow.connect(build)
+
+    # ------------------------------------------------Commandes : une seule définition pour les menus et la barre de commande
+    def register_commands(self):
+        register = self.commands.register
+        for extension, title, file_type in FILE_TYPES:
+            register(f"file -openas -{extension}", title, lambda file_type=file_type, extension=extension: self.file_open(file_type, f".{extension}"),
+                     icon=f"assets/{extension}.png", tip=f"Open a {file_type.split(' ')[0]} file")
+            register(f"file -saveas -{extension}", title, lambda file_type=file_type, extension=extension: self.file_saveas(file_type, f".{extension}"),
+                     icon=f"assets/{extension}.png", tip=f"Save as a {file_type.split(' ')[0]} file")
+        register("select -project", "Open project", self.select_folder,
+                 icon="assets/folder_white.png", tip="Open a project in the file tree view")
+        register("file -quickopen", "Quick open", self.show_quick_open, icon="assets/folder_white.png",
+                 tip="Open a file of the project by typing part of its name", shortcut="Ctrl+P")
+        register("file -save", "Save", self.file_save, icon="assets/save.png", tip="Save current page")
+
+        register("undo", "Undo", lambda: self.current_editor() and self.current_editor().undo(),
+                 icon="assets/back_white.png", tip="Undo last change")
+        register("redo", "Redo", lambda: self.current_editor() and self.current_editor().redo(),
+                 icon="assets/forward_white.png", tip="Redo last change")
+        register("cut", "Cut", lambda: self.current_editor() and self.current_editor().cut(),
+                 icon="assets/cut.png", tip="Cut selected text")
+        register("copy", "Copy", lambda: self.current_editor() and self.current_editor().copy(),
+                 icon="assets/copy.png", tip="Copy selected text")
+        register("paste", "Paste", lambda: self.current_editor() and self.current_editor().paste(),
+                 icon="assets/paste.png", tip="Paste from clipboard")
+        register("selectall", "Select all", lambda: self.current_editor() and self.current_editor().selectAll(),
+                 icon="assets/selectall.png", tip="Select all text")
+        register("wraptext", "Wrap text to window", self.toggle_wrap, tip="Check to wrap text to window", checkable=True)
+        register("find -project", "Find in project", self.show_find_in_files, icon="assets/folder_white.png",
+                 tip="Search the text in every file of the project", shortcut="Ctrl+Shift+F")
+
+        register("terminal", "Open terminal", self.open_terminal,
+                 icon="assets/terminal.png", tip="Open a terminal in a different window")
+        register("terminal -cd", "Open terminal in project's directory", self.open_terminal_in_folder,
+                 icon="assets/terminal_cd.png", tip="Open a terminal in the project's directory in a different window")
+
+        register("tab -add", "Open a new tab", self.add_new_tab,
+                 icon="assets/tab_white.png", tip="Open a new blank tab in the editor")
+        register("tab -close", "Close the tab", lambda: self.close_tab(self.tabs.currentIndex()), tip="Close the current tab")
+        register("home", "Welcome tab", self.add_home_tab, tip="Open the welcome tab")
+        register("view -outline", "Outline", self.show_outline,
+                 tip="Show the classes and functions of the current file", shortcut="Ctrl+Shift+O")
+        register("goto -definition", "Go to definition", self.go_to_definition,
+                 tip="Jump to the definition of the name under the cursor", shortcut="F12")
+        register("json -validate", "Validate JSON", self.validate_json_file, icon="assets/json.png",
+                 tip="Check the JSON file in the background and jump to the first error")
+        register("json -format", "Format JSON", lambda: self.format_json_file(4), icon="assets/json.png",
+                 tip="Indent the JSON file")
+        register("json -minify", "Minify JSON", lambda: self.format_json_file(None), icon="assets/json.png",
+                 tip="Remove the blanks of the JSON file")
+        register("view -json", "JSON structure", self.show_json_structure, icon="assets/json.png",
+                 tip="Browse the structure of the JSON file, read on demand")
+        register("view -preview", "Live preview", self.show_preview, icon="assets/html.png",
+                 tip="Show the HTML page and its stylesheets, refreshed after a typing pause")
+
+        register("run", "Run code", self.execute_code, icon="assets/play.png",
+                 tip="Execute the code in the run panel", shortcut="F5")
+        register("run -warm", "Run code (warm interpreter)", self.execute_code_warm, icon="assets/play.png",
+                 tip="Execute the buffer in an interpreter started in advance", shortcut="Ctrl+F5")
+        register("run -profile", "Run with profiler", self.execute_code_profiled, icon="assets/play.png",
+                 tip="Execute the code under the profiler and show its hotspots")
+        register("run -stop", "Stop", self.stop_code, tip="Stop the running code", shortcut="Shift+F5")
+        register("run -terminal", "Run code in a terminal", self.execute_code_in_terminal, icon="assets/play.png",
+                 tip="Execute the code in a new terminal")
+
+    # ------------------------------------------------File
+    def build_file_menu(self, file_menu):
+        open_menu = QMenu("Open a...", self)
+        open_menu.setIcon(asset_cache.icon("assets/open.png"))
+        for extension, title, file_type in FILE_TYPES:
+            open_menu.addAction(self.commands.action(f"file -openas -{extension}"))
+        file_menu.addMenu(open_menu)
 
-        container = self.tabs.currentWidget()
-        editor = container.findChild(QPlainTextEdit)
+        file_menu.addAction(self.commands.action("select -project"))
+        file_menu.addAction(self.commands.action("file -quickopen"))
+        file_menu.addAction(self.commands.action("file -save"))
+
+        save_as_menu = QMenu("Save as...", self)
+        save_as_menu.setIcon(asset_cache.icon("assets/saveas.png"))
+        for extension, title, file_type in FILE_TYPES:
+            save_as_menu.addAction(self.commands.action(f"file -saveas -{extension}"))
+        file_menu.addMenu(save_as_menu)
+
+    # ------------------------------------------------Edit
+    def build_edit_menu(self, edit_menu):
+        edit_menu.addAction(self.commands.action("undo"))
+        edit_menu.addAction(self.commands.action("redo"))
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.commands.action("cut"))
+        edit_menu.addAction(self.commands.action("copy"))
+        edit_menu.addAction(self.commands.action("paste"))
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.commands.action("selectall"))
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.commands.action("wraptext"))
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.commands.action("find -project"))
+
+    # ------------------------------------------------Terminal
+    def build_terminal_menu(self, terminal_menu):
+        terminal_menu.addAction(self.commands.action("terminal"))
+        terminal_menu.addAction(self.commands.action("terminal -cd"))
+
+    # ------------------------------------------------Editor
+    def build_editor_menu(self, editor_menu):
+        editor_menu.addAction(self.commands.action("tab -add"))
+        editor_menu.addSeparator()
+        editor_menu.addAction(self.commands.action("view -outline"))
+        editor_menu.addAction(self.commands.action("goto -definition"))
+        editor_menu.addSeparator()
+        for name in ("json -validate", "json -format", "json -minify", "view -json"):
+            editor_menu.addAction(self.commands.action(name))
+        editor_menu.addSeparator()
+        editor_menu.addAction(self.commands.action("view -preview"))
+
+    # ------------------------------------------------Run
+    def build_run_menu(self, run_menu):
+        for name in ("run", "run -warm", "run -profile", "run -stop", "run -terminal"):
+            run_menu.addAction(self.commands.action(name))
+
+    # --------------------------------------------------------------Script Python à exécuter pour un éditeur
+    def script_to_run(self, editor):
         script_path = getattr(editor, "current_file", None)
 
         if script_path:
             if not script_path.lower().endswith(".py"):
                 self.dialog_critical("Erreur : le fichier sélectionné n'est pas un fichier Python (.py)")
-                return
+                return None
 
         if not script_path:
-            temp_path = os.path.join(os.path.dirname(__file__), "temp_exec.py")
+            temp_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_exec.py")
             with open(temp_path, "w", encoding="utf-8") as f:
                 f.write(editor.toPlainText())
             script_path = temp_path
 
         if not os.path.exists(script_path):
             print(f"[ERROR] -- File {script_path} not found")
+            return None
+
+        return script_path
+
+    # --------------------------------------------------------------Démarrer le script Python dans le panneau d'exécution
+    def execute_code(self, editor=None):
+        editor = editor or self.current_editor()
+        if editor is None:
+            self.dialog_critical("Editor not found, please open a file.")
+            return
+
+        script_path = self.script_to_run(editor)
+        if script_path:
+            self.show_run_panel().run(sys.executable, ["-u", script_path], os.path.dirname(script_path))
+
+    def show_run_panel(self):
+        if self.run_dock is None:
+            self.run_panel = RunPanel()
+            self.run_dock = QDockWidget("Run", self)
+            self.run_dock.setObjectName("run_dock")
+            self.run_dock.setWidget(self.run_panel)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.run_dock)
+            if self.find_in_files_dock is not None:
+                self.tabifyDockWidget(self.find_in_files_dock, self.run_dock)
+            self.run_panel.run_finished.connect(self.finish_profiling)
+
+        self.run_dock.show()
+        self.run_dock.raise_()
+        return self.run_panel
+
+    # --------------------------------------------------------------Démarrer le tampon dans un interpréteur chaud, sans fichier temporaire
+    def execute_code_warm(self, editor=None):
+        editor = editor or self.current_editor()
+        if editor is None:
+            self.dialog_critical("Editor not found, please open a file.")
+            return
+
+        script_path = getattr(editor, "current_file", None)
+        if script_path and not script_path.lower().endswith(".py"):
+            self.dialog_critical("Erreur : le fichier sélectionné n'est pas un fichier Python (.py)")
+            return
+
+        if script_path:
+            working_directory = os.path.dirname(os.path.abspath(script_path))
+        else:
+            working_directory = getattr(self, "project_path", None) or QDir.homePath()
+
+        panel = self.show_run_panel()
+        panel.run_warm(self.warm_interpreters(), editor.toPlainText(), script_path or "<untitled>", working_directory)
+
+    # --------------------------------------------------------------Réserve d'interpréteurs chauds : lancée une fois la fenêtre interactive
+    def warm_interpreters(self):
+        if self.interpreter_pool is None:
+            self.interpreter_pool = InterpreterPool(parent=self)
+            # Sortie sans fermeture de la fenêtre (--startup-trace) : les interpréteurs sont arrêtés avant leur destruction
+            QApplication.instance().aboutToQuit.connect(self.interpreter_pool.close)
+        return self.interpreter_pool
+
+    # --------------------------------------------------------------Démarrer le tampon sous le profileur
+    def execute_code_profiled(self, editor=None):
+        editor = editor or self.current_editor()
+        if editor is None:
+            self.dialog_critical("Editor not found, please open a file.")
+            return
+
+        script_path = getattr(editor, "current_file", None)
+        if script_path and not script_path.lower().endswith(".py"):
+            self.dialog_critical("Erreur : le fichier sélectionné n'est pas un fichier Python (.py)")
+            return
+
+        if script_path:
+            filename = os.path.abspath(script_path)
+            working_directory = os.path.dirname(filename)
+        else:
+            filename = "<untitled>"
+            working_directory = getattr(self, "project_path", None) or QDir.homePath()
+
+        descriptor, results_path = tempfile.mkstemp(prefix="codora-profile-", suffix=".json")
+        os.close(descriptor)
+        request = json.dumps({"source": editor.toPlainText(), "filename": filename, "cwd": working_directory,
+                              "results": results_path, "interval": PROFILER_INTERVAL, "limit": PROFILER_MAX_FUNCTIONS})
+
+        panel = self.show_run_panel()
+        panel.run(sys.executable, ["-u", "-c", PROFILER_SOURCE], working_directory, (request + "\n").encode("utf-8"),
+                  f"$ profile {os.path.basename(filename)}", ("profile", results_path, editor, filename))
+
+    def finish_profiling(self, tag, code):
+        if not tag or tag[0] != "profile":
+            return
+        _, results_path, editor, filename = tag
+        try:
+            with open(results_path, "r", encoding="utf-8") as file:
+                results = json.load(file)
+        except (OSError, ValueError):
+            self.status_bar.showMessage("The profiled run was interrupted, no statistics were collected", 5000)
+            return
+        finally:
+            try:
+                os.remove(results_path)
+            except OSError:
+                pass
+        self.show_profile(results, editor, filename)
+
+    # --------------------------------------------------------------Tableau des points chauds et annotations de la marge
+    def show_profile(self, results, editor, filename):
+        if self.profile_dock is None:
+            self.profile_table = QTableWidget(0, 5)
+            self.profile_table.setHorizontalHeaderLabels(["Function", "Location", "Calls", "Own (ms)", "Total (ms)"])
+            self.profile_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+            self.profile_table.verticalHeader().hide()
+            self.profile_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            self.profile_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+            self.profile_table.cellActivated.connect(self.open_hotspot)
+            self.profile_table.cellClicked.connect(self.open_hotspot)
+            self.profile_table.setStyleSheet("""
+                QTableWidget {
+                    background-color: #1e1f22;
+                    color: #d5dce0;
+                    border: none;
+                }
+                QHeaderView::section {
+                    background-color: #38393c;
+                    color: white;
+                    border: none;
+                    padding: 4px;
+                }
+            """)
+
+            self.profile_dock = QDockWidget("Profiler", self)
+            self.profile_dock.setObjectName("profile_dock")
+            self.profile_dock.setWidget(self.profile_table)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.profile_dock)
+            if self.run_dock is not None:
+                self.tabifyDockWidget(self.run_dock, self.profile_dock)
+
+        self.profile_target = (editor, filename)
+        table = self.profile_table
+        table.setSortingEnabled(False)
+        table.setRowCount(len(results["functions"]))
+        for row, (path, line, name, calls, own, total) in enumerate(results["functions"]):
+            location = f"{os.path.basename(path)}:{line}" if line else path
+            items = [QTableWidgetItem(name), QTableWidgetItem(location)]
+            for value in (calls, round(own * 1000, 3), round(total * 1000, 3)):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)
+                items.append(item)
+            items[0].setData(Qt.UserRole, (path, line))
+            for column, item in enumerate(items):
+                table.setItem(row, column, item)
+        table.setSortingEnabled(True)
+        table.sortItems(4, Qt.DescendingOrder)
+
+        samples = max(results["samples"], 1)
+        costs = {int(line) - 1: count / samples for line, count in results["lines"].items()}
+        index = self.tab_index_for_editor(editor)
+        if index >= 0:
+            area = self.tabs.widget(index).findChild(LineNumberArea)
+            if area is not None:
+                area.set_line_costs(costs)
+
+        self.profile_dock.show()
+        self.profile_dock.raise_()
+
+    def open_hotspot(self, row, column):
+        item = self.profile_table.item(row, 0)
+        path, line = item.data(Qt.UserRole) if item is not None else (None, 0)
+        if not line:
+            return
+
+        editor, filename = self.profile_target
+        index = self.tab_index_for_editor(editor) if path == filename else -1
+        if index >= 0:
+            self.tabs.setCurrentIndex(index)
+            self.go_to_line(editor, line)
+        elif os.path.isfile(path):
+            self.open_file_at(path, line)
+
+    def tab_index_for_editor(self, editor):
+        for index in range(self.tabs.count()):
+            if self.tabs.widget(index).findChild(QPlainTextEdit) is editor:
+                return index
+        return -1
+
+    def stop_code(self):
+        if self.run_panel is not None:
+            self.run_panel.stop()
+
+    # --------------------------------------------------------------Démarrer le script Python dans un terminal externe
+    def execute_code_in_terminal(self, editor=None):
+        editor = editor or self.current_editor()
+        if editor is None:
+            self.dialog_critical("Editor not found, please open a file.")
+            return
+
+        script_path = self.script_to_run(editor)
+        if not script_path:
             return
 
         script_name = os.path.basename(script_path)
@@ -691,247 +4146,1144 @@ class IDE(QMainWindow):
             print(f"[ERROR] -- There was an error during starting tor executable : {e}")
 
     # --------------------------------------------------------------Application de la coloration syntaxique
-    def apply_highlighter(self, editor):
-        editor = self.current_editor()
+    def apply_highlighter(self, editor, expected_size=0):
+        editor = editor or self.current_editor()
         if editor:
-            self.highlighter = XMLHighlighter(editor.document())
-
-            editor.setStyleSheet("""
-                    QPlainTextEdit {
-                        background-color: #1e1f22;
-                        color: #d5dce0;
-                        font-family: Consolas, "Courier New", monospace;
-                        border: none;
-                    }
-                """)
-
-    # --------------------------------------------------------------Faire une recherche dans le code (Partie 1)
-    def search_text(self):
+            grammar = get_grammar(getattr(editor, "current_file", None))
+            highlighter = getattr(editor, "highlighter", None)
+
+            if highlighter is None or highlighter.grammar is not grammar:
+                if highlighter is not None:
+                    highlighter.setDocument(None)
+                if grammar is None:
+                    editor.highlighter = None
+                elif editor.document().blockCount() > BACKGROUND_HIGHLIGHT_BLOCKS or expected_size > BACKGROUND_HIGHLIGHT_BYTES:
+                    editor.highlighter = BackgroundHighlighter(editor, grammar)
+                else:
+                    editor.highlighter = SinglePassHighlighter(editor.document(), grammar)
+
+    # --------------------------------------------------------------Moteur de recherche de l'éditeur
+    def search_engine(self, editor):
+        engine = getattr(editor, "search", None)
+        if engine is None:
+            engine = editor.search = SearchEngine(editor)
+            engine.index_changed.connect(self.update_search_counter)
+        return engine
+
+    # --------------------------------------------------------------Appliquer la recherche en cours à l'éditeur actuel
+    def update_search(self):
+        editor = self.current_editor()
+        if editor is None:
+            self.search_counter.setText("")
+            return None
+
+        engine = self.search_engine(editor)
+        valid = engine.set_pattern(self.search_bar.text(), self.search_regex_button.isChecked(),
+                                   self.search_case_button.isChecked(), self.search_word_button.isChecked())
+        if not valid:
+            self.search_counter.setText("Invalid")
+        return engine
+
+    def update_search_counter(self):
+        editor = self.current_editor()
+        engine = getattr(editor, "search", None) if editor else None
+        if engine is not None and self.sender() in (engine, None):
+            self.search_counter.setText(engine.counter_text())
+
+    # --------------------------------------------------------------Faire une recherche dans le code
+    def search_text(self, forward=True):
+        editor = self.current_editor()
+
+        if editor is None:
+            self.dialog_critical("Please open a file.")
+            self.search_bar.clear()
+            return
+
+        engine = self.update_search()
+        search = self.search_bar.text()
+        if not search or engine.expression is None:
+            return
+
+        # Index pas encore complet : on ne parcourt que ce qu'il faut pour trouver la correspondance suivante
+        while not engine.complete() and not engine.has_match(forward):
+            engine.scan_slice()
+
+        if not engine.select_match(forward):
+            QMessageBox.information(self, "Warning", "The expression : \"" + search + "\" is not in the text",
+                                    QMessageBox.Ok)
+
+    # --------------------------------------------------------------Effacer la recherche
+    def clear_highlight(self, editor):
+        self.search_bar.clear()
+        if editor is not None:
+            self.search_engine(editor).clear()
+        self.search_counter.setText("")
+
+    # --------------------------------------------------------------Complétion de la commande en cours de saisie (la dernière d'une suite "a; b")
+    def complete_command(self, text):
+        prefix, separator, current = text.rpartition(";")
+        self.command_prefix = f"{prefix}; " if separator else ""
+
+        self.command_model.clear()
+        for name in self.commands.complete(current.strip(), COMMAND_COMPLETIONS):
+            item = QStandardItem(f"{name}    {self.commands.commands[name]['title']}")
+            item.setData(name, Qt.UserRole)
+            self.command_model.appendRow(item)
+
+        if current.strip() and self.command_model.rowCount():
+            self.command_completer.complete(self.command_bar.rect())
+        else:
+            self.command_completer.popup().hide()
+
+    def insert_completion(self, index):
+        self.command_bar.setText(self.command_prefix + index.data(Qt.UserRole))
+
+    # --------------------------------------------------------------Exécuter la commande demandée, ou une suite de commandes séparées par ";"
+    def execute_command(self):
+        commands = [command.strip() for command in self.command_bar.text().split(";") if command.strip()]
+        self.command_bar.clear()
+
+        for command in commands:
+            if not self.commands.run(command):
+                QMessageBox.warning(self, "Warning", f"The command \"{command}\" does not exist. Please verify or look at the help.",
+                                    QMessageBox.Ok)
+                return
+
+    # --------------------------------------------------------------Ouvrir le terminal
+    def open_terminal(self):
+        subprocess.Popen("start cmd", shell=True)
+
+    # --------------------------------------------------------------Ouvrir le terminal dans le dossier spécifié
+    def open_terminal_in_folder(self):
+        path = getattr(self, "project_path", QDir.homePath())
+
+        subprocess.Popen(f'start cmd /K "cd /d {path}"', shell=True)
+
+    # --------------------------------------------------------------Ouvrir un fichier depuis le file_model (Étape 1)
+    def open_file_from_tree(self, index):
+        file_path = self.tree_model.file_path(index)
+
+        if os.path.isfile(file_path):
+            self.add_file_from_tree(file_path)
+
+    # --------------------------------------------------------------Ouvrir un fichier depuis le file_model (Étape 2)
+    def add_file_from_tree(self, file_path, activate=True):
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            self.dialog_critical(f"Erreur à l'ouverture du fichier : {str(e)}")
+            return
+
+        if size >= LARGE_FILE_THRESHOLD:
+            return self.open_large_file(file_path, activate)
+
+        # L'onglet ne garde qu'une référence au fichier, l'éditeur est construit à sa première activation
+        index = self.tabs.addTab(self.create_tab(file_path), self.get_file_icon(file_path), os.path.basename(file_path))
+        if activate:
+            self.tabs.setCurrentIndex(index)
+        self.schedule_session_save()
+
+    # --------------------------------------------------------------Fabrique des onglets d'édition : un conteneur vide, l'éditeur vient à l'activation
+    def create_tab(self, file_path=None):
+        container = QWidget()
+        container.setLayout(QHBoxLayout())
+        container.path = file_path
+        container.hydrated = False
+        container.snapshot = None
+        return container
+
+    # --------------------------------------------------------------Construire l'éditeur d'un onglet
+    def build_editor(self, container):
+        editor = QPlainTextEdit()
+        editor.setProperty("role", "editor")
+        editor.setFont(asset_cache.fixed_font(12))
+
+        editor.stats = DocumentStats(editor.document())
+        editor.cursorPositionChanged.connect(self.update_cursor_position)
+
+        line_number_area = LineNumberArea(editor)
+        container.layout().addWidget(line_number_area)
+        container.layout().addWidget(editor)
+
+        editor.current_file = getattr(container, "path", None)
+        editor.document().modificationChanged.connect(lambda modified: self.update_tab_title(container))
+        editor.textChanged.connect(lambda: self.schedule_buffer_parse(editor))
+        editor.textChanged.connect(lambda: self.schedule_buffer_check(editor))
+        editor.textChanged.connect(lambda: self.schedule_preview(editor))
+        return editor
+
+    # --------------------------------------------------------------Activation d'un onglet : construction à la demande et budget mémoire
+    def activate_tab(self, index):
+        container = self.tabs.widget(index)
+        hydrated = getattr(container, "hydrated", None)
+        if hydrated is None:
+            return
+        if not hydrated:
+            self.hydrate_tab(container)
+
+        self.hydrated_tabs[container] = None
+        self.hydrated_tabs.move_to_end(container)
+
+        characters = sum(tab.findChild(QPlainTextEdit).document().characterCount() for tab in self.hydrated_tabs)
+        for tab in list(self.hydrated_tabs):
+            if len(self.hydrated_tabs) <= TAB_HYDRATED_MAX and characters <= TAB_HYDRATED_CHARACTERS:
+                break
+            if tab is container or self.tab_is_busy(tab):
+                continue
+            characters -= tab.findChild(QPlainTextEdit).document().characterCount()
+            self.dehydrate_tab(tab)
+
+    # --------------------------------------------------------------Un onglet en cours de chargement ou d'enregistrement garde son éditeur
+    def tab_is_busy(self, container):
+        path = getattr(container, "path", None)
+        return (getattr(container, "loader", None) is not None
+                or (path is not None and (path in self.savers or path in self.pending_saves)))
+
+    # --------------------------------------------------------------Reconstruire l'éditeur depuis l'instantané ou le fichier
+    def hydrate_tab(self, container):
+        container.hydrated = True
+        editor = self.build_editor(container)
+
+        if container.snapshot is not None:
+            editor.setPlainText(zlib.decompress(container.snapshot).decode("utf-8"))
+            container.snapshot = None
+            editor.saved_hash = getattr(container, "saved_hash", None)
+            editor.document().setModified(getattr(container, "modified", False))
+            self.apply_highlighter(editor)
+            self.restore_editor_state(container, editor)
+            return
+
+        if not container.path:
+            self.apply_highlighter(editor)
+            self.update_cursor_position()
+            return
+
+        try:
+            size = os.path.getsize(container.path)
+        except OSError:
+            size = 0
+        self.apply_highlighter(editor, size)
+        self.load_file(container, editor, container.path)
+
+    # --------------------------------------------------------------Ne garder que le chemin (fichier propre) ou un instantané compressé (modifié)
+    def dehydrate_tab(self, container):
+        editor = container.findChild(QPlainTextEdit)
+        document = editor.document()
+        cursor = editor.textCursor()
+
+        container.modified = document.isModified()
+        container.saved_hash = getattr(editor, "saved_hash", None)
+        if getattr(editor, "diagnostics_future", None) is not None:
+            editor.diagnostics_future.cancel()
+        container.cursor_state = (cursor.anchor(), cursor.position())
+        container.scroll_state = (editor.verticalScrollBar().value(), editor.horizontalScrollBar().value())
+        container.wrap_mode = editor.lineWrapMode()
+        if container.modified or not getattr(container, "path", None):
+            container.snapshot = zlib.compress(editor.toPlainText().encode("utf-8"), 1)
+
+        for widget in (container.findChild(LineNumberArea), editor):
+            container.layout().removeWidget(widget)
+            widget.deleteLater()
+        container.hydrated = False
+        self.hydrated_tabs.pop(container, None)
+
+    # --------------------------------------------------------------Curseur, défilement et retour à la ligne de l'onglet avant sa mise en veille
+    def restore_editor_state(self, container, editor):
+        editor.setLineWrapMode(getattr(container, "wrap_mode", QPlainTextEdit.WidgetWidth))
+
+        cursor_state = getattr(container, "cursor_state", None)
+        if cursor_state is None:
+            return
+        last = editor.document().characterCount() - 1
+        cursor = editor.textCursor()
+        cursor.setPosition(min(cursor_state[0], last))
+        cursor.setPosition(min(cursor_state[1], last), QTextCursor.KeepAnchor)
+        editor.setTextCursor(cursor)
+
+        vertical, horizontal = container.scroll_state
+        editor.verticalScrollBar().setValue(vertical)
+        editor.horizontalScrollBar().setValue(horizontal)
+
+    # --------------------------------------------------------------Charger un fichier en arrière-plan
+    def load_file(self, container, editor, file_path):
+        loader = FileLoader(file_path, self)
+        container.loader = loader
+        self.loaders.append(loader)
+
+        editor.setReadOnly(True)
+        editor.setUndoRedoEnabled(False)
+
+        loader.chunk_loaded.connect(lambda text: self.append_loaded_chunk(editor, loader, text))
+        loader.progress.connect(self.update_load_progress)
+        loader.failed.connect(lambda error: self.dialog_critical(f"Erreur à l'ouverture du fichier : {error}"))
+        loader.finished.connect(lambda: self.finish_loading(container, editor, loader))
+
+        self.update_load_progress()
+        loader.start()
+
+    # --------------------------------------------------------------Ajouter un morceau chargé au document
+    def append_loaded_chunk(self, editor, loader, text):
+        first_chunk = editor.document().isEmpty()
+
+        cursor = QTextCursor(editor.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+
+        # Le curseur de l'éditeur reste en haut du fichier pendant la suite du chargement
+        if first_chunk:
+            editor.moveCursor(QTextCursor.Start)
+        loader.chunk_consumed()
+
+    # --------------------------------------------------------------Fin du chargement
+    def finish_loading(self, container, editor, loader):
+        if loader in self.loaders:
+            self.loaders.remove(loader)
+        container.loader = None
+        self.update_load_progress()
+
+        # Chargement annulé ou en erreur : l'onglet incomplet est retiré
+        if loader.cancelled or loader.error:
+            self.hydrated_tabs.pop(container, None)
+            index = self.tabs.indexOf(container)
+            if index >= 0:
+                self.tabs.removeTab(index)
+                if self.tabs.count() == 1:
+                    self.tabs.setMovable(False)
+            container.deleteLater()
+            if loader.cancelled:
+                self.status_bar.showMessage(f"Loading of {os.path.basename(loader.file_path)} cancelled", 3000)
+            return
+
+        editor.setReadOnly(False)
+        editor.setUndoRedoEnabled(True)
+        editor.document().setModified(False)
+        editor.saved_hash = loader.hash.hexdigest()
+
+        pending_line = getattr(container, "pending_line", None)
+        if pending_line:
+            container.pending_line = None
+            self.go_to_line(editor, pending_line)
+        else:
+            self.restore_editor_state(container, editor)
+        self.update_cursor_position()
+
+    # --------------------------------------------------------------Progression des chargements dans la barre de statut
+    def update_load_progress(self, *args):
+        if not self.loaders:
+            self.load_progress.hide()
+            self.load_cancel_button.hide()
+            return
+
+        total = sum(loader.total for loader in self.loaders)
+        read = sum(loader.read for loader in self.loaders)
+        self.load_progress.setValue(int(read * 100 / total) if total else 0)
+        self.load_progress.show()
+        self.load_cancel_button.show()
+
+    # --------------------------------------------------------------Annuler les chargements en cours
+    def cancel_loading(self):
+        for loader in list(self.loaders):
+            loader.cancel()
+
+    # --------------------------------------------------------------Ouvrir un gros fichier en lecture seule
+    def open_large_file(self, file_path, activate=True):
+        try:
+            view = LargeFileView(file_path)
+        except Exception as e:
+            self.dialog_critical(f"Erreur à l'ouverture du fichier : {str(e)}")
+            return
+
+        view.position_changed.connect(self.update_cursor_position)
+
+        index = self.tabs.addTab(view, self.get_file_icon(file_path), os.path.basename(file_path))
+        self.tabs.setTabToolTip(index, f"{file_path} (read-only large file mode)")
+        if activate:
+            self.tabs.setCurrentIndex(index)
+        self.schedule_session_save()
+
+    # --------------------------------------------------------------Pool de processus partagé pour les traitements lourds
+    def worker_pool(self):
+        if self.process_pool is None:
+            self.process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count() or 2)
+        return self.process_pool
+
+    # --------------------------------------------------------------Onglet déjà ouvert pour un fichier
+    def find_tab_for_path(self, file_path):
+        target = os.path.normcase(os.path.abspath(file_path))
+        for index in range(self.tabs.count()):
+            path = getattr(self.tabs.widget(index), "path", None)
+            if path and os.path.normcase(os.path.abspath(path)) == target:
+                return index
+        return -1
+
+    # --------------------------------------------------------------Ouvrir un fichier à une ligne donnée
+    def open_file_at(self, file_path, line):
+        index = self.find_tab_for_path(file_path)
+        if index < 0:
+            self.add_file_from_tree(file_path)
+            index = self.find_tab_for_path(file_path)
+            if index < 0:
+                return
+
+        self.tabs.setCurrentIndex(index)
+        container = self.tabs.widget(index)
+
+        if isinstance(container, LargeFileView):
+            container.verticalScrollBar().setValue(line - 1)
+        elif getattr(container, "loader", None) is not None:
+            container.pending_line = line
+        else:
+            self.go_to_line(container.findChild(QPlainTextEdit), line)
+
+    def go_to_line(self, editor, line, column=0):
+        block = editor.document().findBlockByNumber(max(line - 1, 0))
+        if not block.isValid():
+            return
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.Right, QTextCursor.MoveAnchor, min(column, block.length() - 1))
+        editor.setTextCursor(cursor)
+        editor.centerCursor()
+        editor.setFocus()
+
+    # --------------------------------------------------------------Panneau de recherche dans le projet
+    def show_find_in_files(self):
+        if self.find_in_files_dock is None:
+            self.find_in_files_dock = QDockWidget("Find in project", self)
+            self.find_in_files_dock.setObjectName("find_in_files_dock")
+
+            panel = QWidget()
+            layout = QVBoxLayout(panel)
+            layout.setContentsMargins(6, 6, 6, 6)
+
+            row = QHBoxLayout()
+            self.project_search_bar = QLineEdit()
+            self.project_search_bar.setPlaceholderText("Search in the project...")
+            self.project_search_bar.returnPressed.connect(self.start_project_search)
+            self.project_regex_box = QCheckBox("Regex")
+            self.project_case_box = QCheckBox("Match case")
+            self.project_word_box = QCheckBox("Whole word")
+            self.project_search_button = QPushButton("Search")
+            self.project_search_button.clicked.connect(self.start_project_search)
+            self.project_cancel_button = QPushButton("Cancel")
+            self.project_cancel_button.clicked.connect(self.cancel_project_search)
+            self.project_cancel_button.setEnabled(False)
+            self.project_search_status = QLabel("")
+
+            row.addWidget(self.project_search_bar)
+            row.addWidget(self.project_regex_box)
+            row.addWidget(self.project_case_box)
+            row.addWidget(self.project_word_box)
+            row.addWidget(self.project_search_button)
+            row.addWidget(self.project_cancel_button)
+            row.addWidget(self.project_search_status)
+            layout.addLayout(row)
+
+            self.project_results = QTreeWidget()
+            self.project_results.setHeaderHidden(True)
+            self.project_results.setUniformRowHeights(True)
+            self.project_results.itemActivated.connect(self.open_project_result)
+            self.project_results.itemClicked.connect(self.open_project_result)
+            layout.addWidget(self.project_results)
+
+            panel.setStyleSheet("""
+                QWidget {
+                    background-color: #38393c;
+                    color: white;
+                }
+                QLineEdit, QTreeWidget {
+                    background-color: #1e1f22;
+                    border: none;
+                    padding: 4px;
+                }
+                QPushButton {
+                    background-color: #56789c;
+                    border-radius: 5px;
+                    padding: 4px 10px;
+                }
+                QPushButton:hover {
+                    background-color: #0297cd;
+                }
+            """)
+
+            self.find_in_files_dock.setWidget(panel)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.find_in_files_dock)
+
+        self.find_in_files_dock.show()
+        self.find_in_files_dock.raise_()
         editor = self.current_editor()
+        if editor is not None and editor.textCursor().hasSelection():
+            self.project_search_bar.setText(editor.textCursor().selectedText())
+        self.project_search_bar.setFocus()
+
+    # --------------------------------------------------------------Lancer la recherche dans le projet
+    def start_project_search(self):
+        project_path = getattr(self, "project_path", None)
+        if not project_path:
+            self.dialog_critical("Please open a project first.")
+            return
+
+        text = self.project_search_bar.text()
+        if not text:
+            return
+
+        query = (text, self.project_regex_box.isChecked(), self.project_case_box.isChecked(),
+                 self.project_word_box.isChecked())
+        try:
+            compile_search(*query)
+        except re.error as e:
+            self.project_search_status.setText(f"Invalid expression : {e}")
+            return
 
-        if editor is None:
-            self.dialog_critical("Please open a file.")
-            self.search_bar.clear()
+        self.cancel_project_search()
+        self.project_results.clear()
+        self.project_search_started = time.perf_counter()
+        self.project_first_hit = None
+
+        search = ProjectSearch(project_path, query, self.worker_pool(), self)
+        search.results_found.connect(lambda results: self.add_project_results(search, results))
+        search.progress.connect(lambda files, matches: self.update_project_search_status(search, files, matches))
+        search.finished.connect(lambda: self.finish_project_search(search))
+        self.project_search = search
+        self.project_cancel_button.setEnabled(True)
+        search.start()
+
+    def add_project_results(self, search, results):
+        if search is not self.project_search:
+            return
+        if self.project_first_hit is None:
+            self.project_first_hit = time.perf_counter() - self.project_search_started
+
+        for path, matches in results:
+            relative = os.path.relpath(path, search.root)
+            file_item = QTreeWidgetItem([f"{relative} ({len(matches)})"])
+            file_item.setData(0, Qt.UserRole, (path, matches[0][0]))
+            for line, column, text in matches:
+                match_item = QTreeWidgetItem([f"{line} : {text}"])
+                match_item.setData(0, Qt.UserRole, (path, line))
+                file_item.addChild(match_item)
+            self.project_results.addTopLevelItem(file_item)
+
+    def update_project_search_status(self, search, files, matches):
+        if search is self.project_search:
+            self.project_search_status.setText(f"{matches} matches in {files} files...")
+
+    def finish_project_search(self, search):
+        if search is not self.project_search:
             return
+        self.project_search = None
+        self.project_cancel_button.setEnabled(False)
 
-        text = editor.toPlainText()
-        search = self.search_bar.text()
+        elapsed = time.perf_counter() - self.project_search_started
+        first_hit = f", first hit after {self.project_first_hit * 1000:.0f} ms" if self.project_first_hit else ""
+        state = "cancelled" if search.cancelled else f"done in {elapsed:.2f} s{first_hit}"
+        self.project_search_status.setText(f"{search.matches} matches in {search.files} files ({state})")
 
-        if search in text:
-            self.highlight_text(editor, search)
-        else:
-            self.search_bar.clear()
-            QMessageBox.information(self, "Warning", "The expression : \"" + search + "\" is not in the text",
-                                    QMessageBox.Ok)
+    def cancel_project_search(self):
+        if self.project_search is not None:
+            self.project_search.cancel()
 
-    # --------------------------------------------------------------Faire une recherche dans le code (Partie 2)
-    def highlight_text(self, editor, search):
-        cursor = editor.textCursor()
-        format = QTextCharFormat()
-        format.setBackground(QColor("yellow"))
+    def open_project_result(self, item):
+        data = item.data(0, Qt.UserRole)
+        if data:
+            self.open_file_at(*data)
 
-        cursor.movePosition(QTextCursor.Start)
-        editor.setTextCursor(cursor)
+    # --------------------------------------------------------------Sélectionner un dossier
+    def select_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Choisir un dossier")
+        if folder:
+            self.open_project(folder)
+
+    def open_project(self, folder):
+        self.project_path = folder
+        self.tree_view.setRootIndex(self.tree_model.set_root(folder))
+
+        if self.file_index is not None:
+            self.file_index.close()
+            self.file_index.deleteLater()
+        self.file_index = FileIndex(folder, self)
+        self.file_index.changed.connect(self.update_quick_open)
+        self.file_index.environments_found.connect(self.tree_model.set_environments)
+
+        if self.symbol_index is not None:
+            self.symbol_index.close()
+            self.symbol_index.deleteLater()
+        self.symbol_index = SymbolIndex(folder, self.worker_pool(), self)
+        self.symbol_index.changed.connect(self.on_symbols_changed)
+        self.schedule_session_save()
+
+    # --------------------------------------------------------------Ouverture rapide d'un fichier du projet
+    def show_quick_open(self):
+        if self.file_index is None:
+            self.dialog_critical("Please open a project first.")
+            return
 
-        while True:
-            cursor = editor.document().find(search, cursor)
+        if self.quick_open is None:
+            self.quick_open = QDialog(self, Qt.Popup)
+            self.quick_open.setMinimumWidth(600)
+            layout = QVBoxLayout(self.quick_open)
+            layout.setContentsMargins(6, 6, 6, 6)
+
+            self.quick_open_bar = QLineEdit()
+            self.quick_open_bar.setPlaceholderText("Type a file name...")
+            self.quick_open_bar.textChanged.connect(self.update_quick_open)
+            self.quick_open_bar.returnPressed.connect(self.open_quick_open_result)
+            self.quick_open_bar.installEventFilter(self)
+            layout.addWidget(self.quick_open_bar)
+
+            self.quick_open_list = QListWidget()
+            self.quick_open_list.setUniformItemSizes(True)
+            self.quick_open_list.itemActivated.connect(self.open_quick_open_result)
+            layout.addWidget(self.quick_open_list)
+
+            self.quick_open.setStyleSheet("""
+                QDialog {
+                    background-color: #38393c;
+                }
+                QLineEdit, QListWidget {
+                    background-color: #1e1f22;
+                    color: white;
+                    border: none;
+                    padding: 4px;
+                }
+                QListWidget::item:selected {
+                    background-color: #2e436e;
+                }
+            """)
 
-            if cursor.isNull():
-                break
+        geometry = self.geometry()
+        self.quick_open.move(geometry.center().x() - self.quick_open.width() // 2, geometry.top() + 80)
+        self.quick_open_bar.clear()
+        self.update_quick_open()
+        self.quick_open.show()
+        self.quick_open_bar.setFocus()
 
-            cursor.mergeCharFormat(format)
+    def update_quick_open(self):
+        if self.quick_open is None or (self.sender() is self.file_index and not self.quick_open.isVisible()):
+            return
 
-    # --------------------------------------------------------------Effacer la recherche
-    def clear_highlight(self, editor):
-        self.search_bar.clear()
-        cursor = editor.textCursor()
-        cursor.select(QTextCursor.Document)
-        format = QTextCharFormat()
-        format.setBackground(QColor("transparent"))
-        cursor.mergeCharFormat(format)
+        self.quick_open_list.clear()
+        if not self.file_index.ready:
+            self.quick_open_list.addItem("Indexing the project...")
+            return
 
-    # --------------------------------------------------------------Exécuter la commande demandée
-    def execute_command(self):
+        for path in self.file_index.match(self.quick_open_bar.text()):
+            directory, _, name = path.rpartition("/")
+            item = QListWidgetItem(self.get_file_icon(path), f"{name}    {directory}" if directory else name)
+            item.setData(Qt.UserRole, os.path.join(self.file_index.root, path))
+            self.quick_open_list.addItem(item)
+        self.quick_open_list.setCurrentRow(0)
 
-        editor = self.current_editor()
+    def open_quick_open_result(self, item=None):
+        item = item or self.quick_open_list.currentItem()
+        path = item.data(Qt.UserRole) if item is not None else None
+        if not path:
+            return
 
-        if editor is None:
-            self.dialog_critical("Editor not found, please open a file.")
-            self.command_bar.clear()
-            return
-
-        command = self.command_bar.text()
-        if command == "terminal":
-            self.open_terminal()
-            self.command_bar.clear()
-        elif command == "terminal -cd":
-            self.open_terminal_in_folder()
-            self.command_bar.clear()
-        elif command == "select -project":
-            self.select_folder()
-            self.command_bar.clear()
-        elif command == "home":
-            self.add_home_tab()
-            self.command_bar.clear()
-        elif command == "tab -add":
-            self.add_new_tab()
-            self.command_bar.clear()
-        elif command == "tab -close":
-            index = self.tabs.currentIndex()
-            self.close_tab(index)
-            self.command_bar.clear()
-        elif command == "run":
-            self.execute_code()
-            self.command_bar.clear()
-        elif command == "file -save":
-            self.file_save()
-            self.command_bar.clear()
-            self.command_bar.setPlaceholderText("Successfully saved the file...")
-            QTimer.singleShot(2000, lambda: self.command_bar.setPlaceholderText("Enter your command..."))
-        elif command == "file -saveas -txt":
-            self.file_saveas("Text File (*.txt)", ".txt")
-            self.command_bar.clear()
-        elif command == "file -saveas -py":
-            self.file_saveas("Python File (*.py)", ".py")
-            self.command_bar.clear()
-        elif command == "file -saveas -html":
-            self.file_saveas("HTML File (*.html)", ".html")
-            self.command_bar.clear()
-        elif command == "file -saveas -css":
-            self.file_saveas("CSS File (*.css)", ".css")
-            self.command_bar.clear()
-        elif command == "file -saveas -json":
-            self.file_saveas("JSON File (*.json)", ".json")
-            self.command_bar.clear()
-        elif command == "file -openas -txt":
-            self.file_open("Text File (*.txt)", ".txt")
-            self.command_bar.clear()
-        elif command == "file -openas -py":
-            self.file_open("Python File (*.py)", ".py")
-            self.command_bar.clear()
-        elif command == "file -openas -html":
-            self.file_open("HTML File (*.html)", ".html")
-            self.command_bar.clear()
-        elif command == "file -openas -css":
-            self.file_open("CSS File (*.css)", ".css")
-            self.command_bar.clear()
-        elif command == "file -openas -json":
-            self.file_open("JSON File (*.json)", ".json")
-            self.command_bar.clear()
-        elif command == "undo":
-            self.current_editor()
-            self.current_editor().undo()
-            self.command_bar.clear()
-        elif command == "redo":
-            self.current_editor()
-            self.current_editor().redo()
-            self.command_bar.clear()
-        elif command == "copy":
-            self.current_editor()
-            self.current_editor().copy()
-            self.command_bar.clear()
-        elif command == "paste":
-            self.current_editor()
-            self.current_editor().paste()
-            self.command_bar.clear()
-        elif command == "cut":
-            self.current_editor()
-            self.current_editor().cut()
-            self.command_bar.clear()
-        elif command == "selectall":
-            self.current_editor()
-            self.current_editor().selectAll()
-            self.command_bar.clear()
-        elif command == "wraptext":
-            editor = self.current_editor()
-            if editor:
-                current_mode = editor.lineWrapMode()
-                editor.setLineWrapMode(
-                    QPlainTextEdit.WidgetWidth if current_mode == QPlainTextEdit.NoWrap else QPlainTextEdit.NoWrap)
-            self.command_bar.clear()
+        self.quick_open.hide()
+        index = self.find_tab_for_path(path)
+        if index >= 0:
+            self.tabs.setCurrentIndex(index)
         else:
-            self.command_bar.clear()
-            QMessageBox.warning(self, "Warning", "This command does not exist. Please verify or look at the help.",
-                                QMessageBox.Ok)
-
-    # --------------------------------------------------------------Ouvrir le terminal
-    def open_terminal(self):
-        subprocess.Popen("start cmd", shell=True)
+            self.add_file_from_tree(path)
+
+    def eventFilter(self, obj, event):
+        # Les flèches restent dans la liste pendant la saisie
+        if self.quick_open is not None and obj is self.quick_open_bar and event.type() == QEvent.KeyPress \
+                and event.key() in (Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown):
+            QApplication.sendEvent(self.quick_open_list, event)
+            return True
+        return super().eventFilter(obj, event)
+
+    # --------------------------------------------------------------Symboles du buffer en cours d'édition
+    def schedule_buffer_parse(self, editor):
+        if editor is self.current_editor() and (getattr(editor, "current_file", None) or "").endswith(".py"):
+            self.parse_timer.start()
+
+    def parse_current_buffer(self):
+        editor = self.current_editor()
+        # Pendant un chargement, le dernier morceau relance la minuterie
+        if editor is None or getattr(self.current_tab(), "loader", None) is not None:
+            return
+        revision = editor.document().revision()
+        future = self.worker_pool().submit(parse_symbol_buffer, editor.toPlainText())
+        future.add_done_callback(lambda future: self.buffer_parsed.emit((editor, revision), future))
+
+    def finish_buffer_parse(self, target, future):
+        editor, revision = target
+        # L'éditeur a changé d'onglet ou de contenu entre-temps : le résultat est périmé
+        if editor is not self.current_editor() or editor.document().revision() != revision:
+            return
+        try:
+            symbols = future.result()
+        except Exception as e:
+            print(f"[ERROR] -- Could not parse the buffer : {e}")
+            return
+        # Code en cours de frappe qui ne compile pas : on garde les derniers symboles valides
+        if symbols is not None:
+            editor.symbols = symbols
+            self.update_outline()
+
+    # --------------------------------------------------------------Diagnostics du buffer en cours d'édition
+    def buffer_kind(self, editor):
+        extension = os.path.splitext(getattr(editor, "current_file", None) or "")[1].lower()
+        return {".py": "python", ".pyw": "python", ".json": "json"}.get(extension)
+
+    def schedule_buffer_check(self, editor):
+        if editor is not None and editor is self.current_editor() and self.buffer_kind(editor):
+            # Une vérification pas encore démarrée ne sert plus à rien
+            if getattr(editor, "diagnostics_future", None) is not None:
+                editor.diagnostics_future.cancel()
+            self.diagnostics_timer.start()
+
+    def check_current_buffer(self):
+        editor = self.current_editor()
+        if editor is None or getattr(self.current_tab(), "loader", None) is not None:
+            return
+        kind = self.buffer_kind(editor)
+        if kind is None:
+            return
+        text = editor.toPlainText()
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        if digest == getattr(editor, "checked_hash", None):
+            return
+        # Cette révision est déjà en cours de vérification : son résultat sera appliqué
+        revision = editor.document().revision()
+        future = getattr(editor, "diagnostics_future", None)
+        if future is not None and not future.done() and revision == editor.checking_revision:
+            return
 
-    # --------------------------------------------------------------Ouvrir le terminal dans le dossier spécifié
-    def open_terminal_in_folder(self):
-        path = getattr(self, "project_path", QDir.homePath())
+        future = self.worker_pool().submit(check_buffer, text, kind)
+        editor.diagnostics_future = future
+        editor.checking_revision = revision
+        future.add_done_callback(lambda future: self.buffer_checked.emit((editor, revision, digest), future))
 
-        subprocess.Popen(f'start cmd /K "cd /d {path}"', shell=True)
+    def finish_buffer_check(self, target, future):
+        editor, revision, digest = target
+        # Résultat annulé ou périmé : le texte n'est pas marqué vérifié, il le sera au prochain passage
+        if future.cancelled():
+            return
+        if editor is not self.current_editor() or editor.document().revision() != revision:
+            return
+        editor.diagnostics_future = None
+        try:
+            diagnostics = future.result()
+        except Exception as e:
+            print(f"[ERROR] -- Could not check the buffer : {e}")
+            return
+        editor.checked_hash = digest
+        self.apply_diagnostics(editor, diagnostics)
+
+    def apply_diagnostics(self, editor, diagnostics):
+        document = editor.document()
+        selections = []
+        markers = {}
+        for line, column, severity, message in diagnostics:
+            block = document.findBlockByNumber(min(line, document.blockCount() - 1))
+            column = min(column, max(block.length() - 2, 0))
+            # Le mot fautif est souligné, ou un caractère à défaut (fin de ligne, symbole isolé)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(block)
+            selection.cursor.setPosition(block.position() + column)
+            selection.cursor.movePosition(QTextCursor.EndOfWord, QTextCursor.KeepAnchor)
+            if not selection.cursor.hasSelection():
+                selection.cursor.movePosition(QTextCursor.NextCharacter, QTextCursor.KeepAnchor)
+            selection.format.setUnderlineStyle(QTextCharFormat.SpellCheckUnderline)
+            selection.format.setUnderlineColor(DIAGNOSTIC_COLORS[severity])
+            selections.append(selection)
+            if block.blockNumber() not in markers or severity == "error":
+                markers[block.blockNumber()] = (severity, f"Line {line + 1}: {message}")
+
+        set_selection_layer(editor, "diagnostics", selections)
+        area = editor.parentWidget().findChild(LineNumberArea)
+        if area is not None:
+            area.set_diagnostics(markers)
+
+        summary = [(line, message) for line, column, severity, message in diagnostics]
+        if summary != getattr(editor, "diagnostics_summary", None):
+            editor.diagnostics_summary = summary
+            if summary:
+                line, message = summary[0]
+                self.status_bar.showMessage(f"{len(summary)} problem(s) — line {line + 1}: {message}", 5000)
+
+    def current_symbols(self):
+        editor = self.current_editor()
+        if editor is None:
+            return []
+        symbols = getattr(editor, "symbols", None)
+        if symbols is None and self.symbol_index is not None:
+            symbols = self.symbol_index.symbols(getattr(editor, "current_file", None))
+        return symbols or []
 
-    # --------------------------------------------------------------Ouvrir un fichier depuis le file_model (Étape 1)
-    def open_file_from_tree(self, index):
-        file_path = self.file_system_model.filePath(index)
+    def on_symbols_changed(self, path):
+        editor = self.current_editor()
+        if editor is not None and getattr(editor, "symbols", None) is None:
+            self.update_outline()
+
+    # --------------------------------------------------------------Panneau de structure du fichier courant
+    def show_outline(self):
+        if self.outline_dock is None:
+            self.outline_tree = QTreeWidget()
+            self.outline_tree.setObjectName("outline_tree")
+            self.outline_tree.setHeaderHidden(True)
+            self.outline_tree.setUniformRowHeights(True)
+            self.outline_tree.itemActivated.connect(self.open_outline_item)
+            self.outline_tree.itemClicked.connect(self.open_outline_item)
+
+            self.outline_dock = QDockWidget("Outline", self)
+            self.outline_dock.setObjectName("outline_dock")
+            self.outline_dock.setWidget(self.outline_tree)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.outline_dock)
+
+        self.outline_dock.show()
+        self.outline_dock.raise_()
+        self.update_outline()
+
+    def update_outline(self, *args):
+        if self.outline_dock is None or not self.outline_dock.isVisible():
+            return
 
-        if os.path.isfile(file_path):
-            self.add_file_from_tree(file_path)
+        self.outline_tree.clear()
+        parents = [self.outline_tree.invisibleRootItem()]
+        for name, qualname, kind, line, column, depth in self.current_symbols():
+            del parents[depth + 1:]
+            item = QTreeWidgetItem(parents[-1], [name if kind == "variable" else f"{name} ({kind})"])
+            item.setData(0, Qt.UserRole, (line, column))
+            item.setToolTip(0, f"{qualname} : line {line}")
+            parents.append(item)
+        self.outline_tree.expandToDepth(0)
+
+    def open_outline_item(self, item):
+        editor = self.current_editor()
+        if editor is not None:
+            line, column = item.data(0, Qt.UserRole)
+            self.go_to_line(editor, line, column)
 
-    # --------------------------------------------------------------Ouvrir un fichier depuis le file_model (Étape 2)
-    def add_file_from_tree(self, file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+    # --------------------------------------------------------------Aller à la définition du nom sous le curseur
+    def go_to_definition(self):
+        editor = self.current_editor()
+        if editor is None:
+            return
+        cursor = editor.textCursor()
+        cursor.select(QTextCursor.WordUnderCursor)
+        name = cursor.selectedText()
+        if not name.isidentifier():
+            return
 
-            editor = QPlainTextEdit()
-            fixedfont = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-            fixedfont.setPointSize(12)
-            editor.setFont(fixedfont)
-            editor.setPlainText(content)
+        # Le buffer fait foi pour le fichier courant, l'index pour le reste du projet
+        path = getattr(editor, "current_file", None)
+        current = os.path.abspath(path) if path else None
+        definitions = [(current, line, column, kind, qualname)
+                       for symbol_name, qualname, kind, line, column, depth in self.current_symbols() if symbol_name == name]
+        if self.symbol_index is not None:
+            definitions += [definition for definition in self.symbol_index.lookup(name) if definition[0] != current]
 
-            editor.cursorPositionChanged.connect(self.update_cursor_position)
+        if not definitions:
+            self.status_bar.showMessage(f"No definition found for {name}", 3000)
+            return
+        if len(definitions) == 1:
+            return self.open_definition(editor, definitions[0])
+
+        menu = QMenu(self)
+        for definition in definitions[:30]:
+            location = os.path.relpath(definition[0], self.project_path) if definition[0] and getattr(self, "project_path", None) else "this file"
+            action = menu.addAction(f"{definition[4]} ({definition[3]}) — {location}:{definition[1]}")
+            action.triggered.connect(lambda checked=False, definition=definition: self.open_definition(editor, definition))
+        menu.exec_(editor.viewport().mapToGlobal(editor.cursorRect().bottomLeft()))
+
+    def open_definition(self, editor, definition):
+        path, line, column = definition[:3]
+        if path is None or path == os.path.abspath(getattr(editor, "current_file", None) or ""):
+            self.go_to_line(editor, line, column)
+        else:
+            self.open_file_at(path, line)
 
-            line_number_area = LineNumberArea(editor)
-            editor.blockCountChanged.connect(line_number_area.update)
-            editor.updateRequest.connect(lambda rect, dy: line_number_area.update())
-            editor.cursorPositionChanged.connect(line_number_area.update)
-            layout = QHBoxLayout()
-            layout.addWidget(line_number_area)
-            layout.addWidget(editor)
+    # --------------------------------------------------------------Outils JSON : validation et formatage par morceaux, dans le pool
+    def json_source(self):
+        tab = self.current_tab()
+        editor = self.current_editor()
+        path = getattr(tab, "path", None)
+        if (path and not path.lower().endswith(".json")) or (not path and editor is None):
+            self.status_bar.showMessage("The current tab is not a JSON file", 3000)
+            return None, None
+        # Le texte de l'éditeur fait foi tant qu'il n'est pas enregistré
+        if editor is not None and (editor.document().isModified() or not path):
+            return editor, editor.toPlainText().encode("utf-8")
+        return editor, path
+
+    def validate_json_file(self):
+        editor, source = self.json_source()
+        if source is not None:
+            self.run_json_task("validate", editor, validate_json, source)
+
+    def format_json_file(self, indent):
+        editor, source = self.json_source()
+        if source is None:
+            return
+        if editor is not None:
+            self.run_json_task("format", editor, format_json, source, None, indent)
+            return
 
-            container = QWidget()
-            container.setLayout(layout)
+        # Vue en lecture seule d'un gros fichier : le résultat est écrit à côté, sans passer par la mémoire
+        root, extension = os.path.splitext(source)
+        suggested = f"{root}.{'min' if indent is None else 'pretty'}{extension}"
+        target, _ = QFileDialog.getSaveFileName(self, "Save the formatted JSON", suggested, "JSON File (*.json)")
+        if not target:
+            return
+        if os.path.abspath(target) == os.path.abspath(source):
+            self.dialog_critical("This file is opened in read-only large file mode, choose another file.")
+            return
+        self.run_json_task("format", None, format_json, source, target, indent)
+
+    def run_json_task(self, task, editor, function, source, *arguments):
+        name = self.tabs.tabText(self.tabs.currentIndex()).rstrip("*")
+        self.status_bar.showMessage(f"{'Validating' if task == 'validate' else 'Formatting'} {name}...")
+        target = (task, self.current_tab(), editor, editor.document().revision() if editor is not None else None,
+                  name, time.perf_counter())
+        future = self.worker_pool().submit(function, source, *arguments)
+        future.add_done_callback(lambda future: self.json_task_done.emit(target, future))
+
+    def finish_json_task(self, target, future):
+        task, tab, editor, revision, name, started = target
+        elapsed = (time.perf_counter() - started) * 1000
+        try:
+            result = future.result()
+        except ValueError as e:
+            # Erreur de syntaxe rencontrée pendant le formatage : (message, ligne, colonne)
+            if len(e.args) == 3:
+                self.show_json_error(tab, editor, name, e.args)
+            else:
+                self.dialog_critical(f"Error during the JSON {task} : {e}")
+            return
+        except Exception as e:
+            self.dialog_critical(f"Error during the JSON {task} : {e}")
+            return
 
-            container.path = file_path
-            editor.current_file = file_path
+        if task == "validate":
+            if result is None:
+                self.status_bar.showMessage(f"{name} is valid JSON ({elapsed:.0f} ms)", 5000)
+            else:
+                self.show_json_error(tab, editor, name, result)
+        elif editor is None:
+            self.status_bar.showMessage(f"Wrote {os.path.basename(result)} ({elapsed:.0f} ms)", 5000)
+            self.add_file_from_tree(result)
+        elif self.tab_index_for_editor(editor) >= 0 and editor.document().revision() == revision:
+            # Un seul remplacement : annulable d'un coup
+            cursor = QTextCursor(editor.document())
+            cursor.select(QTextCursor.Document)
+            cursor.insertText(result)
+            self.status_bar.showMessage(f"Formatted {name} ({elapsed:.0f} ms)", 5000)
+        else:
+            self.status_bar.showMessage(f"{name} changed during the formatting, nothing replaced", 5000)
 
-            file_icon = self.get_file_icon(file_path)
+    def show_json_error(self, tab, editor, name, error):
+        message, line, column = error
+        self.status_bar.showMessage(f"{name} : {message} (line {line}, column {column})", 8000)
+        if self.tabs.indexOf(tab) < 0:
+            return
+        self.tabs.setCurrentWidget(tab)
+        if isinstance(tab, LargeFileView):
+            tab.verticalScrollBar().setValue(line - 1)
+        elif editor is not None and self.tab_index_for_editor(editor) >= 0:
+            self.go_to_line(editor, line, column - 1)
+
+    # --------------------------------------------------------------Panneau de structure JSON : les enfants sont lus page par page à l'affichage
+    def show_json_structure(self):
+        if self.json_dock is None:
+            self.json_model = JsonTreeModel(self.worker_pool(), self)
+            self.json_model.rowsInserted.connect(self.on_json_rows_inserted)
+
+            self.json_tree = QTreeView()
+            self.json_tree.setObjectName("json_tree")
+            self.json_tree.setUniformRowHeights(True)
+            self.json_tree.setModel(self.json_model)
+            self.json_tree.activated.connect(self.open_json_item)
+            self.json_tree.clicked.connect(self.open_json_item)
+            # Les pages suivantes sont demandées une fois la vue remise en page
+            self.json_fetch_timer = QTimer(self)
+            self.json_fetch_timer.setSingleShot(True)
+            self.json_fetch_timer.setInterval(50)
+            self.json_fetch_timer.timeout.connect(self.fetch_json_pages)
+            self.json_tree.verticalScrollBar().valueChanged.connect(self.json_fetch_timer.start)
+            self.json_tree.verticalScrollBar().rangeChanged.connect(self.json_fetch_timer.start)
+
+            self.json_dock = QDockWidget("JSON structure", self)
+            self.json_dock.setObjectName("json_dock")
+            self.json_dock.setWidget(self.json_tree)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.json_dock)
+
+        self.json_dock.show()
+        self.json_dock.raise_()
+        self.update_json_structure()
+
+    def update_json_structure(self, *args, reload=False):
+        if self.json_dock is None or not self.json_dock.isVisible():
+            return
+        path = getattr(self.current_tab(), "path", None)
+        if not path or not path.lower().endswith(".json"):
+            path = None
+        if path == self.json_model.path and not reload:
+            return
 
-            index = self.tabs.addTab(container, file_icon, os.path.basename(file_path))
-            self.tabs.setCurrentIndex(index)
+        self.json_model.load(path)
+        self.json_dock.setWindowTitle(f"JSON structure — {os.path.basename(path)}" if path else "JSON structure")
+        if path:
+            self.json_model.fetchMore(QModelIndex())
+
+    def on_json_rows_inserted(self, parent, first, last):
+        # La valeur racine est dépliée dès qu'elle est connue
+        if not parent.isValid():
+            self.json_tree.expand(self.json_model.index(0, 0))
+
+    def fetch_json_pages(self):
+        view, model = self.json_tree, self.json_model
+        # Une ligne affichée qui est la dernière chargée de son conteneur : la page suivante est demandée
+        index = view.indexAt(QPoint(0, 0))
+        bottom = view.viewport().height()
+        while index.isValid() and view.visualRect(index).top() < bottom:
+            parent = index.parent()
+            if index.row() == model.rowCount(parent) - 1:
+                model.fetch_page(parent)
+            index = view.indexBelow(index)
+
+    def open_json_item(self, index):
+        if index.internalPointer().kind == "more":
+            self.json_model.load_more(index)
+            return
+        line, column = index.data(Qt.UserRole)
+        if self.json_model.path:
+            self.open_file_at(self.json_model.path, line)
+
+    # --------------------------------------------------------------Aperçu HTML : la page est analysée en arrière-plan, la mise en page se fait par étapes
+    def show_preview(self):
+        if self.preview_dock is None:
+            self.preview_browser = QTextBrowser()
+            self.preview_browser.setObjectName("preview_browser")
+            self.preview_browser.setOpenLinks(False)
+            scroll_bar = self.preview_browser.verticalScrollBar()
+            scroll_bar.rangeChanged.connect(self.restore_preview_scroll)
+            scroll_bar.actionTriggered.connect(lambda action: setattr(self, "preview_scroll", None))
+
+            self.preview_dock = QDockWidget("Preview", self)
+            self.preview_dock.setObjectName("preview_dock")
+            self.preview_dock.setWidget(self.preview_browser)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.preview_dock)
+
+        self.preview_dock.show()
+        self.preview_dock.raise_()
+        self.preview_timer.stop()
+        self.render_preview()
+
+    def schedule_preview(self, editor):
+        if self.preview_dock is None or not self.preview_dock.isVisible():
+            return
+        if editor is None or editor is not self.current_editor():
+            return
+        path = getattr(self.current_tab(), "path", None)
+        if path and path.lower().endswith(PREVIEW_EXTENSIONS):
+            self.preview_timer.start()
 
-            self.apply_highlighter(editor)
+    def render_preview(self):
+        if self.preview_dock is None or not self.preview_dock.isVisible():
+            return
+        # Une feuille de style en cours d'édition rafraîchit la dernière page affichée
+        tab = self.current_tab()
+        path = getattr(tab, "path", None)
+        if getattr(tab, "hydrated", None) is not None and path and path.lower().endswith((".html", ".htm")):
+            self.preview_tab = tab
+        source = self.preview_tab
+        if source is None:
+            return
+        if getattr(source, "loader", None) is not None:
+            self.preview_timer.start()
+            return
+        # Un rendu à la fois : le dernier état est repris à la fin du rendu en cours
+        if self.preview_renderer is not None:
+            self.preview_pending = True
+            return
 
-        except Exception as e:
-            self.dialog_critical(f"Erreur à l'ouverture du fichier : {str(e)}")
+        editor = source.findChild(QPlainTextEdit)
+        if editor is not None:
+            html = editor.toPlainText()
+        elif source.snapshot is not None:
+            html = zlib.decompress(source.snapshot).decode("utf-8")
+        else:
+            html = None
+
+        stylesheets = {}
+        for index in range(self.tabs.count()):
+            container = self.tabs.widget(index)
+            css = getattr(container, "path", None)
+            if getattr(container, "hydrated", None) is None or not css or not css.lower().endswith(".css"):
+                continue
+            css_editor = container.findChild(QPlainTextEdit)
+            if css_editor is not None and css_editor.document().isModified():
+                stylesheets[os.path.normpath(os.path.abspath(css))] = css_editor.toPlainText()
+            elif css_editor is None and container.snapshot is not None:
+                stylesheets[os.path.normpath(os.path.abspath(css))] = zlib.decompress(container.snapshot).decode("utf-8")
+
+        source_path = os.path.abspath(source.path)
+        if html is None:
+            try:
+                with open(source_path, encoding="utf-8", errors="replace") as file:
+                    html = file.read()
+            except OSError as e:
+                self.status_bar.showMessage(f"Preview unavailable : {e}", 5000)
+                return
 
-    # --------------------------------------------------------------Sélectionner un dossier
-    def select_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Choisir un dossier")
-        if folder:
-            self.project_path = folder
-            self.tree_view.setRootIndex(self.file_system_model.index(folder))
+        renderer = PreviewRenderer(html, source_path, stylesheets, self.preview_browser.font(), self.preview_digest, self)
+        renderer.rendered.connect(self.apply_preview)
+        renderer.finished.connect(self.finish_preview)
+        self.preview_renderer = renderer
+        renderer.start()
+
+    def apply_preview(self, document, digest, path):
+        browser = self.preview_browser
+        # Même page : la position de défilement est reprise, une autre page s'ouvre en haut
+        if path == self.preview_path:
+            self.preview_scroll = (browser.verticalScrollBar().value(), browser.horizontalScrollBar().value())
+        else:
+            self.preview_scroll = None
+        browser.setDocument(document)
+        self.preview_document = document
+        self.preview_digest = digest
+        self.preview_path = path
+        self.preview_dock.setWindowTitle(f"Preview — {os.path.basename(path)}")
+        self.restore_preview_scroll()
+
+    def restore_preview_scroll(self, *args):
+        if self.preview_scroll is None:
+            return
+        vertical, horizontal = self.preview_scroll
+        scroll_bar = self.preview_browser.verticalScrollBar()
+        scroll_bar.setValue(vertical)
+        self.preview_browser.horizontalScrollBar().setValue(horizontal)
+        # La hauteur grandit au fil de la mise en page : la position est tenue jusqu'à ce qu'elle soit atteinte
+        if scroll_bar.maximum() >= vertical:
+            self.preview_scroll = None
+
+    def finish_preview(self):
+        self.preview_renderer = None
+        if self.preview_pending:
+            self.preview_pending = False
+            self.render_preview()
 
     # --------------------------------------------------------------Ajouter un onglet d'accueil
     def add_home_tab(self):
         welcome_label = QLabel(self)
-
-        pixmap = QPixmap("assets/home_screen_2.png")
-
-        welcome_label.setPixmap(pixmap)
+        welcome_label.setMinimumSize(1, 1)
 
         welcome_label.setAlignment(Qt.AlignCenter)
 
-        def resize_image(event):
-            label_size = welcome_label.size()
-
-            scaled_pixmap = pixmap.scaled(label_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Le redimensionnement attend la fin du geste, puis réutilise la variante déjà calculée pour ce palier
+        resize_timer = QTimer(welcome_label)
+        resize_timer.setSingleShot(True)
+        resize_timer.setInterval(HOME_RESIZE_DELAY)
+        resize_timer.timeout.connect(lambda: welcome_label.setPixmap(asset_cache.scaled("assets/home_screen_2.png", welcome_label.size())))
 
-            welcome_label.setPixmap(scaled_pixmap)
+        def resize_image(event):
+            resize_timer.start()
 
         welcome_label.resizeEvent = resize_image
 
@@ -940,96 +5292,35 @@ class IDE(QMainWindow):
 
     # --------------------------------------------------------------Ajouter un onglet
     def add_new_tab(self, label="New Tab"):
-        editor = QPlainTextEdit()
-        fixedfont = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-        fixedfont.setPointSize(12)
-        editor.setFont(fixedfont)
-
-        def toggle_wrap(checked):
-            if checked:
-                editor.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-            else:
-                editor.setLineWrapMode(QPlainTextEdit.NoWrap)
-
-        editor.toggle_wrap = toggle_wrap.__get__(editor)
-
-        editor.cursorPositionChanged.connect(self.update_cursor_position)
-
-        line_number_area = LineNumberArea(editor)
-        editor.blockCountChanged.connect(line_number_area.update)
-        editor.updateRequest.connect(lambda rect, dy: line_number_area.update())
-        editor.cursorPositionChanged.connect(line_number_area.update)
-        layout = QHBoxLayout()
-        layout.addWidget(line_number_area)
-        layout.addWidget(editor)
-
-        container = QWidget()
-        container.setLayout(layout)
-
-        index = self.tabs.addTab(container, "New File")
+        index = self.tabs.addTab(self.create_tab(), "New File")
         self.tabs.setCurrentIndex(index)
 
-        self.force_redraw_line_numbers()
-
-        self.update_cursor_position()
-
-        self.apply_highlighter(editor)
-
         if self.tabs.count() > 1:
             self.tabs.setMovable(True)
-            self.tabs.setStyleSheet("""
-                    QTabWidget::pane {
-                    background-color: #56585d;
-                    border: solid 1px #56585d;
-                }
-
-                QTabBar {
-                    background-color: #38393c;
-                }
-
-                QTabBar::tab {
-                    background: #38393c;
-                    padding: 10px;
-                    margin: 2px;
-                    border-top-left-radius: 7px;
-                    border-top-right-radius: 7px;
-                    border-bottom-left-radius: 0px;
-                    border-bottom-right-radius: 0px;
-                    font-weight: bold;
-                    width: 150px;
-                    color: #a1a2a4;
-                }
-
-                QTabBar::tab:hover {
-                    background: #404145;
-                    color: white;
-                }
-
-                QTabBar::tab:selected {
-                    background: #56585d;
-                    color: white;
-                    margin-bottom: -2px;
-                    margin-top: 3px;
-                }
-
-                QTabBar::close-button {
-                    image: url("assets/close_tab.png");
-                    subcontrol-position: right;
-                    margin-right: 5px;
-                }
-
-                QTabBar::close-button:hover {
-                    image: url("assets/close_tab_hover.png");
-                }
-            """)
 
     # --------------------------------------------------------------fermer un onglet
     def close_tab(self, index):
         if self.tabs.count() > 1:
+            widget = self.tabs.widget(index)
+            loader = getattr(widget, "loader", None)
+            if loader is not None:
+                loader.cancel()
+            self.hydrated_tabs.pop(widget, None)
+            if widget is self.preview_tab:
+                self.preview_tab = None
             self.tabs.removeTab(index)
+            if isinstance(widget, LargeFileView):
+                widget.close_file()
+                widget.deleteLater()
+            elif getattr(widget, "hydrated", None) is not None and not self.tab_is_busy(widget):
+                widget.deleteLater()
             if self.tabs.count() == 1:
                 self.tabs.setMovable(False)
+            self.schedule_session_save()
         else:
+            for saver in list(self.savers.values()):
+                saver.wait()
+            self.save_session(wait=True)
             exit()
 
     # --------------------------------------------------------------Renvoyer l'onglet actuel
@@ -1055,45 +5346,15 @@ class IDE(QMainWindow):
                                                    options=options)
 
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-
-                editor = QPlainTextEdit()
-                fixedfont = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-                fixedfont.setPointSize(12)
-                editor.setFont(fixedfont)
-                editor.setPlainText(content)
-
-                editor.cursorPositionChanged.connect(self.update_cursor_position)
-
-                line_number_area = LineNumberArea(editor)
-                editor.blockCountChanged.connect(line_number_area.update)
-                editor.updateRequest.connect(lambda rect, dy: line_number_area.update())
-                editor.cursorPositionChanged.connect(line_number_area.update)
-                layout = QHBoxLayout()
-                layout.addWidget(line_number_area)
-                layout.addWidget(editor)
-
-                container = QWidget()
-                container.setLayout(layout)
-
-                container.path = file_path
-                editor.current_file = file_path
-
-                file_icon = self.get_file_icon(file_path)
-
-                index = self.tabs.addTab(container, file_icon, os.path.basename(file_path))
-                self.tabs.setCurrentIndex(index)
-
-                self.apply_highlighter(editor)
-
-            except Exception as e:
-                self.dialog_critical(f"Erreur à l'ouverture du fichier : {str(e)}")
+            self.add_file_from_tree(file_path)
 
     # --------------------------------------------------------------Enregistrer le fichier
     def file_save(self):
         tab = self.current_tab()
+        if isinstance(tab, LargeFileView):
+            self.dialog_critical("This file is opened in read-only large file mode.")
+            return
+
         editor = tab.findChild(QPlainTextEdit)
 
         if editor is None:
@@ -1105,14 +5366,14 @@ class IDE(QMainWindow):
         if not path:
             return self.file_saveas("All files (*)", "")
 
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(editor.toPlainText())
-        except Exception as e:
-            self.dialog_critical(f"Error during the save : {str(e)}")
+        self.save_editor(editor, tab, path)
 
     # --------------------------------------------------------------Enregistrer le fichier sous (Étape 1)
     def file_saveas(self, file_type, extension):
+        if isinstance(self.current_tab(), LargeFileView):
+            self.dialog_critical("This file is opened in read-only large file mode.")
+            return
+
         editor = self.current_tab().findChild(QPlainTextEdit)
 
         if editor is None:
@@ -1122,21 +5383,7 @@ class IDE(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, "Save File", f"untitled{extension}", file_type)
 
         if path:
-            try:
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write(editor.toPlainText())
-
-                index = self.tabs.currentIndex()
-                self.tabs.setTabText(index, os.path.basename(path))
-
-                file_icon = self.get_file_icon(path)
-                self.tabs.setTabIcon(index, file_icon)
-
-                container = self.current_tab()
-                container.path = path
-                editor.current_file = path
-            except Exception as e:
-                self.dialog_critical(f"Error during the save : {str(e)}")
+            self.save_editor(editor, self.current_tab(), path)
 
     # --------------------------------------------------------------Enregistrer le fichier sous (Étape 2)
     def _save_to_path(self, path):
@@ -1145,12 +5392,235 @@ class IDE(QMainWindow):
             self.dialog_critical("Editor not found, please open a file.")
             return
 
-        text = editor.toPlainText()
+        self.save_editor(editor, self.current_tab(), path)
+
+    # --------------------------------------------------------------Enregistrer en arrière-plan, de façon atomique
+    def save_editor(self, editor, container, path):
+        same_file = path == getattr(container, "path", None)
+
+        # Rien n'a changé depuis le dernier enregistrement : on n'écrit pas
+        if same_file and not editor.document().isModified() and getattr(editor, "saved_hash", None):
+            self.status_bar.showMessage(f"{os.path.basename(path)} is unchanged, nothing to save", 3000)
+            return
+
+        if path in self.savers:
+            self.pending_saves[path] = (editor, container)
+            return
+
+        previous_hash = getattr(editor, "saved_hash", None) if same_file else None
+        saver = FileSaver(path, editor.toPlainText(), previous_hash, self)
+        saver.revision = editor.document().revision()
+        self.savers[path] = saver
+
+        saver.saved.connect(lambda digest, skipped: self.finish_saving(editor, container, saver, digest, skipped))
+        saver.failed.connect(lambda error: self.fail_saving(saver, error))
+        saver.finished.connect(lambda: self.release_saver(saver))
+
+        self.status_bar.showMessage(f"Saving {os.path.basename(path)}...")
+        saver.start()
+
+    # --------------------------------------------------------------Enregistrement terminé
+    def finish_saving(self, editor, container, saver, digest, skipped):
+        path = saver.path
+        editor.saved_hash = digest
+
+        # Le document n'a pas bougé pendant l'écriture : il correspond au fichier
+        if editor.document().revision() == saver.revision:
+            editor.document().setModified(False)
+
+        if getattr(container, "path", None) != path:
+            container.path = path
+            editor.current_file = path
+
+            index = self.tabs.indexOf(container)
+            if index >= 0:
+                self.tabs.setTabIcon(index, self.get_file_icon(path))
+            self.update_tab_title(container)
+            self.apply_highlighter(editor)
+            self.schedule_session_save()
+
+        if self.symbol_index is not None:
+            self.symbol_index.refresh(path)
+        if self.json_model is not None and self.json_model.path == path:
+            self.update_json_structure(reload=True)
+
+        if skipped:
+            self.status_bar.showMessage(f"{os.path.basename(path)} is unchanged, nothing written", 3000)
+        else:
+            self.status_bar.showMessage(f"Saved {os.path.basename(path)} ({saver.elapsed * 1000:.0f} ms)", 3000)
+
+    def fail_saving(self, saver, error):
+        self.status_bar.showMessage(f"Error during the save of {os.path.basename(saver.path)}", 5000)
+        self.dialog_critical(f"Error during the save : {error}")
+
+    def release_saver(self, saver):
+        if self.savers.get(saver.path) is saver:
+            del self.savers[saver.path]
+
+        # Un enregistrement demandé pendant l'écriture repart avec le texte le plus récent
+        if saver.path in self.pending_saves:
+            editor, container = self.pending_saves.pop(saver.path)
+            self.save_editor(editor, container, saver.path)
+
+    # --------------------------------------------------------------Titre de l'onglet, marqué s'il y a des modifications
+    def update_tab_title(self, container):
+        index = self.tabs.indexOf(container)
+        if index < 0:
+            return
+
+        editor = container.findChild(QPlainTextEdit)
+        path = getattr(container, "path", None)
+        title = os.path.basename(path) if path else "New File"
+        modified = editor.document().isModified() if editor is not None else getattr(container, "modified", False)
+        if modified:
+            title += " *"
+        self.tabs.setTabText(index, title)
+
+    # --------------------------------------------------------------Attendre les enregistrements avant de quitter
+    def closeEvent(self, event):
+        for saver in list(self.savers.values()):
+            saver.wait()
+        self.save_session(wait=True)
+        if self.project_search is not None:
+            self.project_search.cancel()
+            self.project_search.wait()
+        if self.file_index is not None:
+            self.file_index.close()
+        if self.symbol_index is not None:
+            self.symbol_index.close()
+        if self.preview_renderer is not None:
+            self.preview_renderer.wait()
+        if self.run_panel is not None and self.run_panel.is_running():
+            self.run_panel.process.kill()
+            self.run_panel.process.waitForFinished(1000)
+        if self.interpreter_pool is not None:
+            self.interpreter_pool.close()
+        if self.process_pool is not None:
+            self.process_pool.shutdown(cancel_futures=True)
+        super().closeEvent(event)
+
+    # --------------------------------------------------------------Session : onglets, curseurs et projet
+    def schedule_session_save(self, *args):
+        if not self.restoring_session:
+            self.session_timer.start()
+
+    def session_state(self):
+        tabs = []
+        current = -1
+        for index in range(self.tabs.count()):
+            container = self.tabs.widget(index)
+            path = getattr(container, "path", None)
+            if not path:
+                continue
+
+            if isinstance(container, LargeFileView):
+                cursor, scroll = (0, 0), (container.verticalScrollBar().value(), 0)
+            elif container.hydrated and getattr(container, "loader", None) is None:
+                editor = container.findChild(QPlainTextEdit)
+                text_cursor = editor.textCursor()
+                cursor = (text_cursor.anchor(), text_cursor.position())
+                scroll = (editor.verticalScrollBar().value(), editor.horizontalScrollBar().value())
+            else:
+                cursor = getattr(container, "cursor_state", None) or (0, 0)
+                scroll = getattr(container, "scroll_state", None) or (0, 0)
+
+            if index == self.tabs.currentIndex():
+                current = len(tabs)
+            tabs.append({"path": path, "cursor": list(cursor), "scroll": list(scroll)})
+
+        return {"project": getattr(self, "project_path", None), "current": current, "tabs": tabs}
+
+    def save_session(self, wait=False):
+        self.session_timer.stop()
+        if self.restoring_session:
+            return
+
+        session = self.session_state()
+        if session == self.session_saved:
+            return
+
+        # Une écriture est déjà en cours : on repasse quand elle sera terminée
+        if self.session_writer is not None and self.session_writer.isRunning():
+            if not wait:
+                self.session_timer.start()
+                return
+            self.session_writer.wait()
+
+        self.session_saved = session
+        self.session_writer = JsonWriter(SESSION_FILE, session, self)
+        self.session_writer.start()
+        if wait:
+            self.session_writer.wait()
+
+    def restore_session(self):
         try:
-            with open(path, 'w') as f:
-                f.write(text)
-        except Exception as e:
-            self.dialog_critical(str(e))
+            with open(SESSION_FILE, "r", encoding="utf-8") as file:
+                session = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        project = session.get("project")
+        if project and os.path.isdir(project):
+            self.open_project(project)
+
+        # Sans boutons de fermeture, un ajout ne replace pas ceux de tous les autres onglets :
+        # ils sont posés ensuite par tranches, et les fichiers ne sont lus qu'à l'activation de leur onglet
+        self.restoring_session = True
+        self.tabs.setTabsClosable(False)
+        current = -1
+        try:
+            for position, entry in enumerate(session.get("tabs", [])):
+                path = entry.get("path")
+                if not path or not os.path.isfile(path):
+                    continue
+                count = self.tabs.count()
+                self.add_file_from_tree(path, activate=False)
+                if self.tabs.count() == count:
+                    continue
+
+                container = self.tabs.widget(count)
+                if isinstance(container, LargeFileView):
+                    container.verticalScrollBar().setValue(entry.get("scroll", [0])[0])
+                else:
+                    container.cursor_state = tuple(entry.get("cursor", (0, 0)))
+                    container.scroll_state = tuple(entry.get("scroll", (0, 0)))
+                if position == session.get("current"):
+                    current = count
+        finally:
+            self.restoring_session = False
+            self.close_button_timer.start()
+
+        if self.tabs.count() > 1:
+            self.tabs.setMovable(True)
+        if current >= 0:
+            self.tabs.setCurrentIndex(current)
+        self.session_saved = self.session_state()
+
+    # --------------------------------------------------------------Boutons de fermeture des onglets restaurés, posés pendant les temps morts
+    def add_close_buttons(self):
+        deadline = time.perf_counter() + BACKGROUND_HIGHLIGHT_SLICE
+        tab_bar = self.tabs.tabBar()
+        side = QTabBar.ButtonPosition(tab_bar.style().styleHint(QStyle.SH_TabBar_CloseButtonPosition, None, tab_bar))
+
+        for index in range(tab_bar.count()):
+            if tab_bar.tabButton(index, side) is not None:
+                continue
+            if time.perf_counter() > deadline:
+                return
+            button = TabCloseButton(tab_bar)
+            button.clicked.connect(lambda checked=False, button=button: self.close_tab_button(button, side))
+            tab_bar.setTabButton(index, side, button)
+
+        # Tous les onglets ont leur bouton : Qt reprend la main pour les onglets suivants
+        self.close_button_timer.stop()
+        self.tabs.setTabsClosable(True)
+
+    def close_tab_button(self, button, side):
+        tab_bar = self.tabs.tabBar()
+        for index in range(tab_bar.count()):
+            if tab_bar.tabButton(index, side) is button:
+                self.close_tab(index)
+                return
 
     # --------------------------------------------------------------Contrôler le wrap
     def toggle_wrap(self, checked):
@@ -1163,42 +5633,52 @@ class IDE(QMainWindow):
 
     # --------------------------------------------------------------Mettre à jour les infos sur le curseur
     def update_cursor_position(self):
+        # Les rafraîchissements sont regroupés, au plus un par image
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+        self.schedule_session_save()
+
+    def refresh_status_bar(self):
         editor = self.current_editor()
-        if editor:
+        if isinstance(self.current_tab(), LargeFileView):
+            self.status_label.setText(self.current_tab().status_text())
+        elif editor:
             cursor = editor.textCursor()
             line_number = cursor.blockNumber() + 1
             column_number = cursor.columnNumber()
 
-            self.status_label.setText(
-                f"Line : {line_number} | Column : {column_number} | Characters : {len(editor.toPlainText())}")
+            stats = getattr(editor, "stats", None)
+            if stats is None:
+                stats = editor.stats = DocumentStats(editor.document())
+
+            text = (f"Line : {line_number} | Column : {column_number} | Characters : {stats.characters()}"
+                    f" | Words : {stats.words} | Lines : {stats.lines()}")
+
+            if cursor.hasSelection():
+                selected_lines = (editor.document().findBlock(cursor.selectionEnd()).blockNumber()
+                                  - editor.document().findBlock(cursor.selectionStart()).blockNumber() + 1)
+                text += f" | Selection : {cursor.selectionEnd() - cursor.selectionStart()} chars, {selected_lines} lines"
+
+            self.status_label.setText(text)
         else:
             self.status_label.setText("Line : - | Column : - | Characters : -")
 
-    # --------------------------------------------------------------Forcer la mise à jour des numéros de ligne
-    def force_redraw_line_numbers(self):
-        current_editor = self.current_tab().findChild(QPlainTextEdit)
-        if current_editor:
-            current_editor.viewport().update()
-            for child in self.current_tab().findChildren(QWidget):
-                if isinstance(child, LineNumberArea):
-                    child.update()
-
     # --------------------------------------------------------------Obtenir l'icône correspondant au bon type de fichier
     def get_file_icon(self, file_path):
         ext = os.path.splitext(file_path)[1].lower()
 
         if ext == ".py":
-            return QIcon("assets/py.png")
+            return asset_cache.icon("assets/py.png")
         elif ext == ".txt":
-            return QIcon("assets/txt.png")
+            return asset_cache.icon("assets/txt.png")
         elif ext == ".html":
-            return QIcon("assets/html.png")
+            return asset_cache.icon("assets/html.png")
         elif ext == ".css":
-            return QIcon("assets/css.png")
+            return asset_cache.icon("assets/css.png")
         elif ext == ".json":
-            return QIcon("assets/json.png")
+            return asset_cache.icon("assets/json.png")
         else:
-            return QIcon("assets/txt.png")
+            return asset_cache.icon("assets/txt.png")
 
     # --------------------------------------------------------------Afficher une erreur critique
     def dialog_critical(self, error):
@@ -1213,19 +5693,262 @@ class IDE(QMainWindow):
 
 # --------------------------------------------------------------Afficher le SplashScreen
 def show_splash():
-    splash_pix = QPixmap("assets/splash.png")
+    splash_pix = asset_cache.pixmap("assets/splash.png")
     splash = QSplashScreen(splash_pix, Qt.WindowStaysOnTopHint)
     splash.setMask(splash_pix.mask())
     splash.show()
-
-    QTimer.singleShot(2000, splash.close)
+    # Le splash doit être peint avant que la construction de la fenêtre n'occupe la boucle
+    QApplication.processEvents()
 
     return splash
 
 
+# --------------------------------------------------------------Comparer les moteurs de coloration (--benchmark-highlighter)
+def benchmark_highlighters(block_count=20000):
+    sample = [
+        "import os",
+        "from collections import defaultdict  # comment with (brackets) and = signs",
+        "",
+        "class Worker(object):",
+        "    def run(self, items, limit=10, ratio=0.75e-3):",
+        "        for index, item in enumerate(items):",
+        "            if item[\"size\"] >= limit and not item.get('skip'):",
+        "                total = (index * 2 + item[\"size\"]) / 3 % 7",
+        "                print(\"processing\", index, total, {'key': [1, 2, 3]})",
+        "        return defaultdict(list)",
+    ]
+    lines = [sample[i % len(sample)] for i in range(block_count)]
+    content = "\n".join(lines)
+
+    results = []
+    for highlighter_class in (XMLHighlighter, SinglePassHighlighter):
+        document = QTextDocument()
+        document.setPlainText(content)
+        highlighter = highlighter_class(None)
+
+        start = time.perf_counter()
+        highlighter.setDocument(document)
+        highlighter.rehighlight()
+        elapsed = time.perf_counter() - start
+
+        per_block = elapsed / document.blockCount() * 1e6
+        results.append(per_block)
+        print(f"{highlighter_class.__name__:<24} {elapsed * 1000:9.1f} ms total  {per_block:7.2f} us/block")
+
+    print(f"Speedup : x{results[0] / results[1]:.2f}")
+
+
+# --------------------------------------------------------------Mesurer le temps par image au défilement (--benchmark-gutter)
+def benchmark_gutter(block_count=50000, frames=400):
+    content = "\n".join(f"value_{i} = compute({i}, {i * 2})  # line {i}" for i in range(block_count))
+
+    results = []
+    for with_gutter in (False, True):
+        editor = QPlainTextEdit()
+        editor.setFont(asset_cache.fixed_font(12))
+        editor.setPlainText(content)
+
+        layout = QHBoxLayout()
+        if with_gutter:
+            layout.addWidget(LineNumberArea(editor))
+        layout.addWidget(editor)
+        container = QWidget()
+        container.setLayout(layout)
+        container.resize(1000, 800)
+        container.show()
+        QApplication.processEvents()
+
+        scrollbar = editor.verticalScrollBar()
+        timings = []
+        for frame in range(frames):
+            start = time.perf_counter()
+            scrollbar.setValue(frame * 3)
+            QApplication.processEvents()
+            timings.append(time.perf_counter() - start)
+
+        timings.sort()
+        mean = sum(timings) / len(timings) * 1000
+        p95 = timings[int(len(timings) * 0.95)] * 1000
+        results.append(mean)
+        label = "editor + gutter" if with_gutter else "editor alone"
+        print(f"{label:<16} mean {mean:6.2f} ms/frame  p95 {p95:6.2f} ms  max {timings[-1] * 1000:6.2f} ms")
+        container.close()
+
+    print(f"Gutter overhead : {results[1] - results[0]:.2f} ms/frame")
+
+
+def benchmark_run(runs=5):
+    # Modules lourds de la bibliothèque standard si ceux à précharger ne sont pas installés
+    modules = [name for name in WARM_MODULES if importlib.util.find_spec(name) is not None]
+    if not modules:
+        modules = ["asyncio", "decimal", "email.mime.multipart", "http.server", "unittest", "xml.dom.minidom"]
+    source = "".join(f"import {name}\n" for name in modules) + "print('first output')\n"
+    print(f"Modules imported by the script : {', '.join(modules)}")
+
+    def wait(condition):
+        while not condition():
+            QApplication.processEvents(QEventLoop.WaitForMoreEvents, 10)
+
+    # Chemin froid : fichier temporaire puis nouvel interpréteur
+    cold = []
+    for run in range(runs):
+        timer = QElapsedTimer()
+        timer.start()
+        temp_path = os.path.join(tempfile.gettempdir(), "temp_exec.py")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(source)
+        process = interpreter_process(None, ["-u", temp_path])
+        output = []
+        process.readyReadStandardOutput.connect(lambda process=process: output.append(bytes(process.readAllStandardOutput())))
+        process.start()
+        wait(lambda: output)
+        cold.append(timer.elapsed())
+        process.waitForFinished()
+        os.remove(temp_path)
+
+    # Chemin chaud : la source part par le tube vers un interpréteur déjà préchargé
+    warm = []
+    pool = InterpreterPool(size=1, modules=modules)
+    for run in range(runs):
+        wait(lambda: pool.ready or not pool.spares)
+        acquired = []
+        timer = QElapsedTimer()
+        timer.start()
+        pool.acquire(acquired.append)
+        process = acquired[0]
+        output = []
+        process.readyReadStandardOutput.connect(lambda process=process: output.append(bytes(process.readAllStandardOutput())))
+        process.write((json.dumps({"source": source, "filename": "<benchmark>", "cwd": os.getcwd()}) + "\n").encode("utf-8"))
+        process.closeWriteChannel()
+        wait(lambda: output)
+        warm.append(timer.elapsed())
+        process.waitForFinished()
+    pool.close()
+
+    for label, timings in (("cold interpreter", cold), ("warm interpreter", warm)):
+        timings.sort()
+        print(f"{label:<17} time to first output : median {timings[len(timings) // 2]:5d} ms  min {timings[0]:5d} ms  max {timings[-1]:5d} ms")
+    print(f"Speed-up : x{cold[len(cold) // 2] / max(warm[len(warm) // 2], 1):.1f}")
+
+
+# --------------------------------------------------------------Mesurer le temps de création d'un onglet (--benchmark-tabs)
+def benchmark_tabs(count=60):
+    content = "\n".join(f"value_{i} = compute({i}, {i * 2})  # line {i}" for i in range(2000))
+    directory = tempfile.mkdtemp(prefix="codora-tabs-")
+    paths = []
+    for i in range(count):
+        paths.append(os.path.join(directory, f"module_{i}.py"))
+        with open(paths[-1], "w", encoding="utf-8") as file:
+            file.write(content)
+
+    window = IDE()
+    window.resize(1315, 768)
+    window.show()
+    QApplication.processEvents()
+
+    # Chaque mesure va jusqu'au rendu : création, style, mise en page et peinture de l'onglet
+    results = {"new tab": [], "file tab": []}
+    for path in paths:
+        timer = QElapsedTimer()
+        timer.start()
+        window.add_new_tab()
+        QApplication.processEvents()
+        results["new tab"].append(timer.nsecsElapsed() / 1e6)
+
+        # La lecture du fichier se fait en arrière-plan : elle n'entre pas dans la mesure
+        timer.start()
+        window.add_file_from_tree(path)
+        QApplication.processEvents()
+        results["file tab"].append(timer.nsecsElapsed() / 1e6)
+        while window.loaders:
+            QApplication.processEvents(QEventLoop.WaitForMoreEvents, 10)
+
+    for label, timings in results.items():
+        ordered = sorted(timings)
+        first = sorted(timings[:10])[5]
+        last = sorted(timings[-10:])[5]
+        print(f"{label:<9} median {ordered[len(ordered) // 2]:6.2f} ms  p95 {ordered[int(len(ordered) * 0.95)]:6.2f} ms"
+              f"  first 10 {first:6.2f} ms  last 10 {last:6.2f} ms")
+
+    window.hide()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+# ----------------------------------------------------------------------------------------------------------------------------Classe Chronologie du démarrage
+class StartupTrace:
+    def __init__(self):
+        self.last = STARTUP_STARTED
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last, now - STARTUP_STARTED))
+        self.last = now
+
+    def elapsed(self, phase):
+        for name, duration, total in self.phases:
+            if name == phase:
+                return total
+        return None
+
+    # --------------------------------------------------------------Détail par phase, puis contrôle du budget (--startup-budget=MS)
+    def report(self):
+        print(f"{'Phase':<16}{'Duration':>12}{'Since start':>14}")
+        for phase, duration, total in self.phases:
+            print(f"{phase:<16}{duration * 1000:>9.1f} ms{total * 1000:>11.1f} ms")
+
+        first_paint = self.elapsed("first paint") * 1000
+        interactive = self.elapsed("interactive") * 1000
+        print(f"Time to first paint  : {first_paint:.1f} ms")
+        print(f"Time to interactive  : {interactive:.1f} ms (budget {STARTUP_BUDGET_MS} ms)")
+
+        if interactive > STARTUP_BUDGET_MS:
+            print(f"[ERROR] -- Startup is over budget by {interactive - STARTUP_BUDGET_MS:.1f} ms")
+            return 1
+        return 0
+
+
+startup_trace = StartupTrace()
+
+
 # --------------------------------------------------------------Lancement
-app = QApplication(sys.argv)
-splash = show_splash()
-window = IDE()
-QTimer.singleShot(2000, window.showMaximizedWindow)
-sys.exit(app.exec_())
\ No newline at end of file
+# Garde nécessaire : les processus de travail réimportent ce module
+if __name__ == "__main__":
+    startup_trace.mark("imports")
+    app = QApplication(sys.argv)
+
+    if "--benchmark-highlighter" in sys.argv:
+        benchmark_highlighters()
+        sys.exit(0)
+
+    if "--benchmark-gutter" in sys.argv:
+        benchmark_gutter()
+        sys.exit(0)
+
+    if "--benchmark-run" in sys.argv:
+        benchmark_run()
+        sys.exit(0)
+
+    if "--benchmark-tabs" in sys.argv:
+        benchmark_tabs()
+        sys.exit(0)
+
+    startup_trace.mark("QApplication")
+    splash = show_splash()
+    startup_trace.mark("splash")
+    window = IDE()
+    # Plus de délais fixes : le splash disparaît à la première image de la fenêtre
+    window.first_painted.connect(splash.close)
+    if "--no-session" not in sys.argv:
+        window.restore_session()
+        startup_trace.mark("session")
+    window.showMaximizedWindow()
+    startup_trace.mark("show")
+
+    if "--startup-trace" in sys.argv:
+        for argument in sys.argv:
+            if argument.startswith("--startup-budget="):
+                STARTUP_BUDGET_MS = int(argument.split("=", 1)[1])
+        window.interactive.connect(lambda: app.exit(startup_trace.report()))
+
+    sys.exit(app.exec_())
\ No newline at end of file
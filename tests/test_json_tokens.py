@@ -0,0 +1,47 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Codora-Studio.py")
+spec = importlib.util.spec_from_file_location("codora_studio", SCRIPT)
+codora = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(codora)
+
+VALID_DOCUMENTS = [
+    '[1, -2500.0, 3]',
+    '{"a": 1.5e+10, "b": [true, false, null], "c": -0.25E-3}',
+    '{"name": "caf\\u00e9 \\"quoted\\" \\\\ \\n", "empty": {}, "list": []}',
+    '[[1.0, [2e5, [3.25]]], {"x": {"y": {"z": 0}}}, -0, 12345678901234567890]',
+    '\n  {\n\t"key" : "value" ,\n  "number" : 6.02214076e23\n}\n',
+    '"just a string"',
+    '-1.5e-7',
+    '["é", "😀", "\\ud83d\\ude00"]',
+]
+
+
+# Toutes les coupures possibles entre deux morceaux, y compris au milieu d'un nombre
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+@pytest.mark.parametrize("document", VALID_DOCUMENTS)
+def test_valid_json_at_every_chunk_size(tmp_path, monkeypatch, document, chunk_size):
+    monkeypatch.setattr(codora, "JSON_READ_CHUNK", chunk_size)
+    path = tmp_path / "document.json"
+    path.write_text(document, encoding="utf-8")
+    expected = json.loads(document)
+
+    assert codora.validate_json(str(path)) is None
+    assert json.loads(codora.format_json(str(path))) == expected
+    assert json.loads(codora.format_json(str(path), indent=4)) == expected
+
+
+def test_number_cut_at_default_chunk_boundary(tmp_path):
+    # Le "." du nombre tombe sur le dernier octet du premier morceau
+    prefix = "[" + " " * (codora.JSON_READ_CHUNK - 3)
+    document = prefix + "1.5, 2]"
+    assert document.index(".") == codora.JSON_READ_CHUNK - 1
+    path = tmp_path / "document.json"
+    path.write_text(document, encoding="utf-8")
+
+    assert codora.validate_json(str(path)) is None
+    assert json.loads(codora.format_json(str(path))) == [1.5, 2]